@@ -3,12 +3,23 @@
 from __future__ import annotations
 
 import argparse
+import base64
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor
+import copy
 from dataclasses import dataclass
+from functools import cache, partial
+import hashlib
+from itertools import compress
 import json
+import operator
 import os
 from pathlib import Path
+import queue
+import sys
+import threading
 import time
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 from jr100emu.basic_loader import BasicLoader
 from jr100emu.jr100.computer import JR100Computer
@@ -24,10 +35,16 @@ from jr100emu.frontend.snapshot_db import (
     DEFAULT_SLOT,
     SNAPSHOT_DIR,
     SNAPSHOT_HISTORY_DIR,
+    SNAPSHOT_SUFFIX,
+    LEGACY_SNAPSHOT_SUFFIX,
+    decode_snapshot_payload,
+    encode_snapshot_payload,
 )
 
-# Mapping from pygame key constants to (row, bit) in the keyboard matrix.
 BASE_CAPTION = "JR-100 Emulator Demo"
+# Mapping from pygame key constants to (row, bit) in the keyboard matrix.
+# The matrix is updated from KEYDOWN/KEYUP events only (see _bind_key_handlers);
+# the frame loop never polls pygame.key.get_pressed().
 KEY_MATRIX_MAP: Dict[int, Tuple[int, int]] = {
     ord("c"): (0, 4),
     ord("x"): (0, 3),
@@ -80,20 +97,70 @@ KEY_MATRIX_MAP: Dict[int, Tuple[int, int]] = {
     46: (8, 0),  # '.'
 }
 
+# SDL2 keycodes are either character codes or a scancode tagged with this flag.
+_SCANCODE_KEY_FLAG = 0x40000000
+_KEY_TABLE_SIZE = 0x400
+_UNMAPPED_KEY = 0xFF
+
 STEP_CYCLES = 256
+# Devices (VIA timers and the IRQs they raise) only catch up between ticks, so a
+# running frame is executed in slices of this many cycles.
+FRAME_TIMESLICE = 512
+SNAPSHOT_PAGE_SIZE = 0x100
+_IMMUTABLE_STATE_TYPES = (int, float, bool, str, bytes, type(None))
+# Minimum seconds between per-frame window caption refreshes (at most 4 Hz).
+CAPTION_UPDATE_INTERVAL = 0.25
+# Seconds before the frame deadline at which pacing switches from sleeping to spinning.
+FRAME_BUSY_WAIT_MARGIN = 0.002
+# Consecutive frames whose presentation may be dropped while emulation catches up.
+MAX_FRAME_SKIP = 4
 SNAPSHOT_DIR = Path("snapshots")
 SNAPSHOT_SLOTS = ["slot0", "slot1", "slot2", "slot3"]
 DEFAULT_SLOT = SNAPSHOT_SLOTS[0]
 
+# Snapshot files are written by a single background worker so the frame loop never
+# blocks on disk I/O; readers call _wait_for_snapshot_writes() first.
+_snapshot_writer: Optional[ThreadPoolExecutor] = None
+_pending_snapshot_writes: List[Future] = []
+# Snapshot directories already created this session; mkdir runs once per path.
+_created_snapshot_dirs: set[str] = set()
+
+# Joystick caption text indexed by L|R<<1|U<<2|D<<3|S<<4; index -1 means no gamepad.
+_JOY_CAPTIONS = tuple(
+    "".join(name for bit, name in enumerate("LRUDS") if bits >> bit & 1) or "-"
+    for bits in range(32)
+) + ("off",)
+
+# JR100EMU_TRACE_PC_VRAM lines are handed to a writer thread so the frame loop never
+# blocks on stdout; when the queue is full, further lines are dropped. If stdout
+# fails (e.g. a closed pipe) the writer stops and later lines are discarded.
+TRACE_QUEUE_SIZE = 4096
+_trace_queue: Optional["queue.Queue[str]"] = None
+_trace_thread: Optional[threading.Thread] = None
+
+# Host font rasterized when no BASIC ROM supplies the character set.
+CHARACTER_ROM_FONT = "Courier"
+CHARACTER_ROM_FONT_SIZE = 12
+
+# Maps a pixel intensity byte to the ASCII digit of its bit ("0" unlit, "1" lit).
+_PIXEL_TO_BIT = bytes([0x30] + [0x31] * 255)
+
+
 @dataclass
 class Snapshot:
-    memory: List[int]
+    memory: bytes
     cpu_registers: dict
     cpu_flags: dict
     cpu_status: dict
     via_state: dict
     clock_count: int
 
+    def __post_init__(self) -> None:
+        # Memory is always held as contiguous bytes so diffs and restores can
+        # compare dumps with memcmp-speed slicing instead of walking int lists.
+        if type(self.memory) is not bytes:
+            self.memory = bytes(self.memory)
+
 
 def _generate_character_rom(
     display: JR100Display,
@@ -102,41 +169,99 @@ def _generate_character_rom(
 ) -> List[int]:
     if allow_background_events:
         os.environ.setdefault("SDL_JOYSTICK_ALLOW_BACKGROUND_EVENTS", "1")
+    rom_size = 256 * display.PPC
+    cache_key = hashlib.sha1(
+        f"{CHARACTER_ROM_FONT}:{CHARACTER_ROM_FONT_SIZE}:{display.PPC}".encode()
+    ).hexdigest()
+    cache_path = SNAPSHOT_DIR / f"charrom-{cache_key}.bin"
+    try:
+        cached = cache_path.read_bytes()
+    except OSError:
+        cached = b""
+    if len(cached) == rom_size:
+        return list(cached)
+
     import pygame  # type: ignore
 
     pygame.font.init()
-    font = pygame.font.SysFont("Courier", 12, bold=False)
-    rom: List[int] = [0x00] * (256 * display.PPC)
-    for code in range(32, 127):
-        char = chr(code)
-        glyph_surface = pygame.Surface((display.PPC, display.PPC))
-        glyph_surface.fill((0, 0, 0))
-        rendered = font.render(char, True, (255, 255, 255))
+    font = pygame.font.SysFont(CHARACTER_ROM_FONT, CHARACTER_ROM_FONT_SIZE, bold=False)
+    ppc = display.PPC
+    first, last = 32, 127
+    rom: List[int] = [0x00] * rom_size
+    # All glyphs go into one tall strip, each clipped to its own 8x8 cell, so the
+    # whole printable range is read back with a single tobytes() call.
+    strip = pygame.Surface((ppc, (last - first) * ppc))
+    strip.fill((0, 0, 0))
+    for code in range(first, last):
+        cell = pygame.Rect(0, (code - first) * ppc, ppc, ppc)
+        rendered = font.render(chr(code), True, (255, 255, 255))
         # Center glyph inside 8x8 box
         rect = rendered.get_rect()
-        rect.center = (display.PPC // 2, display.PPC // 2)
-        glyph_surface.blit(rendered, rect)
-        for line in range(display.PPC):
-            value = 0
-            for bit in range(display.PPC):
-                pixel = glyph_surface.get_at((bit, line))
-                if sum(pixel[:3]) > 0:
-                    value |= 1 << (7 - bit)
-            rom[code * display.PPC + line] = value
+        rect.center = cell.center
+        strip.set_clip(cell)
+        strip.blit(rendered, rect)
+    strip.set_clip(None)
+    # White text on black: the red channel alone tells lit pixels apart.
+    lit = pygame.image.tobytes(strip, "RGB")[0::3].translate(_PIXEL_TO_BIT)
+    for line in range((last - first) * ppc):
+        rom[first * ppc + line] = int(lit[line * ppc : (line + 1) * ppc], 2)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(bytes(rom))
+    except OSError:
+        pass
     return rom
 
 
+def _key_table_index(key: int) -> int:
+    """Fold a pygame keycode into ``_KEY_TO_ROWBIT``; -1 if it cannot be mapped."""
+
+    if key & _SCANCODE_KEY_FLAG:
+        return 0x200 | (key & 0x1FF)
+    if 0 <= key < 0x200:
+        return key
+    return -1
+
+
+def _build_key_table() -> array:
+    table = array("B", [_UNMAPPED_KEY]) * _KEY_TABLE_SIZE
+    for key, (row, bit) in KEY_MATRIX_MAP.items():
+        table[_key_table_index(key)] = (row << 4) | bit
+    return table
+
+
+def _bind_key_handlers(
+    keyboard: JR100Keyboard,
+) -> Tuple[List[Optional[Callable[[], None]]], List[Optional[Callable[[], None]]]]:
+    """Pre-bind ``keyboard.press``/``release`` per mapped key, indexed like _KEY_TO_ROWBIT."""
+
+    press_handlers: List[Optional[Callable[[], None]]] = [None] * _KEY_TABLE_SIZE
+    release_handlers: List[Optional[Callable[[], None]]] = [None] * _KEY_TABLE_SIZE
+    for key, (row, bit) in KEY_MATRIX_MAP.items():
+        index = _key_table_index(key)
+        press_handlers[index] = partial(keyboard.press, row, bit)
+        release_handlers[index] = partial(keyboard.release, row, bit)
+    return press_handlers, release_handlers
+
+
 def _handle_key_event(keyboard: JR100Keyboard, key: int, pressed: bool) -> None:
-    mapping = KEY_MATRIX_MAP.get(key)
-    if mapping is None:
+    index = _key_table_index(key)
+    if index < 0:
+        return
+    packed = _KEY_TO_ROWBIT[index]
+    if packed == _UNMAPPED_KEY:
         return
-    row, bit = mapping
+    row, bit = packed >> 4, packed & 0x0F
     if pressed:
         keyboard.press(row, bit)
     else:
         keyboard.release(row, bit)
 
 
+# Flat keycode -> (row << 4 | bit) byte table derived from KEY_MATRIX_MAP.
+_KEY_TO_ROWBIT = _build_key_table()
+
+
 def _pygame_loop(
     scale: int,
     fps: int,
@@ -188,6 +313,7 @@ def _pygame_loop(
         )
 
     keyboard = computer.hardware.keyboard
+    key_press_handlers, key_release_handlers = _bind_key_handlers(keyboard)
     sound_processor = computer.hardware.sound_processor
     overlay = DebugOverlay(computer)
     hex_viewer = HexViewer(computer)
@@ -197,6 +323,10 @@ def _pygame_loop(
         (display.WIDTH_CHARS * display.PPC * scale, display.HEIGHT_CHARS * display.PPC * scale)
     )
     pygame.display.set_caption(base_caption)
+    # Nothing reads pointer input; keep it out of the queue drained every frame.
+    pygame.event.set_blocked(
+        [pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL]
+    )
     clock = pygame.time.Clock()
 
     gamepad_device = getattr(computer, "gamepad", None)
@@ -224,6 +354,8 @@ def _pygame_loop(
     running = True
     debug_mode = False
     snapshot_slot = DEFAULT_SLOT
+    # One database for the whole session: set_slot/record_history/clear_slot keep its
+    # in-memory view (shared with the overlay's instance) current.
     snapshot_db = SnapshotDatabase()
     snapshot: Optional[Snapshot] = _read_snapshot_from_file(snapshot_slot)
     overlay.set_snapshot_available(snapshot is not None)
@@ -231,6 +363,77 @@ def _pygame_loop(
     slot_meta = snapshot_db.get(snapshot_slot)
     comment_buffer = slot_meta.comment if slot_meta else ""
     editing_comment = False
+    # The emulated screen is only re-rendered when the display reports a new frame,
+    # into a back buffer kept in the window's pixel format for cheap blits.
+    surface = pygame.Surface(screen.get_size()).convert()
+    display.render_pygame_surface_into(surface, scale)
+    presented_version = display.frame_version
+    # Screen areas re-rendered since the last present; a full flip is forced after
+    # anything else (debugger, menus) has drawn over the window.
+    dirty_rects: List[Tuple[int, int, int, int]] = []
+    full_present = True
+    window_caption = base_caption
+    caption_updated_at = 0.0
+    shown_joy_bits = -2
+    shown_joy_raw: Optional[int] = None
+    shown_base_caption = ""
+    shown_joy_caption = ""
+    cycles_per_frame = 0
+    full_slices = last_slice = 0
+    # Hot-path callables bound once; none of these objects are replaced while running
+    # (reset and snapshot restore mutate the CPU registers in place).
+    cpu_core = computer.cpu_core
+    registers = cpu_core.registers if cpu_core is not None else None
+    tick = computer.tick
+    record_execution = overlay.record_execution
+    render_into = display.render_pygame_surface_into
+    event_get = pygame.event.get
+    flip = pygame.display.flip
+    update_display = pygame.display.update
+    # The gamepad and extension port are fixed at construction; resolve them once.
+    gamepad_state = gamepad_device.current_state if gamepad_device is not None else None
+    ext_port = getattr(computer, "ext_port", None)
+    ext_gamepad_status = getattr(ext_port, "get_gamepad_status", None)
+    frame_interval = 1.0 / fps
+    next_frame_time = time.perf_counter() + frame_interval
+    skipped_frames = 0
+
+    def _set_window_caption(text: str, *, immediate: bool = True) -> bool:
+        # set_caption round-trips to the window manager; skip it when nothing changed
+        # and throttle the per-frame status updates. Returns whether ``text`` is shown.
+        nonlocal window_caption, caption_updated_at
+        if text == window_caption:
+            return True
+        now = time.perf_counter()
+        if not immediate and now - caption_updated_at < CAPTION_UPDATE_INTERVAL:
+            return False
+        pygame.display.set_caption(text)
+        window_caption = text
+        caption_updated_at = now
+        return True
+
+    def _compose_screen() -> None:
+        # Re-render the emulated screen if it changed, then draw it and any open
+        # menu into the window.
+        nonlocal presented_version
+        if display.frame_version != presented_version:
+            render_into(surface, scale)
+            presented_version = display.frame_version
+            dirty_rects.extend(display.get_dirty_rects(scale))
+        screen.blit(surface, (0, 0))
+
+        if file_menu.active:
+            file_menu.render(screen)
+        if hex_viewer.active:
+            hex_viewer.render(screen)
+
+    def _refresh_frame_budget() -> None:
+        # The clock frequency is fixed while running; only a reset can change it.
+        nonlocal cycles_per_frame, full_slices, last_slice
+        cycles_per_frame = max(int(computer.get_clock_frequency() / fps), 1000)
+        full_slices, last_slice = divmod(cycles_per_frame, FRAME_TIMESLICE)
+
+    _refresh_frame_budget()
 
     def _perform_reset() -> None:
         nonlocal base_caption, comment_buffer, debug_mode, editing_comment, program_info
@@ -245,14 +448,175 @@ def _pygame_loop(
         overlay.set_status("Resetting...")
         computer.reset()
         computer.tick(80_000)
+        _refresh_frame_budget()
         program_info = computer.program_info
         base_caption = _build_base_caption(program_info)
-        pygame.display.set_caption(base_caption)
+        _set_window_caption(base_caption)
         overlay.capture_state()
         overlay.set_status("Reset complete")
 
+    def _debug_resume(key: int) -> None:
+        nonlocal debug_mode, editing_comment
+        debug_mode = False
+        overlay.set_status("Resumed")
+        _set_window_caption(base_caption)
+        editing_comment = False
+
+    def _debug_step(key: int) -> None:
+        _execute_step(computer, overlay)
+        overlay.set_status("Stepped")
+        overlay.capture_state()
+
+    def _debug_save_snapshot(key: int) -> None:
+        nonlocal snapshot, comment_buffer
+        snapshot = _take_snapshot(computer)
+        overlay.set_snapshot_available(snapshot is not None)
+        overlay.set_status("Snapshot saved" if snapshot else "Snapshot failed")
+        if snapshot is not None:
+            if not comment_buffer:
+                comment_buffer = "Snapshot"
+            data = _write_snapshot_to_file(snapshot_slot, snapshot, comment=comment_buffer)
+            history_path = _write_history_snapshot(snapshot_slot, data)
+            snapshot_db.set_slot(snapshot_slot, comment=comment_buffer)
+            snapshot_db.record_history(data, history_path)
+            overlay.update_metadata(snapshot_slot, comment_buffer)
+            overlay.clear_preview()
+        overlay.capture_state()
+
+    def _debug_restore_snapshot(key: int) -> None:
+        nonlocal snapshot, comment_buffer
+        if snapshot is not None:
+            _restore_snapshot(computer, snapshot)
+            overlay.set_status("Snapshot restored")
+            overlay.capture_state()
+            return
+        loaded = _read_snapshot_from_file(snapshot_slot)
+        if loaded is None:
+            overlay.set_status("No snapshot")
+            return
+        snapshot = loaded
+        _restore_snapshot(computer, snapshot)
+        overlay.set_snapshot_available(True)
+        slot_meta = snapshot_db.get(snapshot_slot)
+        comment_buffer = slot_meta.comment if slot_meta else comment_buffer
+        overlay.update_metadata(snapshot_slot, comment_buffer)
+        overlay.set_status("Snapshot restored (file)")
+        overlay.clear_preview()
+        overlay.capture_state()
+
+    def _debug_edit_comment(key: int) -> None:
+        nonlocal comment_buffer, editing_comment
+        if snapshot is None and _read_snapshot_from_file(snapshot_slot) is None:
+            overlay.set_status("No snapshot to comment")
+            return
+        slot_meta = snapshot_db.get(snapshot_slot)
+        comment_buffer = slot_meta.comment if slot_meta else comment_buffer
+        overlay.set_status(f"Editing comment: {comment_buffer}")
+        overlay.set_comment_buffer(comment_buffer)
+        editing_comment = True
+
+    def _debug_select_history(key: int) -> None:
+        direction = -1 if key == pygame.K_LEFTBRACKET else 1
+        entry = overlay.move_history(direction)
+        overlay.clear_preview()
+        if entry is not None:
+            overlay.set_status(f"History selected: {entry.slot} {entry.format_timestamp()}")
+        else:
+            overlay.set_status("No history")
+
+    def _debug_preview_history(key: int) -> None:
+        entry = overlay.current_history_entry()
+        if entry is None:
+            overlay.set_status("No history to preview")
+            return
+        preview_snapshot = _read_snapshot_path(entry.path)
+        if preview_snapshot is None:
+            overlay.set_status("History snapshot unreadable")
+            return
+        current_snapshot = _snapshot_current_state(computer)
+        overlay.set_preview_lines(_make_preview_lines(entry, preview_snapshot, current_snapshot))
+        overlay.set_status("History preview")
+
+    def _debug_load_history(key: int) -> None:
+        nonlocal snapshot, snapshot_slot, comment_buffer
+        entry = overlay.current_history_entry()
+        if entry is None:
+            overlay.set_status("No history to load")
+            return
+        restored = _read_snapshot_path(entry.path)
+        if restored is None:
+            overlay.set_status("History snapshot unreadable")
+            return
+        _restore_snapshot(computer, restored)
+        data = _snapshot_to_dict(entry.slot, restored, entry.comment, entry.timestamp)
+        _write_snapshot_to_file(entry.slot, restored, comment=entry.comment, timestamp=entry.timestamp)
+        history_path = _write_history_snapshot(entry.slot, data)
+        snapshot_db.set_slot(entry.slot, comment=entry.comment)
+        snapshot_db.record_history(data, history_path)
+        snapshot_slot = entry.slot
+        snapshot = restored
+        comment_buffer = entry.comment
+        overlay.set_slot_name(snapshot_slot)
+        overlay.update_metadata(snapshot_slot, comment_buffer)
+        overlay.set_snapshot_available(True)
+        overlay.clear_preview()
+        overlay.set_status("History snapshot loaded")
+
+    def _debug_switch_slot(slot: str) -> None:
+        nonlocal snapshot, snapshot_slot, comment_buffer
+        snapshot_slot = slot
+        overlay.set_slot_name(snapshot_slot)
+        snapshot = _read_snapshot_from_file(snapshot_slot)
+        overlay.set_snapshot_available(snapshot is not None)
+        slot_meta = snapshot_db.get(snapshot_slot)
+        comment_buffer = slot_meta.comment if slot_meta else ""
+        overlay.update_metadata(snapshot_slot, comment_buffer or "")
+        overlay.set_status(f"Slot switched to {snapshot_slot}")
+        overlay.set_comment_buffer(None)
+        overlay.capture_state()
+
+    def _debug_move_slot(key: int) -> None:
+        _debug_switch_slot(overlay.move_selection(-1 if key == pygame.K_UP else 1))
+
+    def _debug_pick_slot(key: int) -> None:
+        index = key - pygame.K_1
+        if 0 <= index < len(SNAPSHOT_SLOTS):
+            _debug_switch_slot(SNAPSHOT_SLOTS[index])
+
+    def _debug_delete_snapshot(key: int) -> None:
+        nonlocal snapshot, comment_buffer
+        _delete_snapshot_files(snapshot_slot)
+        snapshot_db.clear_slot(snapshot_slot)
+        snapshot = None
+        comment_buffer = ""
+        overlay.set_snapshot_available(False)
+        overlay.set_slot_name(snapshot_slot)
+        overlay.set_status("Snapshot deleted")
+        overlay.set_comment_buffer(None)
+        overlay.capture_state()
+
+    # Debugger commands, dispatched by key once comment editing has had its turn.
+    debug_key_handlers: Dict[int, Callable[[int], None]] = {
+        pygame.K_SPACE: _debug_resume,
+        pygame.K_n: _debug_step,
+        pygame.K_s: _debug_save_snapshot,
+        pygame.K_r: _debug_restore_snapshot,
+        pygame.K_c: _debug_edit_comment,
+        pygame.K_LEFTBRACKET: _debug_select_history,
+        pygame.K_RIGHTBRACKET: _debug_select_history,
+        pygame.K_p: _debug_preview_history,
+        pygame.K_l: _debug_load_history,
+        pygame.K_UP: _debug_move_slot,
+        pygame.K_DOWN: _debug_move_slot,
+        pygame.K_1: _debug_pick_slot,
+        pygame.K_2: _debug_pick_slot,
+        pygame.K_3: _debug_pick_slot,
+        pygame.K_4: _debug_pick_slot,
+        pygame.K_d: _debug_delete_snapshot,
+    }
+
     while running:
-        for event in pygame.event.get():
+        for event in event_get():
             if event.type == pygame.QUIT:
                 running = False
                 continue
@@ -305,7 +669,7 @@ def _pygame_loop(
                         comment_buffer = slot_meta.comment if slot_meta else comment_buffer
                         overlay.set_comment_buffer(None)
                     else:
-                        pygame.display.set_caption(base_caption)
+                        _set_window_caption(base_caption)
                         overlay.set_status("")
                         editing_comment = False
                         overlay.set_comment_buffer(None)
@@ -322,7 +686,6 @@ def _pygame_loop(
                             continue
                         if event.key == pygame.K_RETURN:
                             snapshot_db.set_slot(snapshot_slot, comment=comment_buffer)
-                            snapshot_db = SnapshotDatabase()
                             if snapshot is not None:
                                 _write_snapshot_to_file(snapshot_slot, snapshot, comment=comment_buffer)
                             overlay.update_metadata(snapshot_slot, comment_buffer)
@@ -343,163 +706,27 @@ def _pygame_loop(
                                 overlay.set_status(f"Editing comment: {comment_buffer}")
                                 overlay.set_comment_buffer(comment_buffer)
                         continue
-                    if event.key == pygame.K_SPACE:
-                        debug_mode = False
-                        overlay.set_status("Resumed")
-                        pygame.display.set_caption(base_caption)
-                        editing_comment = False
-                        continue
-                    if event.key == pygame.K_n:
-                        _execute_step(computer, overlay)
-                        overlay.set_status("Stepped")
-                        overlay.capture_state()
-                        continue
-                    if event.key == pygame.K_s:
-                        snapshot = _take_snapshot(computer)
-                        overlay.set_snapshot_available(snapshot is not None)
-                        overlay.set_status("Snapshot saved" if snapshot else "Snapshot failed")
-                        if snapshot is not None:
-                            if not comment_buffer:
-                                comment_buffer = "Snapshot"
-                            data = _write_snapshot_to_file(snapshot_slot, snapshot, comment=comment_buffer)
-                            history_path = _write_history_snapshot(snapshot_slot, data)
-                            snapshot_db.set_slot(snapshot_slot, comment=comment_buffer)
-                            snapshot_db.record_history(data, history_path)
-                            snapshot_db = SnapshotDatabase()
-                            overlay.update_metadata(snapshot_slot, comment_buffer)
-                            overlay.clear_preview()
-                        overlay.capture_state()
-                        continue
-                    if event.key == pygame.K_r:
-                        if snapshot is not None:
-                            _restore_snapshot(computer, snapshot)
-                            overlay.set_status("Snapshot restored")
-                            overlay.capture_state()
-                        else:
-                            loaded = _read_snapshot_from_file(snapshot_slot)
-                            if loaded is not None:
-                                snapshot = loaded
-                                _restore_snapshot(computer, snapshot)
-                                overlay.set_snapshot_available(True)
-                                slot_meta = snapshot_db.get(snapshot_slot)
-                                comment_buffer = slot_meta.comment if slot_meta else comment_buffer
-                                overlay.update_metadata(snapshot_slot, comment_buffer)
-                                overlay.set_status("Snapshot restored (file)")
-                                overlay.clear_preview()
-                                overlay.capture_state()
-                            else:
-                                overlay.set_status("No snapshot")
-                        continue
-                    if event.key == pygame.K_c:
-                        if snapshot is None and _read_snapshot_from_file(snapshot_slot) is None:
-                            overlay.set_status("No snapshot to comment")
-                        else:
-                            slot_meta = snapshot_db.get(snapshot_slot)
-                            comment_buffer = slot_meta.comment if slot_meta else comment_buffer
-                            overlay.set_status(f"Editing comment: {comment_buffer}")
-                            overlay.set_comment_buffer(comment_buffer)
-                            editing_comment = True
-                        continue
-                    if event.key in (pygame.K_LEFTBRACKET, pygame.K_RIGHTBRACKET):
-                        direction = -1 if event.key == pygame.K_LEFTBRACKET else 1
-                        entry = overlay.move_history(direction)
-                        snapshot_db = SnapshotDatabase()
-                        overlay.clear_preview()
-                        if entry is not None:
-                            overlay.set_status(f"History selected: {entry.slot} {entry.format_timestamp()}")
-                        else:
-                            overlay.set_status("No history")
-                        continue
-                    if event.key == pygame.K_p:
-                        entry = overlay.current_history_entry()
-                        if entry is None:
-                            overlay.set_status("No history to preview")
-                        else:
-                            preview_snapshot = _read_snapshot_path(entry.path)
-                            if preview_snapshot is None:
-                                overlay.set_status("History snapshot unreadable")
-                            else:
-                                current_snapshot = _snapshot_current_state(computer)
-                                overlay.set_preview_lines(
-                                    _make_preview_lines(entry, preview_snapshot, current_snapshot)
-                                )
-                                overlay.set_status("History preview")
-                        continue
-                    if event.key == pygame.K_l:
-                        entry = overlay.current_history_entry()
-                        if entry is None:
-                            overlay.set_status("No history to load")
-                        else:
-                            restored = _read_snapshot_path(entry.path)
-                            if restored is None:
-                                overlay.set_status("History snapshot unreadable")
-                            else:
-                                _restore_snapshot(computer, restored)
-                                data = _snapshot_to_dict(entry.slot, restored, entry.comment, entry.timestamp)
-                                _write_snapshot_to_file(entry.slot, restored, comment=entry.comment, timestamp=entry.timestamp)
-                                history_path = _write_history_snapshot(entry.slot, data)
-                                snapshot_db.set_slot(entry.slot, comment=entry.comment)
-                                snapshot_db.record_history(data, history_path)
-                                snapshot_db = SnapshotDatabase()
-                                snapshot_slot = entry.slot
-                                snapshot = restored
-                                comment_buffer = entry.comment
-                                overlay.set_slot_name(snapshot_slot)
-                                overlay.update_metadata(snapshot_slot, comment_buffer)
-                                overlay.set_snapshot_available(True)
-                                overlay.clear_preview()
-                                overlay.set_status("History snapshot loaded")
-                        continue
-                    if event.key in (pygame.K_UP, pygame.K_DOWN):
-                        direction = -1 if event.key == pygame.K_UP else 1
-                        snapshot_slot = overlay.move_selection(direction)
-                        snapshot_db = SnapshotDatabase()
-                        snapshot = _read_snapshot_from_file(snapshot_slot)
-                        overlay.set_snapshot_available(snapshot is not None)
-                        slot_meta = snapshot_db.get(snapshot_slot)
-                        comment_buffer = slot_meta.comment if slot_meta else ""
-                        overlay.update_metadata(snapshot_slot, comment_buffer or "")
-                        overlay.set_status(f"Slot switched to {snapshot_slot}")
-                        overlay.set_comment_buffer(None)
-                        overlay.capture_state()
-                        continue
-                    if event.key in (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4):
-                        index = event.key - pygame.K_1
-                        if 0 <= index < len(SNAPSHOT_SLOTS):
-                            snapshot_slot = SNAPSHOT_SLOTS[index]
-                            overlay.set_slot_name(snapshot_slot)
-                            snapshot_db = SnapshotDatabase()
-                            loaded = _read_snapshot_from_file(snapshot_slot)
-                            snapshot = loaded
-                            overlay.set_snapshot_available(snapshot is not None)
-                            slot_meta = snapshot_db.get(snapshot_slot)
-                            comment_buffer = slot_meta.comment if slot_meta else ""
-                            overlay.update_metadata(snapshot_slot, comment_buffer or "")
-                            overlay.set_status(f"Slot switched to {snapshot_slot}")
-                            overlay.set_comment_buffer(None)
-                            overlay.capture_state()
-                        continue
-                    if event.key == pygame.K_d:
-                        _delete_snapshot_files(snapshot_slot)
-                        snapshot_db.clear_slot(snapshot_slot)
-                        snapshot_db = SnapshotDatabase()
-                        snapshot = None
-                        comment_buffer = ""
-                        overlay.set_snapshot_available(False)
-                        overlay.set_slot_name(snapshot_slot)
-                        overlay.set_status("Snapshot deleted")
-                        overlay.set_comment_buffer(None)
-                        overlay.capture_state()
-                        continue
+                    debug_handler = debug_key_handlers.get(event.key)
+                    if debug_handler is not None:
+                        debug_handler(event.key)
+                    continue
                 else:
-                    _handle_key_event(keyboard, event.key, True)
+                    index = _key_table_index(event.key)
+                    if index >= 0:
+                        handler = key_press_handlers[index]
+                        if handler is not None:
+                            handler()
             elif (
                 event.type == pygame.KEYUP
                 and not debug_mode
                 and not file_menu.active
                 and not hex_viewer.active
             ):
-                _handle_key_event(keyboard, event.key, False)
+                index = _key_table_index(event.key)
+                if index >= 0:
+                    handler = key_release_handlers[index]
+                    if handler is not None:
+                        handler()
 
         if loader.pending:
             previous_info = program_info
@@ -520,89 +747,158 @@ def _pygame_loop(
                     base_caption = _build_base_caption(program_info)
                     overlay.set_status("Program cleared")
 
-        surface = display.render_pygame_surface(scale)
-        screen.blit(surface, (0, 0))
-
-        if file_menu.active:
-            file_menu.render(screen)
-        if hex_viewer.active:
-            hex_viewer.render(screen)
-
         if debug_mode:
+            _compose_screen()
             overlay.render(screen)
-            pygame.display.flip()
+            flip()
+            full_present = True
             clock.tick(fps)
+            next_frame_time = time.perf_counter() + frame_interval
             continue
 
-        joy_caption = "off"
+        joy_bits = -1
         joy_raw = None
-        gamepad = getattr(computer, "gamepad", None)
-        ext_port = getattr(computer, "ext_port", None)
-        if gamepad is not None:
-            state = gamepad.current_state()
-            active: List[str] = []
-            if state.left:
-                active.append("L")
-            if state.right:
-                active.append("R")
-            if state.up:
-                active.append("U")
-            if state.down:
-                active.append("D")
-            if state.switch:
-                active.append("S")
-            joy_caption = "".join(active) if active else "-"
-        if ext_port is not None and hasattr(ext_port, "get_gamepad_status"):
-            joy_raw = ext_port.get_gamepad_status()
-
-        caption = f"{base_caption} | Joy: {joy_caption}"
-        if joy_raw is not None:
-            caption += f" ({joy_raw:02X})"
-        pygame.display.set_caption(caption)
-
-        cycles_per_frame = max(int(computer.get_clock_frequency() / fps), 1000)
-        executed = 0
-        timeslice = 512
-        while executed < cycles_per_frame:
-            step = min(timeslice, cycles_per_frame - executed)
-            computer.tick(step)
-            executed += step
-            if computer.cpu_core is not None:
-                pc_value = computer.cpu_core.registers.program_counter
-                overlay.record_execution(pc_value)
-                if trace_pc_vram:
-                    if pc_value >= 0xC000:
-                        status = computer.cpu_core.status
-                        via = getattr(computer, "via", None)
-                        if via is not None:
-                            ifr = getattr(via, "_state").IFR
-                            ier = getattr(via, "_state").IER
-                        else:
-                            ifr = ier = -1
-                        print(
-                            f"TRACE-PC pc={pc_value:04X} wai={int(status.fetch_wai)} "
-                            f"irq_req={int(status.irq_requested)} IF R={ifr:02X} IER={ier:02X} "
-                            f"clock={computer.clock_count}",
-                            flush=True,
-                        )
+        if gamepad_state is not None:
+            state = gamepad_state()
+            joy_bits = (
+                state.left
+                | state.right << 1
+                | state.up << 2
+                | state.down << 3
+                | state.switch << 4
+            )
+        if ext_gamepad_status is not None:
+            joy_raw = ext_gamepad_status()
+
+        # The caption string is only rebuilt when the joystick state or program changes,
+        # or when another caption replaced it; the checks are scalar and identity
+        # compares so an idle frame allocates nothing here.
+        if (
+            joy_bits != shown_joy_bits
+            or joy_raw != shown_joy_raw
+            or base_caption is not shown_base_caption
+            or window_caption is not shown_joy_caption
+        ):
+            caption = f"{base_caption} | Joy: {_JOY_CAPTIONS[joy_bits]}"
+            if joy_raw is not None:
+                caption += f" ({joy_raw:02X})"
+            if _set_window_caption(caption, immediate=False):
+                shown_joy_bits = joy_bits
+                shown_joy_raw = joy_raw
+                shown_base_caption = base_caption
+                shown_joy_caption = window_caption
+
+        if not trace_pc_vram or cpu_core is None:
+            # The PC is only sampled once per frame here, so the slices run back to back.
+            for _ in range(full_slices):
+                tick(FRAME_TIMESLICE)
+            if last_slice:
+                tick(last_slice)
+            if registers is not None:
+                record_execution(registers.program_counter)
+        else:
+            executed = 0
+            while executed < cycles_per_frame:
+                step = min(FRAME_TIMESLICE, cycles_per_frame - executed)
+                tick(step)
+                executed += step
+                pc_value = registers.program_counter
+                record_execution(pc_value)
+                if pc_value >= 0xC000:
+                    status = cpu_core.status
+                    via = getattr(computer, "via", None)
+                    if via is not None:
+                        ifr = getattr(via, "_state").IFR
+                        ier = getattr(via, "_state").IER
                     else:
-                        via = getattr(computer, "via", None)
-                        if via is not None:
-                            state = getattr(via, "_state")
-                            if state.IER == 0 and state.IFR != 0:
-                                status = computer.cpu_core.status
-                                print(
-                                    f"TRACE-IFR pc={pc_value:04X} wai={int(status.fetch_wai)} "
-                                    f"IFR={state.IFR:02X} clock={computer.clock_count}",
-                                    flush=True,
-                                )
-        overlay.capture_state()
-
-        pygame.display.flip()
-        clock.tick(fps)
+                        ifr = ier = -1
+                    _emit_trace(
+                        f"TRACE-PC pc={pc_value:04X} wai={int(status.fetch_wai)} "
+                        f"irq_req={int(status.irq_requested)} IF R={ifr:02X} IER={ier:02X} "
+                        f"clock={computer.clock_count}"
+                    )
+                else:
+                    via = getattr(computer, "via", None)
+                    if via is not None:
+                        state = getattr(via, "_state")
+                        if state.IER == 0 and state.IFR != 0:
+                            status = cpu_core.status
+                            _emit_trace(
+                                f"TRACE-IFR pc={pc_value:04X} wai={int(status.fetch_wai)} "
+                                f"IFR={state.IFR:02X} clock={computer.clock_count}"
+                            )
+        if time.perf_counter() > next_frame_time and skipped_frames < MAX_FRAME_SKIP:
+            # Behind real time: keep the CPU running but drop this frame's render and
+            # presentation.
+            skipped_frames += 1
+            next_frame_time += frame_interval
+            continue
+        skipped_frames = 0
+        # Composed after the CPU ran so the presented frame matches its state.
+        _compose_screen()
+
+        # The overlay is only drawn in debug mode, and entering it (ESC) or any
+        # debugger action captures fresh state; nothing is captured per frame.
+        if full_present or file_menu.active or hex_viewer.active:
+            # Menus draw over the whole window; present it all, and once more after
+            # they close so the emulated screen fully replaces them.
+            flip()
+            full_present = file_menu.active or hex_viewer.active
+        elif dirty_rects:
+            update_display(dirty_rects)
+        dirty_rects.clear()
+        # Sleep through most of the spare time, then let the busy-wait tick land the
+        # frame precisely; debug mode keeps the cheaper sleeping tick.
+        spare = next_frame_time - time.perf_counter() - FRAME_BUSY_WAIT_MARGIN
+        if spare > 0:
+            time.sleep(spare)
+        clock.tick_busy_loop(fps)
+        next_frame_time = time.perf_counter() + frame_interval
 
     sound_processor.close()
     pygame.quit()
+    _shutdown_snapshot_writer()
+    _flush_trace_output()
+
+
+def _trace_writer(lines: "queue.Queue[str]") -> None:
+    while True:
+        line = lines.get()
+        try:
+            sys.stdout.write(line)
+            sys.stdout.flush()
+        except (OSError, ValueError):
+            # stdout is gone; release anything still queued so joins return.
+            while True:
+                try:
+                    lines.get_nowait()
+                except queue.Empty:
+                    break
+                lines.task_done()
+            return
+        finally:
+            lines.task_done()
+
+
+def _emit_trace(line: str) -> None:
+    global _trace_queue, _trace_thread
+    if _trace_queue is None:
+        _trace_queue = queue.Queue(maxsize=TRACE_QUEUE_SIZE)
+        _trace_thread = threading.Thread(
+            target=_trace_writer, args=(_trace_queue,), name="trace-writer", daemon=True
+        )
+        _trace_thread.start()
+    elif _trace_thread is not None and not _trace_thread.is_alive():
+        return
+    try:
+        _trace_queue.put_nowait(line + "\n")
+    except queue.Full:
+        pass
+
+
+def _flush_trace_output() -> None:
+    if _trace_queue is not None and _trace_thread is not None and _trace_thread.is_alive():
+        _trace_queue.join()
 
 
 def _execute_step(computer: JR100Computer, overlay: DebugOverlay) -> None:
@@ -611,13 +907,55 @@ def _execute_step(computer: JR100Computer, overlay: DebugOverlay) -> None:
         overlay.record_execution(computer.cpu_core.registers.program_counter)
 
 
+def _dump_memory(memory) -> bytes:
+    load_block = getattr(memory, "load_block", None)
+    if load_block is not None:
+        return load_block(0, 0x10000)
+    buffer = bytearray(0x10000)
+    load8 = memory.load8
+    for addr in range(0x10000):
+        buffer[addr] = load8(addr) & 0xFF
+    return bytes(buffer)
+
+
+def _copy_state_fields(fields: dict) -> dict:
+    """Copy device state fields, deep-copying only if a value is mutable."""
+
+    if all(isinstance(value, _IMMUTABLE_STATE_TYPES) for value in fields.values()):
+        return dict(fields)
+    return copy.deepcopy(fields)
+
+
+def _dirty_pages(current: bytes, target: bytes) -> List[int]:
+    """Return the start addresses of snapshot pages whose contents differ."""
+
+    return [
+        start
+        for start in range(0, len(target), SNAPSHOT_PAGE_SIZE)
+        if current[start : start + SNAPSHOT_PAGE_SIZE] != target[start : start + SNAPSHOT_PAGE_SIZE]
+    ]
+
+
+def _dirty_ranges(current: bytes, target: bytes) -> List[Tuple[int, int]]:
+    """Merge adjacent dirty pages into ``(start, end_exclusive)`` ranges."""
+
+    ranges: List[Tuple[int, int]] = []
+    for start in _dirty_pages(current, target):
+        end = min(start + SNAPSHOT_PAGE_SIZE, len(target))
+        if ranges and ranges[-1][1] == start:
+            ranges[-1] = (ranges[-1][0], end)
+        else:
+            ranges.append((start, end))
+    return ranges
+
+
 def _take_snapshot(computer: JR100Computer) -> Optional[Snapshot]:
     cpu = computer.cpu_core
     via = computer.via
     memory = computer.memory
     if cpu is None or via is None or memory is None:
         return None
-    memory_dump = [memory.load8(addr) & 0xFF for addr in range(0x10000)]
+    memory_dump = _dump_memory(memory)
     cpu_regs = cpu.registers
     cpu_flags = cpu.flags
     cpu_status = cpu.status
@@ -647,7 +985,7 @@ def _take_snapshot(computer: JR100Computer) -> Optional[Snapshot]:
             halt_processed=cpu_status.halt_processed,
             fetch_wai=cpu_status.fetch_wai,
         ),
-        via_state=dict(via_state.__dict__),
+        via_state=_copy_state_fields(via_state.__dict__),
         clock_count=computer.clock_count,
     )
     return snapshot
@@ -663,26 +1001,48 @@ def _restore_snapshot(computer: JR100Computer, snapshot: Snapshot) -> None:
     memory = computer.memory
     if cpu is None or via is None or memory is None:
         return
-    for addr, value in enumerate(snapshot.memory):
-        memory.store8(addr, value)
-
+    # Only pages that changed since the snapshot are written back, so untouched
+    # I/O pages (VIA registers, VRAM) see no spurious stores.
+    target = snapshot.memory
+    if not isinstance(target, bytes):
+        target = bytes(target)
+    store_block = getattr(memory, "store_block", None)
+    for start, end in _dirty_ranges(_dump_memory(memory), target):
+        block = target[start:end]
+        if store_block is not None:
+            store_block(start, block)
+        else:
+            for offset, value in enumerate(block):
+                memory.store8(start + offset, value)
+
+    # Fields are copied one by one; _take_snapshot always records the full set.
     regs = cpu.registers
-    regs.acc_a = snapshot.cpu_registers["acc_a"]
-    regs.acc_b = snapshot.cpu_registers["acc_b"]
-    regs.index = snapshot.cpu_registers["index"]
-    regs.stack_pointer = snapshot.cpu_registers["stack_pointer"]
-    regs.program_counter = snapshot.cpu_registers["program_counter"]
+    saved_regs = snapshot.cpu_registers
+    regs.acc_a = saved_regs["acc_a"]
+    regs.acc_b = saved_regs["acc_b"]
+    regs.index = saved_regs["index"]
+    regs.stack_pointer = saved_regs["stack_pointer"]
+    regs.program_counter = saved_regs["program_counter"]
 
     flags = cpu.flags
-    for key, value in snapshot.cpu_flags.items():
-        setattr(flags, key, value)
+    saved_flags = snapshot.cpu_flags
+    flags.carry_h = saved_flags["carry_h"]
+    flags.carry_i = saved_flags["carry_i"]
+    flags.carry_n = saved_flags["carry_n"]
+    flags.carry_z = saved_flags["carry_z"]
+    flags.carry_v = saved_flags["carry_v"]
+    flags.carry_c = saved_flags["carry_c"]
 
     status = cpu.status
-    for key, value in snapshot.cpu_status.items():
-        setattr(status, key, value)
+    saved_status = snapshot.cpu_status
+    status.reset_requested = saved_status["reset_requested"]
+    status.nmi_requested = saved_status["nmi_requested"]
+    status.irq_requested = saved_status["irq_requested"]
+    status.halt_requested = saved_status["halt_requested"]
+    status.halt_processed = saved_status["halt_processed"]
+    status.fetch_wai = saved_status["fetch_wai"]
 
-    for key, value in snapshot.via_state.items():
-        setattr(via._state, key, value)
+    via._state.__dict__.update(_copy_state_fields(snapshot.via_state))
 
     computer.clock_count = snapshot.clock_count
 
@@ -702,8 +1062,13 @@ def _snapshot_to_dict(slot: str, snapshot: Snapshot, comment: str, timestamp: Op
 
 
 def _snapshot_from_dict(data: dict) -> Snapshot:
+    memory = data.get("memory", b"")
+    # Binary snapshots already carry bytes and are used as-is; legacy JSON snapshots
+    # store the dump as base64 text or a list of ints.
+    if isinstance(memory, str):
+        memory = base64.b64decode(memory)
     return Snapshot(
-        memory=list(data.get("memory", [])),
+        memory=memory,
         cpu_registers=dict(data.get("cpu_registers", {})),
         cpu_flags=dict(data.get("cpu_flags", {})),
         cpu_status=dict(data.get("cpu_status", {})),
@@ -712,46 +1077,121 @@ def _snapshot_from_dict(data: dict) -> Snapshot:
     )
 
 
+def _ensure_snapshot_dir(path: Path) -> None:
+    key = os.path.abspath(path)
+    if key not in _created_snapshot_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _created_snapshot_dirs.add(key)
+
+
 def _write_snapshot_to_file(slot: str, snapshot: Snapshot, *, comment: str = "", timestamp: Optional[float] = None) -> dict:
-    SNAPSHOT_DIR.mkdir(parents=True, exist_ok=True)
+    _ensure_snapshot_dir(SNAPSHOT_DIR)
     data = _snapshot_to_dict(slot, snapshot, comment, timestamp)
-    path = SNAPSHOT_DIR / f"{slot}.json"
-    path.write_text(json.dumps(data))
+    path = SNAPSHOT_DIR / f"{slot}{SNAPSHOT_SUFFIX}"
+    _submit_snapshot_write(path, data)
     return data
 
 
 def _write_history_snapshot(slot: str, data: dict) -> Path:
-    SNAPSHOT_HISTORY_DIR.mkdir(parents=True, exist_ok=True)
+    _ensure_snapshot_dir(SNAPSHOT_HISTORY_DIR)
     timestamp = data.get("timestamp", time.time())
-    history_path = SNAPSHOT_HISTORY_DIR / f"{slot}-{int(timestamp * 1000)}.json"
-    history_path.write_text(json.dumps(data))
+    history_path = SNAPSHOT_HISTORY_DIR / f"{slot}-{int(timestamp * 1000)}{SNAPSHOT_SUFFIX}"
+    _submit_snapshot_write(history_path, data)
     return history_path
 
 
+def _store_snapshot_payload(path: Path, payload: bytes) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, path)
+
+
+def _submit_snapshot_write(path: Path, data: dict) -> None:
+    global _snapshot_writer
+    # Encode on the caller's thread so later changes to ``data`` (or the snapshot
+    # dicts it shares) cannot race the writer; only the file I/O is deferred.
+    payload = encode_snapshot_payload(data)
+    if _snapshot_writer is None:
+        _snapshot_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="snapshot-writer")
+    _pending_snapshot_writes.append(_snapshot_writer.submit(_store_snapshot_payload, path, payload))
+
+
+def _wait_for_snapshot_writes() -> None:
+    while _pending_snapshot_writes:
+        future = _pending_snapshot_writes.pop(0)
+        try:
+            future.result()
+        except OSError as exc:
+            print(f"スナップショットの書き込みに失敗しました: {exc}")
+
+
+def _shutdown_snapshot_writer() -> None:
+    global _snapshot_writer
+    _wait_for_snapshot_writes()
+    if _snapshot_writer is not None:
+        _snapshot_writer.shutdown(wait=True)
+        _snapshot_writer = None
+
+
 def _read_snapshot_from_file(slot: str) -> Optional[Snapshot]:
-    path = SNAPSHOT_DIR / f"{slot}.json"
+    _wait_for_snapshot_writes()
+    path = SNAPSHOT_DIR / f"{slot}{SNAPSHOT_SUFFIX}"
+    if not path.exists():
+        path = SNAPSHOT_DIR / f"{slot}{LEGACY_SNAPSHOT_SUFFIX}"
     return _read_snapshot_path(path)
 
 
 def _read_snapshot_path(path: Path) -> Optional[Snapshot]:
+    _wait_for_snapshot_writes()
     if not path.exists():
         return None
     try:
-        data = json.loads(path.read_text())
-    except json.JSONDecodeError:
+        data = decode_snapshot_payload(path.read_bytes())
+    except ValueError:
         return None
     return _snapshot_from_dict(data)
 
 
 def _delete_snapshot_files(slot: str) -> None:
-    json_path = SNAPSHOT_DIR / f"{slot}.json"
-    meta_path = SNAPSHOT_DIR / f"{slot}.meta.json"
-    for path in (json_path, meta_path):
-        if path.exists():
-            path.unlink()
-    if SNAPSHOT_HISTORY_DIR.exists():
-        for path in SNAPSHOT_HISTORY_DIR.glob(f"{slot}-*.json"):
-            path.unlink()
+    _wait_for_snapshot_writes()
+    for suffix in (SNAPSHOT_SUFFIX, LEGACY_SNAPSHOT_SUFFIX, ".meta.json"):
+        (SNAPSHOT_DIR / f"{slot}{suffix}").unlink(missing_ok=True)
+    prefix = f"{slot}-"
+    try:
+        entries = os.scandir(SNAPSHOT_HISTORY_DIR)
+    except FileNotFoundError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.name.startswith(prefix) and entry.name.endswith(
+                (SNAPSHOT_SUFFIX, LEGACY_SNAPSHOT_SUFFIX)
+            ):
+                os.unlink(entry.path)
+
+
+# (register key, label, format spec) compared by _snapshot_diff_lines, in display order.
+_DIFF_REGISTER_SPECS = (
+    ("program_counter", "PC", "04X"),
+    ("stack_pointer", "SP", "04X"),
+    ("index", "IX", "04X"),
+    ("acc_a", "A", "02X"),
+    ("acc_b", "B", "02X"),
+)
+_DIFF_FLAG_ORDER = ("carry_h", "carry_i", "carry_n", "carry_z", "carry_v", "carry_c")
+# Upper-cased flag names shown in previews and diffs.
+_FLAG_LABELS = {name: name.upper() for name in _DIFF_FLAG_ORDER}
+# Labels indexed by bit position in the word built by _pack_flags.
+_FLAG_LABEL_BY_BIT = tuple(_FLAG_LABELS[name] for name in _DIFF_FLAG_ORDER)
+
+
+def _pack_flags(flags: Dict[str, bool]) -> int:
+    """Pack snapshot flags into an int, bit ``i`` holding ``_DIFF_FLAG_ORDER[i]``."""
+
+    packed = 0
+    for bit, name in enumerate(_DIFF_FLAG_ORDER):
+        if flags.get(name, False):
+            packed |= 1 << bit
+    return packed
 
 
 def _make_preview_lines(entry, snapshot: Snapshot, current: Optional[Snapshot] = None) -> List[str]:
@@ -765,10 +1205,8 @@ def _make_preview_lines(entry, snapshot: Snapshot, current: Optional[Snapshot] =
         f"Comment: {entry.comment}",
         f"PC:{pc:04X} SP:{sp:04X} IX:{ix:04X}",
     ]
-    flags = snapshot.cpu_flags
-    lines.append(
-        "FLAGS:" + " ".join(f"{name.upper()}={int(value)}" for name, value in flags.items())
-    )
+    items = [(_FLAG_LABELS.get(name) or name.upper(), value) for name, value in snapshot.cpu_flags.items()]
+    lines.append("FLAGS:" + " ".join("%s=%d" % item for item in items))
     if current is not None:
         diff_lines = _snapshot_diff_lines(current, snapshot)
         lines.append("Diff:")
@@ -778,34 +1216,44 @@ def _make_preview_lines(entry, snapshot: Snapshot, current: Optional[Snapshot] =
 
 def _snapshot_diff_lines(current: Snapshot, target: Snapshot) -> List[str]:
     diffs: List[str] = []
-    reg_specs = [
-        ("program_counter", "PC", 4),
-        ("stack_pointer", "SP", 4),
-        ("index", "IX", 4),
-        ("acc_a", "A", 2),
-        ("acc_b", "B", 2),
-    ]
-    for key, label, width in reg_specs:
+    for key, label, fmt in _DIFF_REGISTER_SPECS:
         curr_val = int(current.cpu_registers.get(key, 0)) & 0xFFFF
         tgt_val = int(target.cpu_registers.get(key, 0)) & 0xFFFF
         if curr_val != tgt_val:
-            fmt = f"0{width}X"
             diffs.append(f"  {label}: {format(curr_val, fmt)} -> {format(tgt_val, fmt)}")
 
-    flag_order = ["carry_h", "carry_i", "carry_n", "carry_z", "carry_v", "carry_c"]
-    for flag in flag_order:
-        curr_flag = bool(current.cpu_flags.get(flag, False))
-        tgt_flag = bool(target.cpu_flags.get(flag, False))
-        if curr_flag != tgt_flag:
-            diffs.append(f"  Flag {flag.upper()}: {int(curr_flag)} -> {int(tgt_flag)}")
+    curr_flags = _pack_flags(current.cpu_flags)
+    changed_flags = curr_flags ^ _pack_flags(target.cpu_flags)
+    # Visit only the differing bits, lowest first, which keeps display order.
+    while changed_flags:
+        bit = changed_flags & -changed_flags
+        changed_flags ^= bit
+        index = bit.bit_length() - 1
+        curr_flag = (curr_flags >> index) & 1
+        diffs.append(f"  Flag {_FLAG_LABEL_BY_BIT[index]}: {curr_flag} -> {curr_flag ^ 1}")
 
     memory_diffs = []
     diff_count = 0
-    for addr, (curr_byte, tgt_byte) in enumerate(zip(current.memory, target.memory)):
-        if curr_byte != tgt_byte:
-            if len(memory_diffs) < 4:
-                memory_diffs.append((addr, curr_byte, tgt_byte))
-            diff_count += 1
+    curr_memory = current.memory
+    tgt_memory = target.memory
+    # Identical dumps (the usual case while single-stepping) cost one memcmp.
+    if curr_memory != tgt_memory:
+        if len(curr_memory) != len(tgt_memory):
+            size = min(len(curr_memory), len(tgt_memory))
+            curr_memory = curr_memory[:size]
+            tgt_memory = tgt_memory[:size]
+        # Whole pages are compared at C speed first; only pages that differ are
+        # scanned byte by byte.
+        for start, end in _dirty_ranges(curr_memory, tgt_memory):
+            changed = list(
+                compress(
+                    range(start, end),
+                    map(operator.ne, curr_memory[start:end], tgt_memory[start:end]),
+                )
+            )
+            diff_count += len(changed)
+            for addr in changed[: 4 - len(memory_diffs)]:
+                memory_diffs.append((addr, curr_memory[addr], tgt_memory[addr]))
     if diff_count:
         diffs.append(f"  Memory bytes differ: {diff_count}")
         for addr, curr_byte, tgt_byte in memory_diffs:
@@ -816,42 +1264,66 @@ def _snapshot_diff_lines(current: Snapshot, target: Snapshot) -> List[str]:
     return diffs
 
 
+# Default joystick mapping written by --write-joystick-template, serialized once.
+_JOYSTICK_TEMPLATE = {
+    "left": [
+        ["axis", 0, -0.5],
+        ["hat", [0, "x"], -1],
+        ["button", 13, 0.5],
+    ],
+    "right": [
+        ["axis", 0, 0.5],
+        ["hat", [0, "x"], 1],
+        ["button", 14, 0.5],
+    ],
+    "up": [
+        ["axis", 1, -0.5],
+        ["hat", [0, "y"], 1],
+        ["button", 11, 0.5],
+    ],
+    "down": [
+        ["axis", 1, 0.5],
+        ["hat", [0, "y"], -1],
+        ["button", 12, 0.5],
+    ],
+    "switch": [["button", 0, 0.5]],
+}
+_JOYSTICK_TEMPLATE_BYTES = json.dumps(_JOYSTICK_TEMPLATE, indent=2).encode("utf-8")
+
+
 def _write_joystick_template(path: Path) -> None:
-    template = {
-        "left": [
-            ["axis", 0, -0.5],
-            ["hat", [0, "x"], -1],
-            ["button", 13, 0.5],
-        ],
-        "right": [
-            ["axis", 0, 0.5],
-            ["hat", [0, "x"], 1],
-            ["button", 14, 0.5],
-        ],
-        "up": [
-            ["axis", 1, -0.5],
-            ["hat", [0, "y"], 1],
-            ["button", 11, 0.5],
-        ],
-        "down": [
-            ["axis", 1, 0.5],
-            ["hat", [0, "y"], -1],
-            ["button", 12, 0.5],
-        ],
-        "switch": [["button", 0, 0.5]],
-    }
-    path.write_text(json.dumps(template, indent=2), encoding="utf-8")
+    path.write_bytes(_JOYSTICK_TEMPLATE_BYTES)
+
+
+# Option values used when no arguments are given; shared by the parser and the
+# argument-free fast path in ``main`` so both start the emulator identically.
+_DEFAULTS: Dict[str, object] = {
+    "write_joystick_template": None,
+    "scale": 2,
+    "fps": 30,
+    "rom": None,
+    "audio": None,
+    "joystick": False,
+    "joystick_diagnostics": False,
+    "joystick_config": None,
+    "joystick_index": None,
+    "joystick_name": None,
+    "joystick_keymap": None,
+}
 
 
-def main(argv: Iterable[str] | None = None) -> None:
+@cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser once; later ``main`` calls reuse it."""
+
     parser = argparse.ArgumentParser(description="JR-100 emulator demo")
     parser.add_argument(
         "--write-joystick-template",
         metavar="PATH",
         help="Write a JSON joystick mapping template to the given path and exit",
     )
-    parser.add_argument("--scale", type=int, default=2, help="Integer scaling factor for display (default: 2)")
-    parser.add_argument("--fps", type=int, default=30, help="Target frames per second for the demo loop")
+    parser.add_argument("--scale", type=int, help="Integer scaling factor for display (default: %(default)s)")
+    parser.add_argument("--fps", type=int, help="Target frames per second for the demo loop")
     parser.add_argument(
         "--rom",
         help="Path to the JR-100 BASIC ROM (PROG format). Defaults to datas/jr100rom.prg if omitted",
@@ -868,7 +1340,6 @@ def main(argv: Iterable[str] | None = None) -> None:
         action="store_false",
         help="Force audio output off even if ROM/default settings enable it",
     )
-    parser.set_defaults(audio=None)
     parser.add_argument("--joystick", action="store_true", help="Enable pygame joystick input mapping to the JR-100 gamepad port")
     parser.add_argument(
         "--joystick-diagnostics",
@@ -882,22 +1353,28 @@ def main(argv: Iterable[str] | None = None) -> None:
     parser.add_argument(
         "--joystick-index",
         type=int,
-        default=None,
         help="Select a specific pygame joystick device index when multiple controllers are present",
     )
     parser.add_argument(
         "--joystick-name",
         type=str,
-        default=None,
         help="Select joysticks whose OS name contains the given substring",
     )
     parser.add_argument(
         "--joystick-keymap",
         type=str,
-        default=None,
         help="Path to JSON file mapping joystick directions to JR-100 keyboard matrix keys",
     )
-    args = parser.parse_args(list(argv) if argv is not None else None)
+    parser.set_defaults(**_DEFAULTS)
+    return parser
+
+
+def main(argv: Iterable[str] | None = None) -> None:
+    if argv is None and len(sys.argv) == 1:
+        # Plain launch: nothing to parse, so skip building the parser.
+        args = argparse.Namespace(**_DEFAULTS)
+    else:
+        args = _build_parser().parse_args(list(argv) if argv is not None else None)
 
     if args.write_joystick_template:
         _write_joystick_template(Path(args.write_joystick_template))
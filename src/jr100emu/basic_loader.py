@@ -5,7 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional
 
-from jr100emu.emulator.file.program import load_basic_text, ProgramInfo
+from jr100emu.emulator.file.program import ProgramInfo
 from jr100emu.jr100.computer import JR100Computer
 
 
@@ -4,12 +4,25 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import os
+import struct
 from typing import Dict, Optional, Tuple, Callable
 
 
-@dataclass
+# Big-endian word store into a page view; one C call instead of two byte stores.
+_pack_word_into = struct.Struct(">H").pack_into
+
+# N and Z bits of the CCR for each 8-bit result. A module global so the ALU
+# helpers reach it with one dict probe instead of an attribute lookup.
+_NZ_FLAGS = bytes(((value & 0x80) >> 4) | (0 if value else 0x04) for value in range(256))
+
+
+@dataclass(slots=True)
 class CPURegisters:
-    """Register file matching MB8861 layout."""
+    """Register file matching MB8861 layout.
+
+    Slotted so the handlers' register reads and writes are plain descriptor
+    accesses rather than instance-dict lookups.
+    """
 
     acc_a: int = 0
     acc_b: int = 0
@@ -18,24 +31,167 @@ class CPURegisters:
     program_counter: int = 0
 
 
-@dataclass
+def _ccr_flag(mask: int, doc: str) -> property:
+    def _get(self: "CPUFlags") -> bool:
+        return bool(self.ccr & mask)
+
+    def _set(self: "CPUFlags", value: bool) -> None:
+        if value:
+            self.ccr |= mask
+        else:
+            self.ccr &= ~mask
+
+    return property(_get, _set, doc=doc)
+
+
 class CPUFlags:
-    carry_h: bool = False
-    carry_i: bool = False
-    carry_n: bool = False
-    carry_z: bool = False
-    carry_v: bool = False
-    carry_c: bool = False
+    """Condition code register packed in the MB8861 layout (11HINZVC).
+
+    The CPU core reads and writes ``ccr`` directly; the ``carry_*`` properties
+    give frontends, snapshots and tests the per-flag boolean view.
+    """
+
+    __slots__ = ("ccr",)
+
+    H = 0x20
+    I = 0x10
+    N = 0x08
+    Z = 0x04
+    V = 0x02
+    C = 0x01
+
+    carry_h = _ccr_flag(H, "Half carry from bit 3.")
+    carry_i = _ccr_flag(I, "IRQ mask.")
+    carry_n = _ccr_flag(N, "Negative.")
+    carry_z = _ccr_flag(Z, "Zero.")
+    carry_v = _ccr_flag(V, "Two's complement overflow.")
+    carry_c = _ccr_flag(C, "Carry/borrow.")
+
+    def __init__(
+        self,
+        carry_h: bool = False,
+        carry_i: bool = False,
+        carry_n: bool = False,
+        carry_z: bool = False,
+        carry_v: bool = False,
+        carry_c: bool = False,
+    ) -> None:
+        self.ccr = (
+            0xC0
+            | (self.H if carry_h else 0)
+            | (self.I if carry_i else 0)
+            | (self.N if carry_n else 0)
+            | (self.Z if carry_z else 0)
+            | (self.V if carry_v else 0)
+            | (self.C if carry_c else 0)
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"CPUFlags(carry_h={self.carry_h}, carry_i={self.carry_i}, carry_n={self.carry_n}, "
+            f"carry_z={self.carry_z}, carry_v={self.carry_v}, carry_c={self.carry_c})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CPUFlags):
+            return NotImplemented
+        return self.ccr == other.ccr
+
+
+def _status_flag(mask: int, doc: str) -> property:
+    def _get(self: "CPUStatus") -> bool:
+        return bool(self.pending & mask)
+
+    def _set(self: "CPUStatus", value: bool) -> None:
+        if value:
+            self.pending |= mask
+        else:
+            self.pending &= ~mask
+
+    return property(_get, _set, doc=doc)
+
+
+def _build_daa_table() -> Tuple[Tuple[int, int], ...]:
+    """Return ``(result, NZVC bits)`` for DAA indexed by ``A << 1 | H``."""
+
+    table = []
+    for index in range(512):
+        original = index >> 1
+        temp = original
+        if (temp & 0x0F) >= 0x0A or index & 1:
+            temp += 0x06
+        if (temp & 0xF0) >= 0xA0:
+            temp += 0x60
+        result = temp & 0xFF
+        bits = ((result >> 4) & 0x08) | (0x04 if result == 0 else 0)
+        # V follows the Java port: set when a non-zero original changes sign.
+        if original and (original ^ result) & 0x80:
+            bits |= 0x02
+        # C is only ever set here; a clear entry leaves the previous carry.
+        if (original & 0xF0) >= 0xA0:
+            bits |= 0x01
+        table.append((result, bits))
+    return tuple(table)
 
 
-@dataclass
 class CPUStatus:
-    reset_requested: bool = False
-    nmi_requested: bool = False
-    irq_requested: bool = False
-    halt_requested: bool = False
-    halt_processed: bool = False
-    fetch_wai: bool = False
+    """Pending CPU events packed into a single bitmask.
+
+    MB8861.execute() only tests ``pending`` once per instruction; the named
+    properties keep the per-event boolean view for devices, snapshots and
+    frontends.
+    """
+
+    __slots__ = ("pending",)
+
+    RESET = 0x01
+    NMI = 0x02
+    IRQ = 0x04
+    HALT = 0x08
+    WAI = 0x10
+    HALT_DONE = 0x20
+
+    reset_requested = _status_flag(RESET, "Reset requested.")
+    nmi_requested = _status_flag(NMI, "NMI requested.")
+    irq_requested = _status_flag(IRQ, "IRQ line asserted.")
+    halt_requested = _status_flag(HALT, "Halt requested.")
+    halt_processed = _status_flag(HALT_DONE, "Halt acknowledged.")
+    fetch_wai = _status_flag(WAI, "Waiting for an interrupt after WAI.")
+
+    def __init__(
+        self,
+        reset_requested: bool = False,
+        nmi_requested: bool = False,
+        irq_requested: bool = False,
+        halt_requested: bool = False,
+        halt_processed: bool = False,
+        fetch_wai: bool = False,
+    ) -> None:
+        self.pending = (
+            (self.RESET if reset_requested else 0)
+            | (self.NMI if nmi_requested else 0)
+            | (self.IRQ if irq_requested else 0)
+            | (self.HALT if halt_requested else 0)
+            | (self.HALT_DONE if halt_processed else 0)
+            | (self.WAI if fetch_wai else 0)
+        )
+
+    @property
+    def event_pending(self) -> bool:
+        return self.pending != 0
+
+    def __repr__(self) -> str:
+        return (
+            f"CPUStatus(reset_requested={self.reset_requested}, "
+            f"nmi_requested={self.nmi_requested}, irq_requested={self.irq_requested}, "
+            f"halt_requested={self.halt_requested}, halt_processed={self.halt_processed}, "
+            f"fetch_wai={self.fetch_wai})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CPUStatus):
+            return NotImplemented
+        return self.pending == other.pending
 
 
 class CPU:
@@ -277,6 +433,101 @@ class MB8861(CPU):
     OP_XIM_IND = 0x75
     OP_TMM_IND = 0x7B
 
+    # Branch conditions by low opcode nibble, each folded into a 16-bit mask with
+    # bit n set when the branch is taken for NZVC == n (N=8, Z=4, V=2, C=1).
+    # 0x21 (BRN on later 6800 parts) is undefined on the MB8861.
+    _BRANCH_TAKEN: Tuple[Optional[int], ...] = tuple(
+        None
+        if cond is None
+        else sum(1 << nzvc for nzvc in range(16) if cond(nzvc & 8, nzvc & 4, nzvc & 2, nzvc & 1))
+        for cond in (
+            lambda n, z, v, c: True,  # BRA
+            None,
+            lambda n, z, v, c: not (c or z),  # BHI
+            lambda n, z, v, c: c or z,  # BLS
+            lambda n, z, v, c: not c,  # BCC
+            lambda n, z, v, c: c,  # BCS
+            lambda n, z, v, c: not z,  # BNE
+            lambda n, z, v, c: z,  # BEQ
+            lambda n, z, v, c: not v,  # BVC
+            lambda n, z, v, c: v,  # BVS
+            lambda n, z, v, c: not n,  # BPL
+            lambda n, z, v, c: n,  # BMI
+            lambda n, z, v, c: bool(n) == bool(v),  # BGE
+            lambda n, z, v, c: bool(n) != bool(v),  # BLT
+            lambda n, z, v, c: not z and bool(n) == bool(v),  # BGT
+            lambda n, z, v, c: z or bool(n) != bool(v),  # BLE
+        )
+    )
+
+    # Precomputed flag results for the helpers whose flags depend only on the
+    # operand: NZV bits of INC/DEC indexed by the original value, NZV bits of
+    # TMM indexed by the memory byte (for a non-zero mask), and DAA's
+    # (result, NZVC) pairs.
+    _INC_NZV: bytes = bytes(
+        ((x + 1) & 0x80) >> 4 | (0x04 if x == 0xFF else 0) | (0x02 if x == 0x7F else 0)
+        for x in range(256)
+    )
+    _DEC_NZV: bytes = bytes(
+        ((x - 1) & 0x80) >> 4 | (0x04 if x == 0x01 else 0) | (0x02 if x == 0x80 else 0)
+        for x in range(256)
+    )
+    _TMM_NZV: bytes = bytes(
+        0x04 if y == 0 else 0x02 if y == 0xFF else 0x08 for y in range(256)
+    )
+    _DAA_TABLE: Tuple[Tuple[int, int], ...] = _build_daa_table()
+
+    # Accumulator ALU instructions as (low opcode nibble, helper, kind). A forms
+    # sit at 0x80-0xBF and B forms at 0xC0-0xFF; bits 4-5 select IMM, DIR, IND
+    # or EXT addressing. "update" writes the result back, "test" only sets
+    # flags (CMP is SUB and BIT is AND with the result discarded) and "load"
+    # replaces the accumulator with the operand.
+    _ACC_ALU_OPS: Tuple[Tuple[int, str, str], ...] = (
+        (0x0, "_sub8", "update"),
+        (0x1, "_sub8", "test"),
+        (0x2, "_sbc8", "update"),
+        (0x4, "_and8", "update"),
+        (0x5, "_and8", "test"),
+        (0x6, "_lda", "load"),
+        (0x8, "_eor8", "update"),
+        (0x9, "_adc8", "update"),
+        (0xA, "_ora", "update"),
+        (0xB, "_add8", "update"),
+    )
+    _ACC_ALU_CYCLES: Tuple[int, ...] = (2, 3, 5, 4)
+
+    # STAA/STAB and the 16-bit register instructions share the same layout:
+    # bits 4-5 select IMM, DIR, IND or EXT. Word ops are (base, low nibble,
+    # helper, kind) where "load" helpers take the 16-bit operand and "store"
+    # helpers take the effective address. Stores have no immediate form.
+    _STORE_CYCLES: Tuple[int, ...] = (0, 4, 6, 5)
+    _WORD_OPS: Tuple[Tuple[int, int, str, str], ...] = (
+        (0x80, 0xC, "_cpx", "load"),
+        (0x80, 0xE, "_lds", "load"),
+        (0xC0, 0xE, "_ldx", "load"),
+        (0x80, 0xF, "_sts", "store"),
+        (0xC0, 0xF, "_stx", "store"),
+    )
+    _WORD_LOAD_CYCLES: Tuple[int, ...] = (3, 4, 6, 5)
+    _WORD_STORE_CYCLES: Tuple[int, ...] = (0, 5, 7, 6)
+
+    # Memory read-modify-write instructions as (low opcode nibble, helper,
+    # kind). Indexed forms sit at 0x60-0x6F and extended forms at 0x70-0x7F.
+    # "test" only sets flags and "clear" stores without reading the operand.
+    _MEM_RMW_OPS: Tuple[Tuple[int, str, str], ...] = (
+        (0x0, "_neg", "update"),
+        (0x3, "_com", "update"),
+        (0x4, "_lsr", "update"),
+        (0x6, "_ror", "update"),
+        (0x7, "_asr", "update"),
+        (0x8, "_asl", "update"),
+        (0x9, "_rol", "update"),
+        (0xA, "_dec", "update"),
+        (0xC, "_inc", "update"),
+        (0xD, "_tst", "test"),
+        (0xF, "_clr", "clear"),
+    )
+
     STATE_PREFIX = "MB8861."
     TRACE_WAI_ENV = "JR100EMU_TRACE_CPU_WAI"
     TRACE_WAI = os.getenv(TRACE_WAI_ENV) is not None
@@ -287,14 +538,41 @@ class MB8861(CPU):
         self.flags = CPUFlags()
         self.status = CPUStatus()
         self.memory = self._resolve_memory()
+        # Bound once so the slow paths below skip the memory attribute lookup.
+        memory = self.memory
+        self._mem_load8 = getattr(memory, "load8", None)
+        self._mem_load16 = getattr(memory, "load16", None)
+        self._mem_store8 = getattr(memory, "store8", None)
+        self._mem_store16 = getattr(memory, "store16", None)
+        # Per-page RAM views published by MemorySystem; None pages (I/O, ROM
+        # writes, devices with side effects) go through the memory methods.
+        self._read_pages: list[Optional[memoryview]] = (
+            getattr(self.memory, "read_pages", None) or [None] * 256
+        )
+        self._write_pages: list[Optional[memoryview]] = (
+            getattr(self.memory, "write_pages", None) or [None] * 256
+        )
+        # Clock at which the current execute() call stops; read by the
+        # countdown-loop fast path.
+        self._target_clock = 0
         self._opcode_table: Dict[int, Tuple[Callable[[], None], int]] = {}
+        # Dense 256-entry jump table frozen from _opcode_table by
+        # _init_opcode_table; execute() dispatches through these tuples.
+        self._op_handlers: Tuple[Callable[[], None], ...] = ()
+        self._op_cycles: Tuple[int, ...] = ()
         self._init_opcode_table()
 
     def _resolve_memory(self) -> Optional[object]:
         hardware = getattr(self.computer, "hardware", None)
         if hardware is None:
             return None
-        return getattr(hardware, "memory", None)
+        memory = getattr(hardware, "memory", None)
+        if memory is not None:
+            # Checked once here so the per-access helpers can call straight through.
+            for name in ("load8", "load16", "store8", "store16"):
+                if not hasattr(memory, name):
+                    raise AttributeError(f"Memory system must provide {name}")
+        return memory
 
     def reset(self) -> None:
         self.status.reset_requested = True
@@ -317,72 +595,65 @@ class MB8861(CPU):
         if self.memory is None:
             raise RuntimeError("Memory system is not attached to MB8861")
 
-        clock_attr = "clock_count"
-        if not hasattr(self.computer, clock_attr):
+        computer = self.computer
+        if not hasattr(computer, "clock_count"):
             raise AttributeError("Computer object must provide clock_count attribute")
 
-        target_clock = self._get_clock_count() + clocks
-        while self._get_clock_count() < target_clock:
-            if self.status.reset_requested:
-                self._handle_reset()
-                return 0
-
-            if self.status.halt_requested:
-                self.status.halt_processed = True
-                continue
-
-            if self.status.halt_processed:
-                self.status.halt_processed = False
-
-            if self.status.fetch_wai:
-                handled_interrupt = self._service_pending_interrupts(in_wai=True)
-                if handled_interrupt:
+        # Hot attributes are bound to locals once per call. The clock is kept in a
+        # local too, but written back after every instruction because devices
+        # (VIA timers) read computer.clock_count while handlers access memory;
+        # handlers that retire extra cycles themselves add them to that count.
+        status = self.status
+        registers = self.registers
+        load8 = self._mem_load8
+        read_pages = self._read_pages
+        handlers = self._op_handlers
+        op_cycles = self._op_cycles
+        service_interrupts = self._service_pending_interrupts
+        clock = computer.clock_count
+        target_clock = clock + clocks
+        self._target_clock = target_clock
+        while clock < target_clock:
+            if status.pending:
+                if status.reset_requested:
+                    self._handle_reset()
+                    return 0
+
+                if status.halt_requested:
+                    status.halt_processed = True
                     continue
-                self._increment_clock(1)
-                continue
-
-            if self._service_pending_interrupts(in_wai=False):
-                continue
-
-            opcode = self._fetch_op()
-            if opcode == self.OP_RTI_IMP:
-                self._rti()
-                self._increment_clock(10)
-                continue
 
-            if opcode == self.OP_RTS_IMP:
-                self._rts()
-                self._increment_clock(5)
-                continue
+                if status.halt_processed:
+                    status.halt_processed = False
 
-            if opcode == self.OP_SWI_IMP:
-                self._swi()
-                self._increment_clock(12)
-                continue
-
-            if opcode == self.OP_WAI_IMP:
-                self._wai()
-                self._increment_clock(9)
-                continue
+                if status.fetch_wai:
+                    if service_interrupts(in_wai=True):
+                        clock = computer.clock_count
+                    else:
+                        clock += 1
+                        computer.clock_count = clock
+                    continue
 
-            if opcode in self._opcode_table:
-                handler, cycles = self._opcode_table[opcode]
-                handler()
-                self._increment_clock(cycles)
-                continue
+                if service_interrupts(in_wai=False):
+                    clock = computer.clock_count
+                    continue
 
-            # Java 実装では未定義オペコードを 1 クロックの NOP として扱う
-            self._opcode_nop()
-            self._increment_clock(1)
+            pc = registers.program_counter
+            page = read_pages[pc >> 8]
+            opcode = page[pc & 0xFF] if page is not None else load8(pc) & 0xFF
+            registers.program_counter = (pc + 1) & 0xFFFF
+            handlers[opcode]()
+            clock = computer.clock_count + op_cycles[opcode]
+            computer.clock_count = clock
 
-        return self._get_clock_count() - target_clock
+        return clock - target_clock
 
     def _handle_reset(self) -> None:
         self.status.reset_requested = False
         self.status.fetch_wai = False
-        self.flags.carry_i = True
+        self.flags.ccr |= 0x10
         self.registers.program_counter = self._load16(self.VECTOR_RESTART)
-        self._set_clock_count(0)
+        self.computer.clock_count = 0
 
     def _service_pending_interrupts(self, *, in_wai: bool) -> bool:
         if self.status.nmi_requested:
@@ -390,9 +661,9 @@ class MB8861(CPU):
             self.status.fetch_wai = False
             if not in_wai:
                 self._push_all_registers()
-            self.flags.carry_i = True
+            self.flags.ccr |= 0x10
             self.registers.program_counter = self._load16(self.VECTOR_NMI)
-            self._increment_clock(4 if in_wai else 12)
+            self.computer.clock_count += 4 if in_wai else 12
             if self.TRACE_WAI and in_wai:
                 print(
                     f"TRACE-WAI exit via NMI pc={self.registers.program_counter:04X}",
@@ -400,14 +671,14 @@ class MB8861(CPU):
                 )
             return True
 
-        if self.status.irq_requested and not self.flags.carry_i:
+        if self.status.irq_requested and not self.flags.ccr & 0x10:
             if in_wai:
                 self.status.fetch_wai = False
             else:
                 self._push_all_registers()
-            self.flags.carry_i = True
+            self.flags.ccr |= 0x10
             self.registers.program_counter = self._load16(self.VECTOR_IRQ)
-            self._increment_clock(4 if in_wai else 12)
+            self.computer.clock_count += 4 if in_wai else 12
             if self.TRACE_WAI and in_wai:
                 via = getattr(self.computer, "via", None)
                 via_state = getattr(via, "_state", None) if via is not None else None
@@ -433,51 +704,38 @@ class MB8861(CPU):
         return False
 
     def _push_all_registers(self) -> None:
-        sp = self.registers.stack_pointer & 0xFFFF
-        ccr = 0xC0
-        if self.flags.carry_h:
-            ccr |= 0x20
-        if self.flags.carry_i:
-            ccr |= 0x10
-        if self.flags.carry_n:
-            ccr |= 0x08
-        if self.flags.carry_z:
-            ccr |= 0x04
-        if self.flags.carry_v:
-            ccr |= 0x02
-        if self.flags.carry_c:
-            ccr |= 0x01
-
-        self._store16((sp - 1) & 0xFFFF, self.registers.program_counter)
-        self._store16((sp - 3) & 0xFFFF, self.registers.index)
-        self._store8((sp - 4) & 0xFFFF, self.registers.acc_a)
-        self._store8((sp - 5) & 0xFFFF, self.registers.acc_b)
-        self._store8((sp - 6) & 0xFFFF, ccr)
-        self.registers.stack_pointer = (sp - 7) & 0xFFFF
+        registers = self.registers
+        store8 = self._store8
+        store16 = self._store16
+        sp = registers.stack_pointer
+        store16((sp - 1) & 0xFFFF, registers.program_counter)
+        store16((sp - 3) & 0xFFFF, registers.index)
+        store8((sp - 4) & 0xFFFF, registers.acc_a)
+        store8((sp - 5) & 0xFFFF, registers.acc_b)
+        store8((sp - 6) & 0xFFFF, self.flags.ccr)
+        registers.stack_pointer = (sp - 7) & 0xFFFF
 
     def _pop_all_registers(self) -> None:
-        sp = (self.registers.stack_pointer + 7) & 0xFFFF
-        ccr = self._load8((sp - 6) & 0xFFFF)
-        self.flags.carry_h = bool(ccr & 0x20)
-        self.flags.carry_i = bool(ccr & 0x10)
-        self.flags.carry_n = bool(ccr & 0x08)
-        self.flags.carry_z = bool(ccr & 0x04)
-        self.flags.carry_v = bool(ccr & 0x02)
-        self.flags.carry_c = bool(ccr & 0x01)
-        self.registers.acc_b = self._load8((sp - 5) & 0xFFFF)
-        self.registers.acc_a = self._load8((sp - 4) & 0xFFFF)
-        self.registers.index = self._load16((sp - 3) & 0xFFFF)
-        self.registers.program_counter = self._load16((sp - 1) & 0xFFFF)
-        self.registers.stack_pointer = sp
+        registers = self.registers
+        load8 = self._load8
+        load16 = self._load16
+        sp = (registers.stack_pointer + 7) & 0xFFFF
+        self.flags.ccr = load8((sp - 6) & 0xFFFF) | 0xC0
+        registers.acc_b = load8((sp - 5) & 0xFFFF)
+        registers.acc_a = load8((sp - 4) & 0xFFFF)
+        registers.index = load16((sp - 3) & 0xFFFF)
+        registers.program_counter = load16((sp - 1) & 0xFFFF)
+        registers.stack_pointer = sp
 
     def _push8(self, value: int) -> None:
-        address = self.registers.stack_pointer & 0xFFFF
-        self._store8(address, value & 0xFF)
-        self.registers.stack_pointer = (address - 1) & 0xFFFF
+        registers = self.registers
+        address = registers.stack_pointer
+        self._store8(address, value)
+        registers.stack_pointer = (address - 1) & 0xFFFF
 
     def _pull8(self) -> int:
-        sp = (self.registers.stack_pointer + 1) & 0xFFFF
-        self.registers.stack_pointer = sp
+        registers = self.registers
+        registers.stack_pointer = sp = (registers.stack_pointer + 1) & 0xFFFF
         return self._load8(sp)
 
     # ------------------------------------------------------------------
@@ -530,63 +788,219 @@ class MB8861(CPU):
         self.status.fetch_wai = bool(_get("fetchWai", False))
 
     def _load16(self, address: int) -> int:
-        if not hasattr(self.memory, "load16"):
-            raise AttributeError("Memory system must provide load16")
-        return getattr(self.memory, "load16")(address & 0xFFFF) & 0xFFFF
+        address &= 0xFFFF
+        page = self._read_pages[address >> 8]
+        offset = address & 0xFF
+        if page is not None and offset != 0xFF:
+            return (page[offset] << 8) | page[offset + 1]
+        return self._mem_load16(address) & 0xFFFF
 
     def _load8(self, address: int) -> int:
-        if not hasattr(self.memory, "load8"):
-            raise AttributeError("Memory system must provide load8")
-        return getattr(self.memory, "load8")(address & 0xFFFF) & 0xFF
+        address &= 0xFFFF
+        page = self._read_pages[address >> 8]
+        if page is not None:
+            return page[address & 0xFF]
+        return self._mem_load8(address) & 0xFF
 
     def _store16(self, address: int, value: int) -> None:
-        if not hasattr(self.memory, "store16"):
-            raise AttributeError("Memory system must provide store16")
-        getattr(self.memory, "store16")(address & 0xFFFF, value & 0xFFFF)
+        address &= 0xFFFF
+        page = self._write_pages[address >> 8]
+        offset = address & 0xFF
+        if page is not None and offset != 0xFF:
+            _pack_word_into(page, offset, value)
+            return
+        self._mem_store16(address, value & 0xFFFF)
 
     def _store8(self, address: int, value: int) -> None:
-        if not hasattr(self.memory, "store8"):
-            raise AttributeError("Memory system must provide store8")
-        getattr(self.memory, "store8")(address & 0xFFFF, value & 0xFF)
+        address &= 0xFFFF
+        page = self._write_pages[address >> 8]
+        if page is not None:
+            page[address & 0xFF] = value & 0xFF
+            return
+        self._mem_store8(address, value & 0xFF)
 
-    def _get_clock_count(self) -> int:
-        return getattr(self.computer, "clock_count")
+    def _fetch_operand8(self) -> int:
+        registers = self.registers
+        pc = registers.program_counter
+        registers.program_counter = (pc + 1) & 0xFFFF
+        page = self._read_pages[pc >> 8]
+        if page is not None:
+            return page[pc & 0xFF]
+        return self._mem_load8(pc) & 0xFF
 
-    def _set_clock_count(self, value: int) -> None:
-        setattr(self.computer, "clock_count", value)
+    def _fetch_operand16(self) -> int:
+        registers = self.registers
+        pc = registers.program_counter
+        registers.program_counter = (pc + 2) & 0xFFFF
+        page = self._read_pages[pc >> 8]
+        offset = pc & 0xFF
+        if page is not None and offset != 0xFF:
+            return (page[offset] << 8) | page[offset + 1]
+        load8 = self._mem_load8
+        return ((load8(pc) & 0xFF) << 8) | (load8((pc + 1) & 0xFFFF) & 0xFF)
+
+    def _indexed_address(self) -> int:
+        return (self.registers.index + self._fetch_operand8()) & 0xFFFF
+
+    # The operand readers below are the hot path of every memory-mode ALU
+    # instruction, so they fold the operand fetch and the load into one frame
+    # instead of going through _fetch_operand8/16 and _load8.
+    def _read_direct_operand(self) -> int:
+        registers = self.registers
+        read_pages = self._read_pages
+        pc = registers.program_counter
+        registers.program_counter = (pc + 1) & 0xFFFF
+        page = read_pages[pc >> 8]
+        address = page[pc & 0xFF] if page is not None else self._mem_load8(pc) & 0xFF
+        page = read_pages[0]
+        if page is not None:
+            return page[address]
+        return self._mem_load8(address) & 0xFF
+
+    def _read_indexed_operand(self) -> int:
+        registers = self.registers
+        read_pages = self._read_pages
+        pc = registers.program_counter
+        registers.program_counter = (pc + 1) & 0xFFFF
+        page = read_pages[pc >> 8]
+        offset = page[pc & 0xFF] if page is not None else self._mem_load8(pc) & 0xFF
+        address = (registers.index + offset) & 0xFFFF
+        page = read_pages[address >> 8]
+        if page is not None:
+            return page[address & 0xFF]
+        return self._mem_load8(address) & 0xFF
+
+    def _read_extended_operand(self) -> int:
+        registers = self.registers
+        read_pages = self._read_pages
+        pc = registers.program_counter
+        registers.program_counter = (pc + 2) & 0xFFFF
+        page = read_pages[pc >> 8]
+        offset = pc & 0xFF
+        if page is not None and offset != 0xFF:
+            address = (page[offset] << 8) | page[offset + 1]
+        else:
+            load8 = self._mem_load8
+            address = ((load8(pc) & 0xFF) << 8) | (load8((pc + 1) & 0xFFFF) & 0xFF)
+        page = read_pages[address >> 8]
+        if page is not None:
+            return page[address & 0xFF]
+        return self._mem_load8(address) & 0xFF
+
+    def _make_acc_op(
+        self,
+        alu: Callable[..., Optional[int]],
+        accumulator: str,
+        kind: str,
+        read: Callable[[], int],
+    ) -> Callable[[], None]:
+        """Build the handler applying ``alu`` to ``accumulator`` and a ``read`` operand."""
+
+        registers = self.registers
+        if accumulator == "acc_a":
+            if kind == "load":
+                def handler() -> None:
+                    registers.acc_a = alu(read())
+            elif kind == "test":
+                def handler() -> None:
+                    alu(registers.acc_a, read())
+            else:
+                def handler() -> None:
+                    registers.acc_a = alu(registers.acc_a, read())
+        else:
+            if kind == "load":
+                def handler() -> None:
+                    registers.acc_b = alu(read())
+            elif kind == "test":
+                def handler() -> None:
+                    alu(registers.acc_b, read())
+            else:
+                def handler() -> None:
+                    registers.acc_b = alu(registers.acc_b, read())
+        return handler
+
+    def _make_rmw_op(
+        self,
+        alu: Callable[..., Optional[int]],
+        kind: str,
+        address_of: Callable[[], int],
+    ) -> Callable[[], None]:
+        """Build the handler applying ``alu`` to the byte at ``address_of()``."""
+
+        load8 = self._load8
+        store8 = self._store8
+        if kind == "clear":
+            def handler() -> None:
+                store8(address_of(), alu())
+        elif kind == "test":
+            def handler() -> None:
+                alu(load8(address_of()))
+        else:
+            def handler() -> None:
+                address = address_of()
+                store8(address, alu(load8(address)))
+        return handler
 
-    def _increment_clock(self, ticks: int) -> None:
-        self._set_clock_count(self._get_clock_count() + ticks)
+    def _effective_address_reader(self, mode: int) -> Callable[[], int]:
+        """Return the operand-address fetcher for DIR (1), IND (2) or EXT (3)."""
 
-    def _fetch_op(self) -> int:
-        op = self._load8(self.registers.program_counter)
-        self.registers.program_counter = (self.registers.program_counter + 1) & 0xFFFF
-        return op
+        return (self._fetch_operand8, self._indexed_address, self._fetch_operand16)[mode - 1]
 
-    def _fetch_operand8(self) -> int:
-        value = self._load8(self.registers.program_counter)
-        self.registers.program_counter = (self.registers.program_counter + 1) & 0xFFFF
-        return value
+    def _make_store_op(self, accumulator: str, mode: int) -> Callable[[], None]:
+        """Build the STAA/STAB handler for ``accumulator`` in addressing ``mode``."""
 
-    def _fetch_operand16(self) -> int:
-        high = self._fetch_operand8()
-        low = self._fetch_operand8()
-        return ((high << 8) | low) & 0xFFFF
+        registers = self.registers
+        sta = self._sta
+        address_of = self._effective_address_reader(mode)
+        if accumulator == "acc_a":
+            def handler() -> None:
+                sta(address_of(), registers.acc_a)
+        else:
+            def handler() -> None:
+                sta(address_of(), registers.acc_b)
+        return handler
+
+    def _make_word_op(
+        self,
+        helper: Callable[[int], None],
+        kind: str,
+        mode: int,
+    ) -> Callable[[], None]:
+        """Build the handler for a 16-bit register instruction in ``mode``."""
+
+        if kind == "store":
+            address_of = self._effective_address_reader(mode)
+
+            def handler() -> None:
+                helper(address_of())
+        elif mode == 0:
+            fetch16 = self._fetch_operand16
+
+            def handler() -> None:
+                helper(fetch16())
+        else:
+            load16 = self._load16
+            address_of = self._effective_address_reader(mode)
+
+            def handler() -> None:
+                helper(load16(address_of()))
+        return handler
 
     def _rti(self) -> None:
         self._pop_all_registers()
 
     def _rts(self) -> None:
-        sp = (self.registers.stack_pointer + 2) & 0xFFFF
-        self.registers.program_counter = self._load16((sp - 1) & 0xFFFF)
-        self.registers.stack_pointer = sp
+        registers = self.registers
+        sp = (registers.stack_pointer + 2) & 0xFFFF
+        registers.program_counter = self._load16((sp - 1) & 0xFFFF)
+        registers.stack_pointer = sp
 
     def _swi(self) -> None:
         # M68PRM(D) §3.3.3: the value saved for the program counter is the
         # address of the SWI instruction plus one, which the opcode fetch
         # has already produced.
         self._push_all_registers()
-        self.flags.carry_i = True
+        self.flags.ccr |= 0x10
         self.registers.program_counter = self._load16(self.VECTOR_SWI)
 
     def _wai(self) -> None:
@@ -603,73 +1017,36 @@ class MB8861(CPU):
 
     def _init_opcode_table(self) -> None:
         self._opcode_table.clear()
+        self._register_opcode(self.OP_RTI_IMP, self._rti, 10)
+        self._register_opcode(self.OP_RTS_IMP, self._rts, 5)
+        self._register_opcode(self.OP_SWI_IMP, self._swi, 12)
+        self._register_opcode(self.OP_WAI_IMP, self._wai, 9)
+        operand_readers = (
+            self._fetch_operand8,
+            self._read_direct_operand,
+            self._read_indexed_operand,
+            self._read_extended_operand,
+        )
+        for low, helper, kind in self._ACC_ALU_OPS:
+            alu = getattr(self, helper)
+            for base, accumulator in ((0x80, "acc_a"), (0xC0, "acc_b")):
+                for mode, read in enumerate(operand_readers):
+                    self._register_opcode(
+                        base | mode << 4 | low,
+                        self._make_acc_op(alu, accumulator, kind, read),
+                        self._ACC_ALU_CYCLES[mode],
+                    )
         self._register_opcode(self.OP_ABA_IMP, self._opcode_aba, 2)
-        self._register_opcode(self.OP_ADDA_IMM, self._opcode_adda_imm, 2)
-        self._register_opcode(self.OP_ADDA_DIR, self._opcode_adda_dir, 3)
-        self._register_opcode(self.OP_ADDA_IND, self._opcode_adda_ind, 5)
-        self._register_opcode(self.OP_ADDA_EXT, self._opcode_adda_ext, 4)
-        self._register_opcode(self.OP_ADDB_IMM, self._opcode_addb_imm, 2)
-        self._register_opcode(self.OP_ADDB_DIR, self._opcode_addb_dir, 3)
-        self._register_opcode(self.OP_ADDB_IND, self._opcode_addb_ind, 5)
-        self._register_opcode(self.OP_ADDB_EXT, self._opcode_addb_ext, 4)
-        self._register_opcode(self.OP_ADCA_IMM, self._opcode_adca_imm, 2)
-        self._register_opcode(self.OP_ADCA_DIR, self._opcode_adca_dir, 3)
-        self._register_opcode(self.OP_ADCA_IND, self._opcode_adca_ind, 5)
-        self._register_opcode(self.OP_ADCA_EXT, self._opcode_adca_ext, 4)
-        self._register_opcode(self.OP_ADCB_IMM, self._opcode_adcb_imm, 2)
-        self._register_opcode(self.OP_ADCB_DIR, self._opcode_adcb_dir, 3)
-        self._register_opcode(self.OP_ADCB_IND, self._opcode_adcb_ind, 5)
-        self._register_opcode(self.OP_ADCB_EXT, self._opcode_adcb_ext, 4)
-        self._register_opcode(self.OP_ANDA_IMM, self._opcode_anda_imm, 2)
-        self._register_opcode(self.OP_ANDA_DIR, self._opcode_anda_dir, 3)
-        self._register_opcode(self.OP_ANDA_IND, self._opcode_anda_ind, 5)
-        self._register_opcode(self.OP_ANDA_EXT, self._opcode_anda_ext, 4)
-        self._register_opcode(self.OP_ANDB_IMM, self._opcode_andb_imm, 2)
-        self._register_opcode(self.OP_ANDB_DIR, self._opcode_andb_dir, 3)
-        self._register_opcode(self.OP_ANDB_IND, self._opcode_andb_ind, 5)
-        self._register_opcode(self.OP_ANDB_EXT, self._opcode_andb_ext, 4)
-        self._register_opcode(self.OP_BITA_IMM, self._opcode_bita_imm, 2)
-        self._register_opcode(self.OP_BITA_DIR, self._opcode_bita_dir, 3)
-        self._register_opcode(self.OP_BITA_IND, self._opcode_bita_ind, 5)
-        self._register_opcode(self.OP_BITA_EXT, self._opcode_bita_ext, 4)
-        self._register_opcode(self.OP_BITB_IMM, self._opcode_bitb_imm, 2)
-        self._register_opcode(self.OP_BITB_DIR, self._opcode_bitb_dir, 3)
-        self._register_opcode(self.OP_BITB_IND, self._opcode_bitb_ind, 5)
-        self._register_opcode(self.OP_BITB_EXT, self._opcode_bitb_ext, 4)
         self._register_opcode(self.OP_CBA_IMP, self._opcode_cba, 2)
         self._register_opcode(self.OP_CLRA_IMP, self._opcode_clra, 2)
         self._register_opcode(self.OP_CLRB_IMP, self._opcode_clrb, 2)
-        self._register_opcode(self.OP_CMPA_IMM, self._opcode_cmpa_imm, 2)
-        self._register_opcode(self.OP_CMPA_DIR, self._opcode_cmpa_dir, 3)
-        self._register_opcode(self.OP_CMPA_IND, self._opcode_cmpa_ind, 5)
-        self._register_opcode(self.OP_CMPA_EXT, self._opcode_cmpa_ext, 4)
-        self._register_opcode(self.OP_CMPB_IMM, self._opcode_cmpb_imm, 2)
-        self._register_opcode(self.OP_CMPB_DIR, self._opcode_cmpb_dir, 3)
-        self._register_opcode(self.OP_CMPB_IND, self._opcode_cmpb_ind, 5)
-        self._register_opcode(self.OP_CMPB_EXT, self._opcode_cmpb_ext, 4)
         self._register_opcode(self.OP_COMA_IMP, self._opcode_coma, 2)
         self._register_opcode(self.OP_COMB_IMP, self._opcode_comb, 2)
         self._register_opcode(self.OP_DAA_IMP, self._opcode_daa, 2)
         self._register_opcode(self.OP_DECA_IMP, self._opcode_deca, 2)
         self._register_opcode(self.OP_DECB_IMP, self._opcode_decb, 2)
-        self._register_opcode(self.OP_EORA_IMM, self._opcode_eora_imm, 2)
-        self._register_opcode(self.OP_EORA_DIR, self._opcode_eora_dir, 3)
-        self._register_opcode(self.OP_EORA_IND, self._opcode_eora_ind, 5)
-        self._register_opcode(self.OP_EORA_EXT, self._opcode_eora_ext, 4)
-        self._register_opcode(self.OP_EORB_IMM, self._opcode_eorb_imm, 2)
-        self._register_opcode(self.OP_EORB_DIR, self._opcode_eorb_dir, 3)
-        self._register_opcode(self.OP_EORB_IND, self._opcode_eorb_ind, 5)
-        self._register_opcode(self.OP_EORB_EXT, self._opcode_eorb_ext, 4)
         self._register_opcode(self.OP_INCA_IMP, self._opcode_inca, 2)
         self._register_opcode(self.OP_INCB_IMP, self._opcode_incb, 2)
-        self._register_opcode(self.OP_LDAA_IMM, self._opcode_ldaa_imm, 2)
-        self._register_opcode(self.OP_LDAA_DIR, self._opcode_ldaa_dir, 3)
-        self._register_opcode(self.OP_LDAA_IND, self._opcode_ldaa_ind, 5)
-        self._register_opcode(self.OP_LDAA_EXT, self._opcode_ldaa_ext, 4)
-        self._register_opcode(self.OP_LDAB_IMM, self._opcode_ldab_imm, 2)
-        self._register_opcode(self.OP_LDAB_DIR, self._opcode_ldab_dir, 3)
-        self._register_opcode(self.OP_LDAB_IND, self._opcode_ldab_ind, 5)
-        self._register_opcode(self.OP_LDAB_EXT, self._opcode_ldab_ext, 4)
         self._register_opcode(self.OP_LSRA_IMP, self._opcode_lsra, 2)
         self._register_opcode(self.OP_LSRB_IMP, self._opcode_lsrb, 2)
         self._register_opcode(self.OP_ASLA_IMP, self._opcode_asla, 2)
@@ -682,91 +1059,43 @@ class MB8861(CPU):
         self._register_opcode(self.OP_RORB_IMP, self._opcode_rorb, 2)
         self._register_opcode(self.OP_NEGA_IMP, self._opcode_nega, 2)
         self._register_opcode(self.OP_NEGB_IMP, self._opcode_negb, 2)
-        self._register_opcode(self.OP_ORAA_IMM, self._opcode_oraa_imm, 2)
-        self._register_opcode(self.OP_ORAA_DIR, self._opcode_oraa_dir, 3)
-        self._register_opcode(self.OP_ORAA_IND, self._opcode_oraa_ind, 5)
-        self._register_opcode(self.OP_ORAA_EXT, self._opcode_oraa_ext, 4)
-        self._register_opcode(self.OP_ORAB_IMM, self._opcode_orab_imm, 2)
-        self._register_opcode(self.OP_ORAB_DIR, self._opcode_orab_dir, 3)
-        self._register_opcode(self.OP_ORAB_IND, self._opcode_orab_ind, 5)
-        self._register_opcode(self.OP_ORAB_EXT, self._opcode_orab_ext, 4)
         self._register_opcode(self.OP_PSHA_IMP, self._opcode_psha, 4)
         self._register_opcode(self.OP_PSHB_IMP, self._opcode_pshb, 4)
         self._register_opcode(self.OP_PULA_IMP, self._opcode_pula, 4)
         self._register_opcode(self.OP_PULB_IMP, self._opcode_pulb, 4)
         self._register_opcode(self.OP_SBA_IMP, self._opcode_sba, 2)
-        self._register_opcode(self.OP_SUBA_IMM, self._opcode_suba_imm, 2)
-        self._register_opcode(self.OP_SUBA_DIR, self._opcode_suba_dir, 3)
-        self._register_opcode(self.OP_SUBA_IND, self._opcode_suba_ind, 5)
-        self._register_opcode(self.OP_SUBA_EXT, self._opcode_suba_ext, 4)
-        self._register_opcode(self.OP_SUBB_IMM, self._opcode_subb_imm, 2)
-        self._register_opcode(self.OP_SUBB_DIR, self._opcode_subb_dir, 3)
-        self._register_opcode(self.OP_SUBB_IND, self._opcode_subb_ind, 5)
-        self._register_opcode(self.OP_SUBB_EXT, self._opcode_subb_ext, 4)
-        self._register_opcode(self.OP_SBCA_IMM, self._opcode_sbca_imm, 2)
-        self._register_opcode(self.OP_SBCA_DIR, self._opcode_sbca_dir, 3)
-        self._register_opcode(self.OP_SBCA_IND, self._opcode_sbca_ind, 5)
-        self._register_opcode(self.OP_SBCA_EXT, self._opcode_sbca_ext, 4)
-        self._register_opcode(self.OP_SBCB_IMM, self._opcode_sbcb_imm, 2)
-        self._register_opcode(self.OP_SBCB_DIR, self._opcode_sbcb_dir, 3)
-        self._register_opcode(self.OP_SBCB_IND, self._opcode_sbcb_ind, 5)
-        self._register_opcode(self.OP_SBCB_EXT, self._opcode_sbcb_ext, 4)
         self._register_opcode(self.OP_TAB_IMP, self._opcode_tab, 2)
         self._register_opcode(self.OP_TBA_IMP, self._opcode_tba, 2)
         self._register_opcode(self.OP_TSTA_IMP, self._opcode_tsta, 2)
         self._register_opcode(self.OP_TSTB_IMP, self._opcode_tstb, 2)
-        self._register_opcode(self.OP_STAA_DIR, self._opcode_staa_dir, 4)
-        self._register_opcode(self.OP_STAA_IND, self._opcode_staa_ind, 6)
-        self._register_opcode(self.OP_STAA_EXT, self._opcode_staa_ext, 5)
-        self._register_opcode(self.OP_STAB_DIR, self._opcode_stab_dir, 4)
-        self._register_opcode(self.OP_STAB_IND, self._opcode_stab_ind, 6)
-        self._register_opcode(self.OP_STAB_EXT, self._opcode_stab_ext, 5)
-        self._register_opcode(self.OP_CPX_IMM, self._opcode_cpx_imm, 3)
-        self._register_opcode(self.OP_CPX_DIR, self._opcode_cpx_dir, 4)
-        self._register_opcode(self.OP_CPX_IND, self._opcode_cpx_ind, 6)
-        self._register_opcode(self.OP_CPX_EXT, self._opcode_cpx_ext, 5)
+        for base, accumulator in ((0x80, "acc_a"), (0xC0, "acc_b")):
+            for mode in (1, 2, 3):
+                self._register_opcode(
+                    base | mode << 4 | 0x7,
+                    self._make_store_op(accumulator, mode),
+                    self._STORE_CYCLES[mode],
+                )
+        for base, low, helper, kind in self._WORD_OPS:
+            for mode in ((0, 1, 2, 3) if kind == "load" else (1, 2, 3)):
+                self._register_opcode(
+                    base | mode << 4 | low,
+                    self._make_word_op(getattr(self, helper), kind, mode),
+                    (self._WORD_LOAD_CYCLES if kind == "load" else self._WORD_STORE_CYCLES)[mode],
+                )
         self._register_opcode(self.OP_DEX_IMP, self._opcode_dex, 4)
         self._register_opcode(self.OP_DES_IMP, self._opcode_des, 4)
         self._register_opcode(self.OP_INX_IMP, self._opcode_inx, 4)
         self._register_opcode(self.OP_INS_IMP, self._opcode_ins, 4)
-        self._register_opcode(self.OP_LDX_IMM, self._opcode_ldx_imm, 3)
-        self._register_opcode(self.OP_LDX_DIR, self._opcode_ldx_dir, 4)
-        self._register_opcode(self.OP_LDX_IND, self._opcode_ldx_ind, 6)
-        self._register_opcode(self.OP_LDX_EXT, self._opcode_ldx_ext, 5)
-        self._register_opcode(self.OP_LDS_IMM, self._opcode_lds_imm, 3)
-        self._register_opcode(self.OP_LDS_DIR, self._opcode_lds_dir, 4)
-        self._register_opcode(self.OP_LDS_IND, self._opcode_lds_ind, 6)
-        self._register_opcode(self.OP_LDS_EXT, self._opcode_lds_ext, 5)
-        self._register_opcode(self.OP_STX_DIR, self._opcode_stx_dir, 5)
-        self._register_opcode(self.OP_STX_IND, self._opcode_stx_ind, 7)
-        self._register_opcode(self.OP_STX_EXT, self._opcode_stx_ext, 6)
-        self._register_opcode(self.OP_STS_DIR, self._opcode_sts_dir, 5)
-        self._register_opcode(self.OP_STS_IND, self._opcode_sts_ind, 7)
-        self._register_opcode(self.OP_STS_EXT, self._opcode_sts_ext, 6)
         self._register_opcode(self.OP_TXS_IMP, self._opcode_txs, 4)
         self._register_opcode(self.OP_TSX_IMP, self._opcode_tsx, 4)
-        self._register_opcode(self.OP_ASL_IND, self._opcode_asl_ind, 7)
-        self._register_opcode(self.OP_ASL_EXT, self._opcode_asl_ext, 6)
-        self._register_opcode(self.OP_ASR_IND, self._opcode_asr_ind, 7)
-        self._register_opcode(self.OP_ASR_EXT, self._opcode_asr_ext, 6)
-        self._register_opcode(self.OP_CLR_IND, self._opcode_clr_ind, 7)
-        self._register_opcode(self.OP_CLR_EXT, self._opcode_clr_ext, 6)
-        self._register_opcode(self.OP_COM_IND, self._opcode_com_ind, 7)
-        self._register_opcode(self.OP_COM_EXT, self._opcode_com_ext, 6)
-        self._register_opcode(self.OP_DEC_IND, self._opcode_dec_ind, 7)
-        self._register_opcode(self.OP_DEC_EXT, self._opcode_dec_ext, 6)
-        self._register_opcode(self.OP_INC_IND, self._opcode_inc_ind, 7)
-        self._register_opcode(self.OP_INC_EXT, self._opcode_inc_ext, 6)
-        self._register_opcode(self.OP_LSR_IND, self._opcode_lsr_ind, 7)
-        self._register_opcode(self.OP_LSR_EXT, self._opcode_lsr_ext, 6)
-        self._register_opcode(self.OP_NEG_IND, self._opcode_neg_ind, 7)
-        self._register_opcode(self.OP_NEG_EXT, self._opcode_neg_ext, 6)
-        self._register_opcode(self.OP_ROL_IND, self._opcode_rol_ind, 7)
-        self._register_opcode(self.OP_ROL_EXT, self._opcode_rol_ext, 6)
-        self._register_opcode(self.OP_ROR_IND, self._opcode_ror_ind, 7)
-        self._register_opcode(self.OP_ROR_EXT, self._opcode_ror_ext, 6)
-        self._register_opcode(self.OP_TST_IND, self._opcode_tst_ind, 7)
-        self._register_opcode(self.OP_TST_EXT, self._opcode_tst_ext, 6)
+        for low, helper, kind in self._MEM_RMW_OPS:
+            alu = getattr(self, helper)
+            for mode, address_of in ((0x60, self._indexed_address), (0x70, self._fetch_operand16)):
+                self._register_opcode(
+                    mode | low,
+                    self._make_rmw_op(alu, kind, address_of),
+                    7 if mode == 0x60 else 6,
+                )
         self._register_opcode(self.OP_NOP_IMP, self._opcode_nop, 2)
         self._register_opcode(self.OP_CLC_IMP, self._opcode_clc, 2)
         self._register_opcode(self.OP_CLI_IMP, self._opcode_cli, 2)
@@ -776,21 +1105,10 @@ class MB8861(CPU):
         self._register_opcode(self.OP_SEV_IMP, self._opcode_sev, 2)
         self._register_opcode(self.OP_TAP_IMP, self._opcode_tap, 2)
         self._register_opcode(self.OP_TPA_IMP, self._opcode_tpa, 2)
-        self._register_opcode(self.OP_BRA_REL, self._opcode_bra, 4)
-        self._register_opcode(self.OP_BCC_REL, self._opcode_bcc, 4)
-        self._register_opcode(self.OP_BCS_REL, self._opcode_bcs, 4)
-        self._register_opcode(self.OP_BEQ_REL, self._opcode_beq, 4)
-        self._register_opcode(self.OP_BGE_REL, self._opcode_bge, 4)
-        self._register_opcode(self.OP_BGT_REL, self._opcode_bgt, 4)
-        self._register_opcode(self.OP_BHI_REL, self._opcode_bhi, 4)
-        self._register_opcode(self.OP_BLE_REL, self._opcode_ble, 4)
-        self._register_opcode(self.OP_BLS_REL, self._opcode_bls, 4)
-        self._register_opcode(self.OP_BLT_REL, self._opcode_blt, 4)
-        self._register_opcode(self.OP_BMI_REL, self._opcode_bmi, 4)
-        self._register_opcode(self.OP_BNE_REL, self._opcode_bne, 4)
-        self._register_opcode(self.OP_BVC_REL, self._opcode_bvc, 4)
-        self._register_opcode(self.OP_BVS_REL, self._opcode_bvs, 4)
-        self._register_opcode(self.OP_BPL_REL, self._opcode_bpl, 4)
+        for opcode in range(0x20, 0x30):
+            taken = self._BRANCH_TAKEN[opcode & 0x0F]
+            if taken is not None:
+                self._register_opcode(opcode, self._make_branch(taken), 4)
         self._register_opcode(self.OP_BSR_REL, self._opcode_bsr, 8)
         self._register_opcode(self.OP_JMP_IND, self._opcode_jmp_ind, 4)
         self._register_opcode(self.OP_JMP_EXT, self._opcode_jmp_ext, 3)
@@ -803,174 +1121,22 @@ class MB8861(CPU):
         self._register_opcode(self.OP_XIM_IND, self._opcode_xim_ind, 8)
         self._register_opcode(self.OP_TMM_IND, self._opcode_tmm_ind, 7)
 
+        # Java 実装では未定義オペコードを 1 クロックの NOP として扱う
+        undefined = (self._opcode_nop, 1)
+        entries = [self._opcode_table.get(opcode, undefined) for opcode in range(256)]
+        self._op_handlers = tuple(handler for handler, _ in entries)
+        self._op_cycles = tuple(cycles for _, cycles in entries)
+
     def _register_opcode(self, opcode: int, handler: Callable[[], None], cycles: int) -> None:
         self._opcode_table[opcode & 0xFF] = (handler, cycles)
 
     def _opcode_aba(self) -> None:
-        self.registers.acc_a = self._add8(self.registers.acc_a, self.registers.acc_b)
-
-    def _opcode_adda_imm(self) -> None:
-        operand = self._fetch_operand8()
-        self.registers.acc_a = self._add8(self.registers.acc_a, operand)
-
-    def _opcode_adda_dir(self) -> None:
-        address = self._fetch_operand8()
-        value = self._load8(address)
-        self.registers.acc_a = self._add8(self.registers.acc_a, value)
-
-    def _opcode_adda_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = (self.registers.index + offset) & 0xFFFF
-        value = self._load8(address)
-        self.registers.acc_a = self._add8(self.registers.acc_a, value)
-
-    def _opcode_adda_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load8(address)
-        self.registers.acc_a = self._add8(self.registers.acc_a, value)
-
-    def _opcode_addb_imm(self) -> None:
-        operand = self._fetch_operand8()
-        self.registers.acc_b = self._add8(self.registers.acc_b, operand)
-
-    def _opcode_addb_dir(self) -> None:
-        address = self._fetch_operand8()
-        value = self._load8(address)
-        self.registers.acc_b = self._add8(self.registers.acc_b, value)
-
-    def _opcode_addb_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = (self.registers.index + offset) & 0xFFFF
-        value = self._load8(address)
-        self.registers.acc_b = self._add8(self.registers.acc_b, value)
-
-    def _opcode_addb_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load8(address)
-        self.registers.acc_b = self._add8(self.registers.acc_b, value)
-
-    def _opcode_adca_imm(self) -> None:
-        operand = self._fetch_operand8()
-        self.registers.acc_a = self._adc8(self.registers.acc_a, operand)
-
-    def _opcode_adca_dir(self) -> None:
-        address = self._fetch_operand8()
-        value = self._load8(address)
-        self.registers.acc_a = self._adc8(self.registers.acc_a, value)
-
-    def _opcode_adca_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = (self.registers.index + offset) & 0xFFFF
-        value = self._load8(address)
-        self.registers.acc_a = self._adc8(self.registers.acc_a, value)
-
-    def _opcode_adca_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load8(address)
-        self.registers.acc_a = self._adc8(self.registers.acc_a, value)
-
-    def _opcode_adcb_imm(self) -> None:
-        operand = self._fetch_operand8()
-        self.registers.acc_b = self._adc8(self.registers.acc_b, operand)
-
-    def _opcode_adcb_dir(self) -> None:
-        address = self._fetch_operand8()
-        value = self._load8(address)
-        self.registers.acc_b = self._adc8(self.registers.acc_b, value)
-
-    def _opcode_adcb_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = (self.registers.index + offset) & 0xFFFF
-        value = self._load8(address)
-        self.registers.acc_b = self._adc8(self.registers.acc_b, value)
-
-    def _opcode_adcb_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load8(address)
-        self.registers.acc_b = self._adc8(self.registers.acc_b, value)
-
-    def _opcode_anda_imm(self) -> None:
-        operand = self._fetch_operand8()
-        self.registers.acc_a = self._and8(self.registers.acc_a, operand)
-
-    def _opcode_anda_dir(self) -> None:
-        address = self._fetch_operand8()
-        value = self._load8(address)
-        self.registers.acc_a = self._and8(self.registers.acc_a, value)
-
-    def _opcode_anda_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = (self.registers.index + offset) & 0xFFFF
-        value = self._load8(address)
-        self.registers.acc_a = self._and8(self.registers.acc_a, value)
-
-    def _opcode_anda_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load8(address)
-        self.registers.acc_a = self._and8(self.registers.acc_a, value)
-
-    def _opcode_andb_imm(self) -> None:
-        operand = self._fetch_operand8()
-        self.registers.acc_b = self._and8(self.registers.acc_b, operand)
-
-    def _opcode_andb_dir(self) -> None:
-        address = self._fetch_operand8()
-        value = self._load8(address)
-        self.registers.acc_b = self._and8(self.registers.acc_b, value)
-
-    def _opcode_andb_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = (self.registers.index + offset) & 0xFFFF
-        value = self._load8(address)
-        self.registers.acc_b = self._and8(self.registers.acc_b, value)
-
-    def _opcode_andb_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load8(address)
-        self.registers.acc_b = self._and8(self.registers.acc_b, value)
-
-    def _opcode_bita_imm(self) -> None:
-        operand = self._fetch_operand8()
-        self._bit8(self.registers.acc_a, operand)
-
-    def _opcode_bita_dir(self) -> None:
-        address = self._fetch_operand8()
-        value = self._load8(address)
-        self._bit8(self.registers.acc_a, value)
-
-    def _opcode_bita_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = (self.registers.index + offset) & 0xFFFF
-        value = self._load8(address)
-        self._bit8(self.registers.acc_a, value)
-
-    def _opcode_bita_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load8(address)
-        self._bit8(self.registers.acc_a, value)
-
-    def _opcode_bitb_imm(self) -> None:
-        operand = self._fetch_operand8()
-        self._bit8(self.registers.acc_b, operand)
-
-    def _opcode_bitb_dir(self) -> None:
-        address = self._fetch_operand8()
-        value = self._load8(address)
-        self._bit8(self.registers.acc_b, value)
-
-    def _opcode_bitb_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = (self.registers.index + offset) & 0xFFFF
-        value = self._load8(address)
-        self._bit8(self.registers.acc_b, value)
-
-    def _opcode_bitb_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load8(address)
-        self._bit8(self.registers.acc_b, value)
+        registers = self.registers
+        registers.acc_a = self._add8(registers.acc_a, registers.acc_b)
 
     def _opcode_cba(self) -> None:
-        self._cmp8(self.registers.acc_a, self.registers.acc_b)
+        registers = self.registers
+        self._sub8(registers.acc_a, registers.acc_b)
 
     def _opcode_clra(self) -> None:
         self.registers.acc_a = self._clr()
@@ -978,46 +1144,6 @@ class MB8861(CPU):
     def _opcode_clrb(self) -> None:
         self.registers.acc_b = self._clr()
 
-    def _opcode_cmpa_imm(self) -> None:
-        operand = self._fetch_operand8()
-        self._cmp8(self.registers.acc_a, operand)
-
-    def _opcode_cmpa_dir(self) -> None:
-        address = self._fetch_operand8()
-        value = self._load8(address)
-        self._cmp8(self.registers.acc_a, value)
-
-    def _opcode_cmpa_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = (self.registers.index + offset) & 0xFFFF
-        value = self._load8(address)
-        self._cmp8(self.registers.acc_a, value)
-
-    def _opcode_cmpa_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load8(address)
-        self._cmp8(self.registers.acc_a, value)
-
-    def _opcode_cmpb_imm(self) -> None:
-        operand = self._fetch_operand8()
-        self._cmp8(self.registers.acc_b, operand)
-
-    def _opcode_cmpb_dir(self) -> None:
-        address = self._fetch_operand8()
-        value = self._load8(address)
-        self._cmp8(self.registers.acc_b, value)
-
-    def _opcode_cmpb_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = (self.registers.index + offset) & 0xFFFF
-        value = self._load8(address)
-        self._cmp8(self.registers.acc_b, value)
-
-    def _opcode_cmpb_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load8(address)
-        self._cmp8(self.registers.acc_b, value)
-
     def _opcode_coma(self) -> None:
         self.registers.acc_a = self._com(self.registers.acc_a)
 
@@ -1025,66 +1151,27 @@ class MB8861(CPU):
         self.registers.acc_b = self._com(self.registers.acc_b)
 
     def _opcode_daa(self) -> None:
-        original = self.registers.acc_a & 0xFF
-        temp = original
-        if (temp & 0x0F) >= 0x0A or self.flags.carry_h:
-            temp += 0x06
-        if (temp & 0xF0) >= 0xA0:
-            temp += 0x60
-        result = temp & 0xFF
-        cn = result & 0x80 != 0
-        self.flags.carry_n = cn
-        self.flags.carry_z = result == 0
-        signed_original = self._to_signed8(original)
-        self.flags.carry_v = (signed_original > 0 and cn) or (signed_original < 0 and not cn)
-        self.flags.carry_c = ((original & 0xF0) >= 0xA0) or self.flags.carry_c
+        flags = self.flags
+        ccr = flags.ccr
+        result, bits = self._DAA_TABLE[self.registers.acc_a << 1 | (ccr >> 5 & 1)]
+        flags.ccr = (ccr & 0xF1) | bits
         self.registers.acc_a = result
 
     def _opcode_deca(self) -> None:
-        self.registers.acc_a = self._dec(self.registers.acc_a)
+        registers = self.registers
+        registers.acc_a = acc_a = self._dec(registers.acc_a)
+        if acc_a:
+            rounds = self._countdown_rounds(acc_a, 6)
+            if rounds:
+                registers.acc_a = self._dec(acc_a - rounds + 1)
 
     def _opcode_decb(self) -> None:
-        self.registers.acc_b = self._dec(self.registers.acc_b)
-
-    def _opcode_eora_imm(self) -> None:
-        operand = self._fetch_operand8()
-        self.registers.acc_a = self._eor8(self.registers.acc_a, operand)
-
-    def _opcode_eora_dir(self) -> None:
-        address = self._fetch_operand8()
-        value = self._load8(address)
-        self.registers.acc_a = self._eor8(self.registers.acc_a, value)
-
-    def _opcode_eora_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = (self.registers.index + offset) & 0xFFFF
-        value = self._load8(address)
-        self.registers.acc_a = self._eor8(self.registers.acc_a, value)
-
-    def _opcode_eora_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load8(address)
-        self.registers.acc_a = self._eor8(self.registers.acc_a, value)
-
-    def _opcode_eorb_imm(self) -> None:
-        operand = self._fetch_operand8()
-        self.registers.acc_b = self._eor8(self.registers.acc_b, operand)
-
-    def _opcode_eorb_dir(self) -> None:
-        address = self._fetch_operand8()
-        value = self._load8(address)
-        self.registers.acc_b = self._eor8(self.registers.acc_b, value)
-
-    def _opcode_eorb_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = (self.registers.index + offset) & 0xFFFF
-        value = self._load8(address)
-        self.registers.acc_b = self._eor8(self.registers.acc_b, value)
-
-    def _opcode_eorb_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load8(address)
-        self.registers.acc_b = self._eor8(self.registers.acc_b, value)
+        registers = self.registers
+        registers.acc_b = acc_b = self._dec(registers.acc_b)
+        if acc_b:
+            rounds = self._countdown_rounds(acc_b, 6)
+            if rounds:
+                registers.acc_b = self._dec(acc_b - rounds + 1)
 
     def _opcode_inca(self) -> None:
         self.registers.acc_a = self._inc(self.registers.acc_a)
@@ -1092,46 +1179,6 @@ class MB8861(CPU):
     def _opcode_incb(self) -> None:
         self.registers.acc_b = self._inc(self.registers.acc_b)
 
-    def _opcode_ldaa_imm(self) -> None:
-        operand = self._fetch_operand8()
-        self.registers.acc_a = self._lda(operand)
-
-    def _opcode_ldaa_dir(self) -> None:
-        address = self._fetch_operand8()
-        value = self._load8(address)
-        self.registers.acc_a = self._lda(value)
-
-    def _opcode_ldaa_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = (self.registers.index + offset) & 0xFFFF
-        value = self._load8(address)
-        self.registers.acc_a = self._lda(value)
-
-    def _opcode_ldaa_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load8(address)
-        self.registers.acc_a = self._lda(value)
-
-    def _opcode_ldab_imm(self) -> None:
-        operand = self._fetch_operand8()
-        self.registers.acc_b = self._lda(operand)
-
-    def _opcode_ldab_dir(self) -> None:
-        address = self._fetch_operand8()
-        value = self._load8(address)
-        self.registers.acc_b = self._lda(value)
-
-    def _opcode_ldab_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = (self.registers.index + offset) & 0xFFFF
-        value = self._load8(address)
-        self.registers.acc_b = self._lda(value)
-
-    def _opcode_ldab_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load8(address)
-        self.registers.acc_b = self._lda(value)
-
     def _opcode_lsra(self) -> None:
         self.registers.acc_a = self._lsr(self.registers.acc_a)
 
@@ -1168,46 +1215,6 @@ class MB8861(CPU):
     def _opcode_negb(self) -> None:
         self.registers.acc_b = self._neg(self.registers.acc_b)
 
-    def _opcode_oraa_imm(self) -> None:
-        operand = self._fetch_operand8()
-        self.registers.acc_a = self._ora(self.registers.acc_a, operand)
-
-    def _opcode_oraa_dir(self) -> None:
-        address = self._fetch_operand8()
-        value = self._load8(address)
-        self.registers.acc_a = self._ora(self.registers.acc_a, value)
-
-    def _opcode_oraa_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = (self.registers.index + offset) & 0xFFFF
-        value = self._load8(address)
-        self.registers.acc_a = self._ora(self.registers.acc_a, value)
-
-    def _opcode_oraa_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load8(address)
-        self.registers.acc_a = self._ora(self.registers.acc_a, value)
-
-    def _opcode_orab_imm(self) -> None:
-        operand = self._fetch_operand8()
-        self.registers.acc_b = self._ora(self.registers.acc_b, operand)
-
-    def _opcode_orab_dir(self) -> None:
-        address = self._fetch_operand8()
-        value = self._load8(address)
-        self.registers.acc_b = self._ora(self.registers.acc_b, value)
-
-    def _opcode_orab_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = (self.registers.index + offset) & 0xFFFF
-        value = self._load8(address)
-        self.registers.acc_b = self._ora(self.registers.acc_b, value)
-
-    def _opcode_orab_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load8(address)
-        self.registers.acc_b = self._ora(self.registers.acc_b, value)
-
     def _opcode_psha(self) -> None:
         self._push8(self.registers.acc_a)
 
@@ -1215,105 +1222,20 @@ class MB8861(CPU):
         self._push8(self.registers.acc_b)
 
     def _opcode_pula(self) -> None:
-        self.registers.acc_a = self._pull8() & 0xFF
+        self.registers.acc_a = self._pull8()
 
     def _opcode_pulb(self) -> None:
-        self.registers.acc_b = self._pull8() & 0xFF
+        self.registers.acc_b = self._pull8()
 
     def _opcode_sba(self) -> None:
-        self.registers.acc_a = self._sub8(self.registers.acc_a, self.registers.acc_b)
-
-    def _opcode_suba_imm(self) -> None:
-        operand = self._fetch_operand8()
-        self.registers.acc_a = self._sub8(self.registers.acc_a, operand)
-
-    def _opcode_suba_dir(self) -> None:
-        address = self._fetch_operand8()
-        value = self._load8(address)
-        self.registers.acc_a = self._sub8(self.registers.acc_a, value)
-
-    def _opcode_suba_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = (self.registers.index + offset) & 0xFFFF
-        value = self._load8(address)
-        self.registers.acc_a = self._sub8(self.registers.acc_a, value)
-
-    def _opcode_suba_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load8(address)
-        self.registers.acc_a = self._sub8(self.registers.acc_a, value)
-
-    def _opcode_subb_imm(self) -> None:
-        operand = self._fetch_operand8()
-        self.registers.acc_b = self._sub8(self.registers.acc_b, operand)
-
-    def _opcode_subb_dir(self) -> None:
-        address = self._fetch_operand8()
-        value = self._load8(address)
-        self.registers.acc_b = self._sub8(self.registers.acc_b, value)
-
-    def _opcode_subb_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = (self.registers.index + offset) & 0xFFFF
-        value = self._load8(address)
-        self.registers.acc_b = self._sub8(self.registers.acc_b, value)
-
-    def _opcode_subb_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load8(address)
-        self.registers.acc_b = self._sub8(self.registers.acc_b, value)
-
-    def _opcode_sbca_imm(self) -> None:
-        operand = self._fetch_operand8()
-        self.registers.acc_a = self._sbc8(self.registers.acc_a, operand)
-
-    def _opcode_sbca_dir(self) -> None:
-        address = self._fetch_operand8()
-        value = self._load8(address)
-        self.registers.acc_a = self._sbc8(self.registers.acc_a, value)
-
-    def _opcode_sbca_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = (self.registers.index + offset) & 0xFFFF
-        value = self._load8(address)
-        self.registers.acc_a = self._sbc8(self.registers.acc_a, value)
-
-    def _opcode_sbca_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load8(address)
-        self.registers.acc_a = self._sbc8(self.registers.acc_a, value)
-
-    def _opcode_sbcb_imm(self) -> None:
-        operand = self._fetch_operand8()
-        self.registers.acc_b = self._sbc8(self.registers.acc_b, operand)
-
-    def _opcode_sbcb_dir(self) -> None:
-        address = self._fetch_operand8()
-        value = self._load8(address)
-        self.registers.acc_b = self._sbc8(self.registers.acc_b, value)
-
-    def _opcode_sbcb_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = (self.registers.index + offset) & 0xFFFF
-        value = self._load8(address)
-        self.registers.acc_b = self._sbc8(self.registers.acc_b, value)
-
-    def _opcode_sbcb_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load8(address)
-        self.registers.acc_b = self._sbc8(self.registers.acc_b, value)
+        registers = self.registers
+        registers.acc_a = self._sub8(registers.acc_a, registers.acc_b)
 
     def _opcode_tab(self) -> None:
-        self.registers.acc_b = self.registers.acc_a & 0xFF
-        self.flags.carry_n = self.registers.acc_b & 0x80 != 0
-        self.flags.carry_z = self.registers.acc_b == 0
-        self.flags.carry_v = False
+        self.registers.acc_b = self._lda(self.registers.acc_a)
 
     def _opcode_tba(self) -> None:
-        self.registers.acc_a = self.registers.acc_b & 0xFF
-        self.flags.carry_n = self.registers.acc_a & 0x80 != 0
-        self.flags.carry_z = self.registers.acc_a == 0
-        self.flags.carry_v = False
+        self.registers.acc_a = self._lda(self.registers.acc_b)
 
     def _opcode_tsta(self) -> None:
         self._tst(self.registers.acc_a)
@@ -1321,129 +1243,58 @@ class MB8861(CPU):
     def _opcode_tstb(self) -> None:
         self._tst(self.registers.acc_b)
 
-    def _opcode_staa_dir(self) -> None:
-        address = self._calc_direct_address(self._fetch_operand8())
-        self._sta(address, self.registers.acc_a)
-
-    def _opcode_staa_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = self._calc_indexed_address(offset)
-        self._sta(address, self.registers.acc_a)
-
-    def _opcode_staa_ext(self) -> None:
-        address = self._fetch_operand16()
-        self._sta(address, self.registers.acc_a)
-
-    def _opcode_stab_dir(self) -> None:
-        address = self._calc_direct_address(self._fetch_operand8())
-        self._sta(address, self.registers.acc_b)
-
-    def _opcode_stab_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = self._calc_indexed_address(offset)
-        self._sta(address, self.registers.acc_b)
-
-    def _opcode_stab_ext(self) -> None:
-        address = self._fetch_operand16()
-        self._sta(address, self.registers.acc_b)
-
-    def _opcode_cpx_imm(self) -> None:
-        operand = self._fetch_operand16()
-        self._cpx(operand)
-
-    def _opcode_cpx_dir(self) -> None:
-        address = self._calc_direct_address(self._fetch_operand8())
-        value = self._load16(address)
-        self._cpx(value)
-
-    def _opcode_cpx_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = self._calc_indexed_address(offset)
-        value = self._load16(address)
-        self._cpx(value)
-
-    def _opcode_cpx_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load16(address)
-        self._cpx(value)
-
     def _opcode_dex(self) -> None:
-        self._dex()
+        registers = self.registers
+        registers.index = index = (registers.index - 1) & 0xFFFF
+        if not index:
+            self.flags.ccr |= 0x04
+            return
+        self.flags.ccr &= ~0x04
+        rounds = self._countdown_rounds(index, 8)
+        if rounds:
+            registers.index = index - rounds + 1
+            self._dex()
+
+    def _countdown_rounds(self, counter: int, loop_cycles: int) -> int:
+        """Retire whole rounds of a ``DEC/DEX`` + ``BNE *-1`` delay loop at once.
+
+        Called after the decrement has run, with ``counter`` its non-zero
+        result. When the next instruction is ``BNE`` back onto the decrement,
+        the loop touches nothing but the counter and Z/N/V until the counter
+        reaches zero, so up to ``counter`` rounds that would all start before
+        the end of this execute() call are charged to the clock in one step.
+        Returns the number of rounds; the caller applies that many decrements.
+        """
+
+        if self.status.pending:
+            return 0
+        pc = self.registers.program_counter
+        page = self._read_pages[pc >> 8]
+        offset = pc & 0xFF
+        if page is None or offset == 0xFF or page[offset] != 0x26 or page[offset + 1] != 0xFD:
+            return 0
+        computer = self.computer
+        # The decrement started at computer.clock_count; round k's decrement
+        # starts at that count + k * loop_cycles and must precede the target.
+        rounds = min(counter, (self._target_clock - computer.clock_count - 1) // loop_cycles)
+        if rounds <= 0:
+            return 0
+        computer.clock_count += rounds * loop_cycles
+        return rounds
 
     def _opcode_des(self) -> None:
-        self._des()
+        registers = self.registers
+        registers.stack_pointer = (registers.stack_pointer - 1) & 0xFFFF
 
     def _opcode_inx(self) -> None:
-        self._inx()
+        registers = self.registers
+        registers.index = index = (registers.index + 1) & 0xFFFF
+        flags = self.flags
+        flags.ccr = (flags.ccr & ~0x04) | (0 if index else 0x04)
 
     def _opcode_ins(self) -> None:
-        self._ins()
-
-    def _opcode_ldx_imm(self) -> None:
-        operand = self._fetch_operand16()
-        self._ldx(operand)
-
-    def _opcode_ldx_dir(self) -> None:
-        address = self._calc_direct_address(self._fetch_operand8())
-        value = self._load16(address)
-        self._ldx(value)
-
-    def _opcode_ldx_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = self._calc_indexed_address(offset)
-        value = self._load16(address)
-        self._ldx(value)
-
-    def _opcode_ldx_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load16(address)
-        self._ldx(value)
-
-    def _opcode_lds_imm(self) -> None:
-        operand = self._fetch_operand16()
-        self._lds(operand)
-
-    def _opcode_lds_dir(self) -> None:
-        address = self._calc_direct_address(self._fetch_operand8())
-        value = self._load16(address)
-        self._lds(value)
-
-    def _opcode_lds_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = self._calc_indexed_address(offset)
-        value = self._load16(address)
-        self._lds(value)
-
-    def _opcode_lds_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load16(address)
-        self._lds(value)
-
-    def _opcode_stx_dir(self) -> None:
-        address = self._calc_direct_address(self._fetch_operand8())
-        self._stx(address)
-
-    def _opcode_stx_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = self._calc_indexed_address(offset)
-        self._stx(address)
-
-    def _opcode_stx_ext(self) -> None:
-        address = self._fetch_operand16()
-        self._stx(address)
-
-    def _opcode_sts_dir(self) -> None:
-        address = self._calc_direct_address(self._fetch_operand8())
-        self._sts(address)
-
-    def _opcode_sts_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = self._calc_indexed_address(offset)
-        self._sts(address)
-
-    def _opcode_sts_ext(self) -> None:
-        address = self._fetch_operand16()
-        self._sts(address)
+        registers = self.registers
+        registers.stack_pointer = (registers.stack_pointer + 1) & 0xFFFF
 
     def _opcode_txs(self) -> None:
         self.registers.stack_pointer = (self.registers.index - 1) & 0xFFFF
@@ -1454,258 +1305,90 @@ class MB8861(CPU):
     def _opcode_nop(self) -> None:
         pass
 
-    def _opcode_asl_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = self._calc_indexed_address(offset)
-        value = self._load8(address)
-        self._store8(address, self._asl(value))
-
-    def _opcode_asl_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load8(address)
-        self._store8(address, self._asl(value))
-
-    def _opcode_asr_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = self._calc_indexed_address(offset)
-        value = self._load8(address)
-        self._store8(address, self._asr(value))
-
-    def _opcode_asr_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load8(address)
-        self._store8(address, self._asr(value))
-
-    def _opcode_clr_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = self._calc_indexed_address(offset)
-        self._store8(address, self._clr())
-
-    def _opcode_clr_ext(self) -> None:
-        address = self._fetch_operand16()
-        self._store8(address, self._clr())
-
-    def _opcode_com_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = self._calc_indexed_address(offset)
-        value = self._load8(address)
-        self._store8(address, self._com(value))
-
-    def _opcode_com_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load8(address)
-        self._store8(address, self._com(value))
-
-    def _opcode_dec_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = self._calc_indexed_address(offset)
-        value = self._load8(address)
-        self._store8(address, self._dec(value))
-
-    def _opcode_dec_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load8(address)
-        self._store8(address, self._dec(value))
-
-    def _opcode_inc_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = self._calc_indexed_address(offset)
-        value = self._load8(address)
-        self._store8(address, self._inc(value))
-
-    def _opcode_inc_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load8(address)
-        self._store8(address, self._inc(value))
-
-    def _opcode_lsr_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = self._calc_indexed_address(offset)
-        value = self._load8(address)
-        self._store8(address, self._lsr(value))
-
-    def _opcode_lsr_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load8(address)
-        self._store8(address, self._lsr(value))
-
-    def _opcode_neg_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = self._calc_indexed_address(offset)
-        value = self._load8(address)
-        self._store8(address, self._neg(value))
-
-    def _opcode_neg_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load8(address)
-        self._store8(address, self._neg(value))
-
-    def _opcode_rol_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = self._calc_indexed_address(offset)
-        value = self._load8(address)
-        self._store8(address, self._rol(value))
-
-    def _opcode_rol_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load8(address)
-        self._store8(address, self._rol(value))
-
-    def _opcode_ror_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = self._calc_indexed_address(offset)
-        value = self._load8(address)
-        self._store8(address, self._ror(value))
-
-    def _opcode_ror_ext(self) -> None:
-        address = self._fetch_operand16()
-        value = self._load8(address)
-        self._store8(address, self._ror(value))
-
-    def _opcode_tst_ind(self) -> None:
-        value = self._load8(self._calc_indexed_address(self._fetch_operand8()))
-        self._tst(value)
-
-    def _opcode_tst_ext(self) -> None:
-        value = self._load8(self._fetch_operand16())
-        self._tst(value)
-
     def _opcode_clc(self) -> None:
-        self.flags.carry_c = False
+        self.flags.ccr &= ~0x01
 
     def _opcode_cli(self) -> None:
-        self.flags.carry_i = False
+        self.flags.ccr &= ~0x10
 
     def _opcode_clv(self) -> None:
-        self.flags.carry_v = False
+        self.flags.ccr &= ~0x02
 
     def _opcode_sec(self) -> None:
-        self.flags.carry_c = True
+        self.flags.ccr |= 0x01
 
     def _opcode_sei(self) -> None:
-        self.flags.carry_i = True
+        self.flags.ccr |= 0x10
 
     def _opcode_sev(self) -> None:
-        self.flags.carry_v = True
+        self.flags.ccr |= 0x02
 
     def _opcode_tap(self) -> None:
-        value = self.registers.acc_a & 0xFF
-        self.flags.carry_h = bool(value & 0x20)
-        self.flags.carry_i = bool(value & 0x10)
-        self.flags.carry_n = bool(value & 0x08)
-        self.flags.carry_z = bool(value & 0x04)
-        self.flags.carry_v = bool(value & 0x02)
-        self.flags.carry_c = bool(value & 0x01)
+        self.flags.ccr = self.registers.acc_a | 0xC0
 
     def _opcode_tpa(self) -> None:
-        value = 0xC0
-        if self.flags.carry_h:
-            value |= 0x20
-        if self.flags.carry_i:
-            value |= 0x10
-        if self.flags.carry_n:
-            value |= 0x08
-        if self.flags.carry_z:
-            value |= 0x04
-        if self.flags.carry_v:
-            value |= 0x02
-        if self.flags.carry_c:
-            value |= 0x01
-        self.registers.acc_a = value & 0xFF
-
-    def _opcode_bra(self) -> None:
-        offset = self._fetch_operand8()
-        self._branch(offset, True)
-
-    def _opcode_bcc(self) -> None:
-        offset = self._fetch_operand8()
-        self._branch(offset, not self.flags.carry_c)
-
-    def _opcode_bcs(self) -> None:
-        offset = self._fetch_operand8()
-        self._branch(offset, self.flags.carry_c)
-
-    def _opcode_beq(self) -> None:
-        offset = self._fetch_operand8()
-        self._branch(offset, self.flags.carry_z)
-
-    def _opcode_bge(self) -> None:
-        offset = self._fetch_operand8()
-        self._branch(offset, not (self.flags.carry_n ^ self.flags.carry_v))
-
-    def _opcode_bgt(self) -> None:
-        offset = self._fetch_operand8()
-        self._branch(offset, not (self.flags.carry_z or (self.flags.carry_n ^ self.flags.carry_v)))
-
-    def _opcode_bhi(self) -> None:
-        offset = self._fetch_operand8()
-        self._branch(offset, not (self.flags.carry_c or self.flags.carry_z))
-
-    def _opcode_ble(self) -> None:
-        offset = self._fetch_operand8()
-        self._branch(offset, self.flags.carry_z or (self.flags.carry_n ^ self.flags.carry_v))
-
-    def _opcode_bls(self) -> None:
-        offset = self._fetch_operand8()
-        self._branch(offset, self.flags.carry_c or self.flags.carry_z)
-
-    def _opcode_blt(self) -> None:
-        offset = self._fetch_operand8()
-        self._branch(offset, self.flags.carry_n ^ self.flags.carry_v)
-
-    def _opcode_bmi(self) -> None:
-        offset = self._fetch_operand8()
-        self._branch(offset, self.flags.carry_n)
-
-    def _opcode_bne(self) -> None:
-        offset = self._fetch_operand8()
-        self._branch(offset, not self.flags.carry_z)
-
-    def _opcode_bvc(self) -> None:
-        offset = self._fetch_operand8()
-        self._branch(offset, not self.flags.carry_v)
-
-    def _opcode_bvs(self) -> None:
-        offset = self._fetch_operand8()
-        self._branch(offset, self.flags.carry_v)
+        self.registers.acc_a = self.flags.ccr & 0xFF
+
+    def _make_branch(self, taken: int) -> Callable[[], None]:
+        """Build the handler for a conditional branch with ``taken`` mask.
+
+        Bit ``n`` of ``taken`` is set when the branch is taken for
+        ``ccr & 0x0F == n`` (see ``_BRANCH_TAKEN``).
+        """
+
+        registers = self.registers
+        flags = self.flags
+        read_pages = self._read_pages
+        load8 = self._mem_load8
+
+        # A branch not taken only has to step over its offset byte, so the
+        # offset is read (inline, from the page view) on the taken path only.
+        def branch() -> None:
+            pc = registers.program_counter
+            if taken >> (flags.ccr & 0x0F) & 1:
+                page = read_pages[pc >> 8]
+                offset = page[pc & 0xFF] if page is not None else load8(pc) & 0xFF
+                registers.program_counter = (pc + 1 + offset - ((offset & 0x80) << 1)) & 0xFFFF
+            else:
+                registers.program_counter = (pc + 1) & 0xFFFF
 
-    def _opcode_bpl(self) -> None:
-        offset = self._fetch_operand8()
-        self._branch(offset, not self.flags.carry_n)
+        return branch
 
     def _opcode_bsr(self) -> None:
+        registers = self.registers
         offset = self._fetch_operand8()
-        self.registers.stack_pointer = (self.registers.stack_pointer - 2) & 0xFFFF
-        self._store16((self.registers.stack_pointer + 1) & 0xFFFF, self.registers.program_counter)
-        self._branch(offset, True)
-
+        pc = registers.program_counter
+        sp = (registers.stack_pointer - 2) & 0xFFFF
+        registers.stack_pointer = sp
+        self._store16((sp + 1) & 0xFFFF, pc)
+        registers.program_counter = (pc + offset - ((offset & 0x80) << 1)) & 0xFFFF
+
+    # Indexed JMP/JSR jump straight to IX + offset (as in Java MB8861.java);
+    # there is no indirect target to fetch, so the handlers only add and store.
     def _opcode_jmp_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = self._calc_indexed_address(offset)
-        # Java MB8861.java sets PC = IX + offset directly for indexed JMP.
-        self.registers.program_counter = address
+        registers = self.registers
+        registers.program_counter = (registers.index + self._fetch_operand8()) & 0xFFFF
 
     def _opcode_jmp_ext(self) -> None:
-        address = self._fetch_operand16()
-        self.registers.program_counter = address & 0xFFFF
+        self.registers.program_counter = self._fetch_operand16()
 
     def _opcode_jsr_ind(self) -> None:
-        offset = self._fetch_operand8()
-        address = self._calc_indexed_address(offset)
-        self.registers.stack_pointer = (self.registers.stack_pointer - 2) & 0xFFFF
-        self._store16((self.registers.stack_pointer + 1) & 0xFFFF, self.registers.program_counter)
-        # Java MB8861.java jumps to the computed IX+offset without fetching an indirect target.
-        self.registers.program_counter = address
+        registers = self.registers
+        address = (registers.index + self._fetch_operand8()) & 0xFFFF
+        registers.stack_pointer = sp = (registers.stack_pointer - 2) & 0xFFFF
+        self._store16(sp + 1, registers.program_counter)
+        registers.program_counter = address
 
     def _opcode_jsr_ext(self) -> None:
+        registers = self.registers
         address = self._fetch_operand16()
-        self.registers.stack_pointer = (self.registers.stack_pointer - 2) & 0xFFFF
-        self._store16((self.registers.stack_pointer + 1) & 0xFFFF, self.registers.program_counter)
-        self.registers.program_counter = address & 0xFFFF
+        registers.stack_pointer = sp = (registers.stack_pointer - 2) & 0xFFFF
+        self._store16(sp + 1, registers.program_counter)
+        registers.program_counter = address
 
     def _opcode_adx_imm(self) -> None:
         operand = self._fetch_operand8()
-        self.registers.index = self._add16(self.registers.index, operand & 0xFF)
+        self.registers.index = self._add16(self.registers.index, operand)
 
     def _opcode_adx_ext(self) -> None:
         address = self._fetch_operand16()
@@ -1715,7 +1398,7 @@ class MB8861(CPU):
     def _opcode_nim_ind(self) -> None:
         value = self._fetch_operand8()
         offset = self._fetch_operand8()
-        address = self._calc_indexed_address(offset)
+        address = (self.registers.index + offset) & 0xFFFF
         current = self._load8(address)
         result = self._nim(value, current)
         self._store8(address, result)
@@ -1723,7 +1406,7 @@ class MB8861(CPU):
     def _opcode_oim_ind(self) -> None:
         value = self._fetch_operand8()
         offset = self._fetch_operand8()
-        address = self._calc_indexed_address(offset)
+        address = (self.registers.index + offset) & 0xFFFF
         current = self._load8(address)
         result = self._oim(value, current)
         self._store8(address, result)
@@ -1731,7 +1414,7 @@ class MB8861(CPU):
     def _opcode_xim_ind(self) -> None:
         value = self._fetch_operand8()
         offset = self._fetch_operand8()
-        address = self._calc_indexed_address(offset)
+        address = (self.registers.index + offset) & 0xFFFF
         current = self._load8(address)
         result = self._xim(value, current)
         self._store8(address, result)
@@ -1739,337 +1422,210 @@ class MB8861(CPU):
     def _opcode_tmm_ind(self) -> None:
         value = self._fetch_operand8()
         offset = self._fetch_operand8()
-        address = self._calc_indexed_address(offset)
+        address = (self.registers.index + offset) & 0xFFFF
         current = self._load8(address)
         self._tmm(value, current)
-    @staticmethod
-    def _to_signed8(value: int) -> int:
-        value &= 0xFF
-        return value - 0x100 if value & 0x80 else value
-
-    def _add8(self, x: int, y: int) -> int:
-        a = x & 0xFF
-        b = y & 0xFF
-        result = (a + b) & 0x1FF
+
+    # ALU helpers update the packed CCR with one store. Each clears the bits it
+    # defines (mask 0xF0 keeps H/I, 0xF1 also keeps C, 0xD0 drops H/N/Z/V/C) and
+    # ORs in the new N/Z/V/C values. V follows the Java port, which ignores zero
+    # operands when checking for signed overflow. Operands are registers or
+    # memory bytes and therefore already in range, so only results are masked.
+    def _add8(self, a: int, b: int) -> int:
+        result = a + b
         value = result & 0xFF
-        cn = value & 0x80 != 0
-        self.flags.carry_h = ((a & 0x0F) + (b & 0x0F)) > 0x0F
-        self.flags.carry_n = cn
-        self.flags.carry_z = value == 0
-        sa = self._to_signed8(a)
-        sb = self._to_signed8(b)
-        self.flags.carry_v = (sa > 0 and sb > 0 and cn) or (sa < 0 and sb < 0 and not cn)
-        self.flags.carry_c = result > 0xFF
+        ccr = (self.flags.ccr & 0xD0) | _NZ_FLAGS[value] | (result >> 8)
+        if (a ^ value) & (b ^ value) & 0x80:
+            ccr |= 0x02
+        if (a & 0x0F) + (b & 0x0F) > 0x0F:
+            ccr |= 0x20
+        self.flags.ccr = ccr
         return value
 
-    def _adc8(self, x: int, y: int) -> int:
-        carry_in = 1 if self.flags.carry_c else 0
-        a = x & 0xFF
-        b = y & 0xFF
-        result = (a + b + carry_in) & 0x1FF
+    def _adc8(self, a: int, b: int) -> int:
+        flags = self.flags
+        carry_in = flags.ccr & 0x01
+        result = a + b + carry_in
         value = result & 0xFF
-        cn = value & 0x80 != 0
+        ccr = (flags.ccr & 0xD0) | _NZ_FLAGS[value] | (result >> 8)
+        if a and b and (a ^ value) & (b ^ value) & 0x80:
+            ccr |= 0x02
         # M68PRM(D): H = X3・M3 + M3・~R3 + ~R3・X3 with R = X + M + C,
         # so the carry input participates in the carry out of bit 3.
-        self.flags.carry_h = ((a & 0x0F) + (b & 0x0F) + carry_in) > 0x0F
-        self.flags.carry_n = cn
-        self.flags.carry_z = value == 0
-        sa = self._to_signed8(a)
-        sb = self._to_signed8(b)
-        self.flags.carry_v = (sa > 0 and sb > 0 and cn) or (sa < 0 and sb < 0 and not cn)
-        self.flags.carry_c = result > 0xFF
+        if (a & 0x0F) + (b & 0x0F) + carry_in > 0x0F:
+            ccr |= 0x20
+        flags.ccr = ccr
         return value
 
-    def _add16(self, x: int, y: int) -> int:
-        a = x & 0xFFFF
-        b = y & 0xFFFF
-        result = (a + b) & 0x1FFFF
+    def _add16(self, a: int, b: int) -> int:
+        result = a + b
         value = result & 0xFFFF
-        signed_value = self._to_signed16(value)
-        self.flags.carry_n = signed_value < 0
-        self.flags.carry_z = value == 0
-        sa = self._to_signed16(a)
-        sb = self._to_signed16(b)
-        cn = self.flags.carry_n
-        self.flags.carry_v = (sa > 0 and sb > 0 and cn) or (sa < 0 and sb < 0 and not cn)
-        self.flags.carry_c = result > 0xFFFF
+        ccr = (self.flags.ccr & 0xF0) | (value & 0x8000) >> 12 | (result >> 16)
+        if value == 0:
+            ccr |= 0x04
+        if (a ^ value) & (b ^ value) & 0x8000:
+            ccr |= 0x02
+        self.flags.ccr = ccr
         return value
 
     def _nim(self, x: int, y: int) -> int:
-        result = (x & 0xFF) & (y & 0xFF)
-        self.flags.carry_z = result == 0
-        self.flags.carry_n = not self.flags.carry_z
-        self.flags.carry_v = False
-        return result & 0xFF
+        result = x & y
+        # MB8861 extension: N is the complement of Z.
+        self.flags.ccr = (self.flags.ccr & 0xF1) | (0x08 if result else 0x04)
+        return result
 
     def _oim(self, x: int, y: int) -> int:
-        result = (x | y) & 0xFF
-        self.flags.carry_z = result == 0
-        self.flags.carry_n = not self.flags.carry_z
-        self.flags.carry_v = False
+        result = x | y
+        self.flags.ccr = (self.flags.ccr & 0xF1) | (0x08 if result else 0x04)
         return result
 
     def _xim(self, x: int, y: int) -> int:
-        result = (x ^ y) & 0xFF
-        self.flags.carry_z = result == 0
-        self.flags.carry_n = not self.flags.carry_z
+        result = x ^ y
+        # V is left untouched, as in the Java implementation.
+        self.flags.ccr = (self.flags.ccr & 0xF3) | (0x08 if result else 0x04)
         return result
 
     def _tmm(self, x: int, y: int) -> None:
-        x &= 0xFF
-        y &= 0xFF
-        if x == 0 or y == 0:
-            self.flags.carry_n = False
-            self.flags.carry_z = True
-            self.flags.carry_v = False
-        elif y == 0xFF:
-            self.flags.carry_n = False
-            self.flags.carry_z = False
-            self.flags.carry_v = True
-        else:
-            self.flags.carry_n = True
-            self.flags.carry_z = False
-            self.flags.carry_v = False
+        flags = self.flags
+        flags.ccr = (flags.ccr & 0xF1) | (self._TMM_NZV[y] if x else 0x04)
 
     def _and8(self, x: int, y: int) -> int:
-        result = x & y & 0xFF
-        self.flags.carry_n = result & 0x80 != 0
-        self.flags.carry_z = result == 0
-        self.flags.carry_v = False
+        result = x & y
+        self.flags.ccr = (self.flags.ccr & 0xF1) | _NZ_FLAGS[result]
         return result
 
-    def _bit8(self, x: int, y: int) -> None:
-        result = (x & y) & 0xFF
-        self.flags.carry_n = result & 0x80 != 0
-        self.flags.carry_z = result == 0
-        self.flags.carry_v = False
-
-    def _cmp8(self, x: int, y: int) -> None:
-        result = (x & 0xFF) - (y & 0xFF)
-        value = result & 0xFF
-        self.flags.carry_n = value & 0x80 != 0
-        self.flags.carry_z = value == 0
-        sx = self._to_signed8(x)
-        sy = self._to_signed8(y)
-        cn = self.flags.carry_n
-        self.flags.carry_v = (sx > 0 and sy < 0 and cn) or (sx < 0 and sy > 0 and not cn)
-        self.flags.carry_c = result & 0x100 != 0
+    def _shift_flags(self, result: int, carry: int) -> None:
+        # Shifts and rotates: N and Z from the result, C from the bit shifted
+        # out, and V = N xor C.
+        n = result >> 7
+        self.flags.ccr = (self.flags.ccr & 0xF0) | _NZ_FLAGS[result] | (n ^ carry) << 1 | carry
 
     def _asl(self, x: int) -> int:
-        value = (x & 0xFF) << 1
+        value = x << 1
         result = value & 0xFF
-        self.flags.carry_n = result & 0x80 != 0
-        self.flags.carry_z = result == 0
-        self.flags.carry_c = value & 0x100 != 0
-        self.flags.carry_v = self.flags.carry_n != self.flags.carry_c
+        self._shift_flags(result, value >> 8)
         return result
 
     def _asr(self, x: int) -> int:
-        x &= 0xFF
-        result = ((x >> 1) | (x & 0x80)) & 0xFF
-        self.flags.carry_n = result & 0x80 != 0
-        self.flags.carry_z = result == 0
-        self.flags.carry_c = (x & 0x01) != 0
-        self.flags.carry_v = self.flags.carry_n != self.flags.carry_c
+        result = (x >> 1) | (x & 0x80)
+        self._shift_flags(result, x & 0x01)
         return result
 
     def _clr(self) -> int:
-        self.flags.carry_n = False
-        self.flags.carry_z = True
-        self.flags.carry_v = False
-        self.flags.carry_c = False
+        self.flags.ccr = (self.flags.ccr & 0xF0) | 0x04
         return 0
 
     def _com(self, x: int) -> int:
-        result = (~x) & 0xFF
-        self.flags.carry_n = result & 0x80 != 0
-        self.flags.carry_z = result == 0
-        self.flags.carry_v = False
-        self.flags.carry_c = True
+        result = x ^ 0xFF
+        self.flags.ccr = (self.flags.ccr & 0xF0) | _NZ_FLAGS[result] | 0x01
         return result
 
     def _dec(self, x: int) -> int:
-        result = (x - 1) & 0xFF
-        self.flags.carry_n = result & 0x80 != 0
-        self.flags.carry_z = result == 0
-        self.flags.carry_v = x & 0xFF == 0x80
-        return result
+        flags = self.flags
+        flags.ccr = (flags.ccr & 0xF1) | self._DEC_NZV[x]
+        return (x - 1) & 0xFF
 
     def _eor8(self, x: int, y: int) -> int:
-        result = (x ^ y) & 0xFF
-        self.flags.carry_n = result & 0x80 != 0
-        self.flags.carry_z = result == 0
-        self.flags.carry_v = False
+        result = x ^ y
+        self.flags.ccr = (self.flags.ccr & 0xF1) | _NZ_FLAGS[result]
         return result
 
     def _inc(self, x: int) -> int:
-        result = (x + 1) & 0xFF
-        self.flags.carry_n = result & 0x80 != 0
-        self.flags.carry_z = result == 0
-        self.flags.carry_v = x & 0xFF == 0x7F
-        return result
+        flags = self.flags
+        flags.ccr = (flags.ccr & 0xF1) | self._INC_NZV[x]
+        return (x + 1) & 0xFF
 
     def _lda(self, value: int) -> int:
-        value &= 0xFF
-        self.flags.carry_n = value & 0x80 != 0
-        self.flags.carry_z = value == 0
-        self.flags.carry_v = False
+        self.flags.ccr = (self.flags.ccr & 0xF1) | _NZ_FLAGS[value]
         return value
 
     def _lsr(self, x: int) -> int:
-        result = (x & 0xFF) >> 1
-        self.flags.carry_n = False
-        self.flags.carry_z = result == 0
-        self.flags.carry_c = (x & 0x01) != 0
-        self.flags.carry_v = self.flags.carry_n != self.flags.carry_c
-        return result & 0xFF
+        result = x >> 1
+        self._shift_flags(result, x & 0x01)
+        return result
 
     def _neg(self, x: int) -> int:
-        result = (-(x & 0xFF)) & 0x1FF
-        value = result & 0xFF
-        self.flags.carry_n = value & 0x80 != 0
-        self.flags.carry_z = value == 0
-        self.flags.carry_v = value == 0x80
-        self.flags.carry_c = (x & 0xFF) != 0
+        value = -x & 0xFF
+        ccr = (self.flags.ccr & 0xF0) | _NZ_FLAGS[value]
+        if value == 0x80:
+            ccr |= 0x02
+        if x:
+            ccr |= 0x01
+        self.flags.ccr = ccr
         return value
 
     def _rol(self, x: int) -> int:
-        value = ((x & 0xFF) << 1) | (1 if self.flags.carry_c else 0)
+        value = x << 1 | (self.flags.ccr & 0x01)
         result = value & 0xFF
-        self.flags.carry_n = result & 0x80 != 0
-        self.flags.carry_z = result == 0
-        self.flags.carry_c = value & 0x100 != 0
-        self.flags.carry_v = self.flags.carry_n != self.flags.carry_c
+        self._shift_flags(result, value >> 8)
         return result
 
     def _ror(self, x: int) -> int:
-        x &= 0xFF
-        value = (x >> 1) | (0x80 if self.flags.carry_c else 0)
-        result = value & 0xFF
-        self.flags.carry_n = result & 0x80 != 0
-        self.flags.carry_z = result == 0
-        self.flags.carry_c = (x & 0x01) != 0
-        self.flags.carry_v = self.flags.carry_n != self.flags.carry_c
+        result = (x >> 1) | (self.flags.ccr & 0x01) << 7
+        self._shift_flags(result, x & 0x01)
         return result
 
     def _ora(self, x: int, y: int) -> int:
-        result = (x | y) & 0xFF
-        self.flags.carry_n = result & 0x80 != 0
-        self.flags.carry_z = result == 0
-        self.flags.carry_v = False
+        result = x | y
+        self.flags.ccr = (self.flags.ccr & 0xF1) | _NZ_FLAGS[result]
         return result
 
-    def _sub8(self, x: int, y: int) -> int:
-        result = (x & 0xFF) - (y & 0xFF)
+    def _sub8(self, a: int, b: int) -> int:
+        result = a - b
         out = result & 0xFF
-        cn = out & 0x80 != 0
-        self.flags.carry_n = cn
-        self.flags.carry_z = out == 0
-        sx = self._to_signed8(x)
-        sy = self._to_signed8(y)
-        self.flags.carry_v = (sx > 0 and sy < 0 and cn) or (sx < 0 and sy > 0 and not cn)
-        self.flags.carry_c = result & 0x100 != 0
+        ccr = (self.flags.ccr & 0xF0) | _NZ_FLAGS[out] | (result >> 8) & 0x01
+        if a and (a ^ b) & (a ^ out) & 0x80:
+            ccr |= 0x02
+        self.flags.ccr = ccr
         return out
 
-    def _sbc8(self, x: int, y: int) -> int:
-        borrow = 1 if self.flags.carry_c else 0
-        result = (x & 0xFF) - (y & 0xFF) - borrow
+    def _sbc8(self, a: int, b: int) -> int:
+        flags = self.flags
+        result = a - b - (flags.ccr & 0x01)
         out = result & 0xFF
-        cn = out & 0x80 != 0
-        self.flags.carry_n = cn
-        self.flags.carry_z = out == 0
-        sx = self._to_signed8(x)
-        sy = self._to_signed8(y)
-        self.flags.carry_v = (sx > 0 and sy < 0 and cn) or (sx < 0 and sy > 0 and not cn)
-        self.flags.carry_c = result & 0x100 != 0
+        ccr = (flags.ccr & 0xF0) | _NZ_FLAGS[out] | (result >> 8) & 0x01
+        if a and b and (a ^ b) & (a ^ out) & 0x80:
+            ccr |= 0x02
+        flags.ccr = ccr
         return out
 
     def _sta(self, address: int, value: int) -> None:
-        value &= 0xFF
-        self.flags.carry_n = value & 0x80 != 0
-        self.flags.carry_z = value == 0
-        self.flags.carry_v = False
-        self._store8(address & 0xFFFF, value)
+        self.flags.ccr = (self.flags.ccr & 0xF1) | _NZ_FLAGS[value]
+        self._store8(address, value)
 
     def _tst(self, value: int) -> None:
-        value &= 0xFF
-        self.flags.carry_n = value & 0x80 != 0
-        self.flags.carry_z = value == 0
-        self.flags.carry_v = False
-        self.flags.carry_c = False
-
-    def _calc_direct_address(self, operand: int) -> int:
-        return operand & 0xFF
-
-    def _calc_indexed_address(self, offset: int) -> int:
-        return (self.registers.index + (offset & 0xFF)) & 0xFFFF
-
-    @staticmethod
-    def _to_signed16(value: int) -> int:
-        value &= 0xFFFF
-        return value - 0x10000 if value & 0x8000 else value
-
-    def _cpx(self, value: int) -> None:
-        ix = self.registers.index & 0xFFFF
-        operand = value & 0xFFFF
-        diff = (ix - operand) & 0xFFFF
-        signed_diff = self._to_signed16(diff)
-        self.flags.carry_n = signed_diff < 0
-        self.flags.carry_z = diff == 0
-        ix_signed = self._to_signed16(self.registers.index)
-        op_signed = self._to_signed16(value)
-        cn = self.flags.carry_n
-        self.flags.carry_v = (ix_signed > 0 and op_signed < 0 and cn) or (
-            ix_signed < 0 and op_signed > 0 and not cn
-        )
-
-    def _dex(self) -> None:
-        self.registers.index = (self.registers.index - 1) & 0xFFFF
-        self.flags.carry_z = self.registers.index == 0
+        self.flags.ccr = (self.flags.ccr & 0xF0) | _NZ_FLAGS[value]
 
-    def _des(self) -> None:
-        self.registers.stack_pointer = (self.registers.stack_pointer - 1) & 0xFFFF
+    def _nz16(self, value: int) -> None:
+        # N from bit 15, Z from the whole word, V cleared; H, I and C are kept.
+        self.flags.ccr = (self.flags.ccr & 0xF1) | (value & 0x8000) >> 12 | (0 if value else 0x04)
 
-    def _inx(self) -> None:
-        self.registers.index = (self.registers.index + 1) & 0xFFFF
-        self.flags.carry_z = self.registers.index == 0
+    def _cpx(self, operand: int) -> None:
+        ix = self.registers.index
+        diff = (ix - operand) & 0xFFFF
+        ccr = (self.flags.ccr & 0xF1) | (diff & 0x8000) >> 12 | (0 if diff else 0x04)
+        if ix and (ix ^ operand) & (ix ^ diff) & 0x8000:
+            ccr |= 0x02
+        self.flags.ccr = ccr
 
-    def _ins(self) -> None:
-        self.registers.stack_pointer = (self.registers.stack_pointer + 1) & 0xFFFF
+    def _dex(self) -> None:
+        self.registers.index = index = (self.registers.index - 1) & 0xFFFF
+        self.flags.ccr = (self.flags.ccr & ~0x04) | (0 if index else 0x04)
 
     def _ldx(self, value: int) -> None:
-        self.registers.index = value & 0xFFFF
-        ix_signed = self._to_signed16(self.registers.index)
-        self.flags.carry_n = ix_signed < 0
-        self.flags.carry_z = self.registers.index == 0
-        self.flags.carry_v = False
+        self.registers.index = value
+        self._nz16(value)
 
     def _lds(self, value: int) -> None:
-        self.registers.stack_pointer = value & 0xFFFF
-        sp_signed = self._to_signed16(self.registers.stack_pointer)
-        self.flags.carry_n = sp_signed < 0
-        self.flags.carry_z = self.registers.stack_pointer == 0
-        self.flags.carry_v = False
+        self.registers.stack_pointer = value
+        self._nz16(value)
 
     def _stx(self, address: int) -> None:
-        addr = address & 0xFFFF
-        self._store16(addr, self.registers.index)
-        ix_signed = self._to_signed16(self.registers.index)
-        self.flags.carry_n = ix_signed < 0
-        self.flags.carry_z = self.registers.index == 0
-        self.flags.carry_v = False
+        self._store16(address, self.registers.index)
+        self._nz16(self.registers.index)
 
     def _sts(self, address: int) -> None:
         # M68PRM(D): N and Z are set from the stored stack pointer
         # (N = SPH7), not from the index register.
-        addr = address & 0xFFFF
-        self._store16(addr, self.registers.stack_pointer)
-        sp_signed = self._to_signed16(self.registers.stack_pointer)
-        self.flags.carry_n = sp_signed < 0
-        self.flags.carry_z = self.registers.stack_pointer == 0
-        self.flags.carry_v = False
-
-    def _branch(self, offset: int, condition: bool) -> None:
-        if condition:
-            signed_offset = self._to_signed8(offset)
-            self.registers.program_counter = (self.registers.program_counter + signed_offset) & 0xFFFF
+        self._store16(address, self.registers.stack_pointer)
+        self._nz16(self.registers.stack_pointer)
@@ -81,6 +81,8 @@ def load_basic_text(memory: MemorySystem, path: str | Path, *, encoding: str = "
 
     addr = BASIC_START_ADDRESS
     end_addr_limit = 0x7FFF  # Matches Java implementation
+    # The encoded program is assembled here and stored with one block write.
+    image = bytearray()
 
     with file_path.open("r", encoding=encoding) as handle:
         for raw_line in handle:
@@ -92,14 +94,14 @@ def load_basic_text(memory: MemorySystem, path: str | Path, *, encoding: str = "
             digits_length = 2
             if addr + digits_length > end_addr_limit:
                 raise ProgramLoadError("basic program does not fit in memory")
-            memory.store16(addr, line_number)
+            image += line_number.to_bytes(2, "big")
             addr += digits_length
             line_length = digits_length
 
             for byte in _encode_basic_content(rest, raw_line):
                 if addr > end_addr_limit:
                     raise ProgramLoadError("basic program does not fit in memory")
-                memory.store8(addr, byte)
+                image.append(byte)
                 addr += 1
                 line_length += 1
 
@@ -107,12 +109,13 @@ def load_basic_text(memory: MemorySystem, path: str | Path, *, encoding: str = "
                 raise ProgramLoadError(f"line too long: {raw_line.rstrip()}\n")
             if addr > end_addr_limit:
                 raise ProgramLoadError("basic program does not fit in memory")
-            memory.store8(addr, 0x00)
+            image.append(0x00)
             addr += 1
 
     last_data_address = addr - 1
     if addr + 3 > end_addr_limit:
         raise ProgramLoadError("basic program does not fit in memory")
+    _write_prog_block(memory, BASIC_START_ADDRESS, image)
     _finalize_basic(memory, last_data_address)
     info.add_region(BASIC_START_ADDRESS, last_data_address)
     return info
@@ -255,8 +258,8 @@ def _load_prog_v2(stream: BinaryIO, info: ProgramInfo) -> None:
 
 
 def _write_prog_block(memory: MemorySystem, start: int, data: Sequence[int]) -> None:
-    for offset, value in enumerate(data):
-        memory.store8(start + offset, value)
+    if data:
+        memory.store_block(start, data)
 
 
 def _finalize_basic(memory: MemorySystem, final_data_address: int) -> None:
@@ -79,7 +79,6 @@ class DebugOverlay:
 
         self._ensure_font()
         self.capture_state()
-        self._meta_db = SnapshotDatabase()
         self._history_entries = self._meta_db.list_history()
         if self._history_entries:
             self._history_index %= len(self._history_entries)
@@ -204,7 +203,6 @@ class DebugOverlay:
 
     def set_slot_name(self, slot: str) -> None:
         self._slot_name = slot
-        self._meta_db = SnapshotDatabase()
         if slot in SNAPSHOT_SLOTS:
             self._selected_index = SNAPSHOT_SLOTS.index(slot)
 
@@ -301,14 +299,15 @@ class DebugOverlay:
         lines = [
             f"PC:{regs.program_counter:04X}  IX:{regs.index:04X}  SP:{regs.stack_pointer:04X}",
             f"A:{regs.acc_a:02X}  B:{regs.acc_b:02X}",
-            "FLAGS:" + " ".join([
-                f"H={int(flags.carry_h)}",
-                f"I={int(flags.carry_i)}",
-                f"N={int(flags.carry_n)}",
-                f"Z={int(flags.carry_z)}",
-                f"V={int(flags.carry_v)}",
-                f"C={int(flags.carry_c)}",
-            ]),
+            "FLAGS:H=%d I=%d N=%d Z=%d V=%d C=%d"
+            % (
+                flags.carry_h,
+                flags.carry_i,
+                flags.carry_n,
+                flags.carry_z,
+                flags.carry_v,
+                flags.carry_c,
+            ),
         ]
         status = cpu.status
         extra = []
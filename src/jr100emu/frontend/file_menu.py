@@ -41,6 +41,9 @@ class FileMenu:
         self._line_height = 18
         self._message: str = ""
         self._last_axis_move_ms: int = 0
+        # Rendered overlay reused while nothing it shows has changed.
+        self._cached_overlay = None
+        self._cached_key: Optional[tuple] = None
 
     # ------------------------------------------------------------------
     def open(self) -> None:
@@ -224,10 +227,29 @@ class FileMenu:
     def render(self, screen) -> None:
         if not self.active:
             return
-        import pygame  # type: ignore
 
         self._ensure_font()
         width, height = screen.get_size()
+        start_y = self._list_start_y()
+        self._fit_visible_items(height, start_y)
+        key = (
+            width,
+            height,
+            self._font,
+            self.root,
+            self.entries,
+            self.selected_index,
+            self._scroll,
+            self._message,
+        )
+        if key != self._cached_key or self._cached_overlay is None:
+            self._cached_overlay = self._render_overlay(width, height, start_y)
+            self._cached_key = key
+        screen.blit(self._cached_overlay, (0, 0))
+
+    def _render_overlay(self, width: int, height: int, start_y: int):
+        import pygame  # type: ignore
+
         overlay = pygame.Surface((width, height), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 200))
 
@@ -245,8 +267,6 @@ class FileMenu:
         info_y = self.TOP_MARGIN + self._line_height + self.HEADER_GAP
         overlay.blit(info_surface, (self.LEFT_MARGIN, info_y))
 
-        start_y = self._list_start_y()
-        self._fit_visible_items(height, start_y)
         visible = self.entries[self._scroll : self._scroll + self._visible_items]
         for row, path in enumerate(visible):
             display_name = self._format_entry_name(path)
@@ -262,8 +282,7 @@ class FileMenu:
 
         footer_surface = self._font.render(self._footer_text(), True, (173, 216, 230))
         overlay.blit(footer_surface, (self.LEFT_MARGIN, self._footer_y(height)))
-
-        screen.blit(overlay, (0, 0))
+        return overlay
 
     def _ensure_font(self) -> None:
         if self._font is not None:
@@ -2,16 +2,78 @@
 
 from __future__ import annotations
 
+import io
 import json
+import pickle
 import time
+import zlib
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 SNAPSHOT_DIR = Path("snapshots")
 SNAPSHOT_HISTORY_DIR = SNAPSHOT_DIR / "history"
 SNAPSHOT_SLOTS = ["slot0", "slot1", "slot2", "slot3"]
 DEFAULT_SLOT = SNAPSHOT_SLOTS[0]
+SNAPSHOT_SUFFIX = ".snap"
+LEGACY_SNAPSHOT_SUFFIX = ".json"
+SNAPSHOT_PICKLE_PROTOCOL = 5
+SNAPSHOT_COMPRESSION_LEVEL = 3
+SNAPSHOT_FORMAT_VERSION = 2
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """Unpickler that only accepts builtin containers and scalars."""
+
+    def find_class(self, module: str, name: str):  # type: ignore[override]
+        raise pickle.UnpicklingError(f"snapshot files may not reference {module}.{name}")
+
+
+def encode_snapshot_payload(data: dict) -> bytes:
+    """Serialize a snapshot dictionary into the binary snapshot format.
+
+    The pickle stream is zlib-compressed; snapshot RAM is mostly zero-filled.
+    """
+
+    payload = dict(data, version=SNAPSHOT_FORMAT_VERSION)
+    return zlib.compress(
+        pickle.dumps(payload, protocol=SNAPSHOT_PICKLE_PROTOCOL), SNAPSHOT_COMPRESSION_LEVEL
+    )
+
+
+def decode_snapshot_payload(raw: bytes) -> dict:
+    """Decode a snapshot file, accepting compressed, plain pickle and legacy JSON payloads.
+
+    Raises ``ValueError`` when the payload is corrupt.
+    """
+
+    try:
+        if raw[:1] == b"{":
+            data = json.loads(raw)
+        else:
+            if raw[:1] == b"\x78":  # zlib stream header
+                raw = zlib.decompress(raw)
+            data = _SnapshotUnpickler(io.BytesIO(raw)).load()
+    except (
+        pickle.UnpicklingError,
+        EOFError,
+        json.JSONDecodeError,
+        UnicodeDecodeError,
+        zlib.error,
+    ) as exc:
+        raise ValueError(f"invalid snapshot payload: {exc}") from exc
+    if not isinstance(data, dict):
+        raise ValueError("invalid snapshot payload: not a mapping")
+    if int(data.get("version", 1)) > SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(f"unsupported snapshot format version: {data['version']}")
+    return data
+
+
+def iter_history_files(pattern: str = "*") -> Iterator[Path]:
+    """Yield history files in both the binary and the legacy JSON format."""
+
+    for suffix in (SNAPSHOT_SUFFIX, LEGACY_SNAPSHOT_SUFFIX):
+        yield from SNAPSHOT_HISTORY_DIR.glob(f"{pattern}{suffix}")
 
 
 @dataclass
@@ -36,22 +98,34 @@ class HistoryEntry:
         return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.timestamp))
 
 
+# In-memory mirrors of the on-disk metadata, keyed by (snapshot dir, history dir).
+# The first database for a directory reads the disk; later instances share the
+# mirror, which every write keeps current.
+_MIRRORS: Dict[Tuple[Path, Path], Tuple[Dict[str, SnapshotMetadata], List[HistoryEntry]]] = {}
+
+
 class SnapshotDatabase:
     """Manages snapshot metadata stored on disk."""
 
     def __init__(self) -> None:
+        key = (SNAPSHOT_DIR, SNAPSHOT_HISTORY_DIR)
+        mirror = _MIRRORS.get(key)
+        if mirror is not None:
+            self._slots, self._history = mirror
+            return
         self._slots: Dict[str, SnapshotMetadata] = {}
         self._history: List[HistoryEntry] = []
         self._load_existing()
+        _MIRRORS[key] = (self._slots, self._history)
 
     def _slot_path(self, slot: str) -> Path:
-        return SNAPSHOT_DIR / f"{slot}.json"
+        return SNAPSHOT_DIR / f"{slot}{SNAPSHOT_SUFFIX}"
 
     def _meta_path(self, slot: str) -> Path:
         return SNAPSHOT_DIR / f"{slot}.meta.json"
 
     def _history_path(self, slot: str, timestamp: float) -> Path:
-        return SNAPSHOT_HISTORY_DIR / f"{slot}-{int(timestamp * 1000)}.json"
+        return SNAPSHOT_HISTORY_DIR / f"{slot}-{int(timestamp * 1000)}{SNAPSHOT_SUFFIX}"
 
     def _load_existing(self) -> None:
         if not SNAPSHOT_DIR.exists():
@@ -72,13 +146,13 @@ class SnapshotDatabase:
         self._load_history()
 
     def _load_history(self) -> None:
-        self._history = []
+        self._history.clear()
         if not SNAPSHOT_HISTORY_DIR.exists():
             return
-        for path in SNAPSHOT_HISTORY_DIR.glob("*.json"):
+        for path in iter_history_files():
             try:
-                data = json.loads(path.read_text())
-            except json.JSONDecodeError:
+                data = decode_snapshot_payload(path.read_bytes())
+            except (OSError, ValueError):
                 continue
             slot = data.get("slot")
             timestamp = float(data.get("timestamp", 0.0))
@@ -147,7 +221,7 @@ class SnapshotDatabase:
                     entry.path.unlink()
             else:
                 remaining.append(entry)
-        self._history = remaining
+        self._history[:] = remaining
 
 
 __all__ = [
@@ -155,6 +229,12 @@ __all__ = [
     "SNAPSHOT_HISTORY_DIR",
     "SNAPSHOT_SLOTS",
     "DEFAULT_SLOT",
+    "SNAPSHOT_SUFFIX",
+    "LEGACY_SNAPSHOT_SUFFIX",
+    "SNAPSHOT_FORMAT_VERSION",
+    "encode_snapshot_payload",
+    "decode_snapshot_payload",
+    "iter_history_files",
     "SnapshotMetadata",
     "HistoryEntry",
     "SnapshotDatabase",
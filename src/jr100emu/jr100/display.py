@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Iterable, List
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 
 @dataclass
@@ -18,8 +18,18 @@ class JR100Display:
     character_rom: List[int] = field(default_factory=lambda: [0x00] * (256 * 8))
     user_defined_ram: List[int] = field(default_factory=lambda: [0x00] * (128 * 8))
     video_ram: List[int] = field(default_factory=lambda: [0x00] * (32 * 24))
-    _fonts: List[List[List[int]]] = field(default_factory=lambda: [[[0] * (8 * 8) for _ in range(256)] for _ in range(2)])
+    # Per-plane glyph pixel tables; ``None`` entries are rasterized on first draw.
+    _fonts: List[List[Optional[List[int]]]] = field(default_factory=lambda: [[None] * 256 for _ in range(2)])
     _current_font: int = FONT_NORMAL
+    # Bumped whenever the visible picture may have changed; frontends compare it to
+    # the version they last presented to skip re-rendering unchanged frames.
+    frame_version: int = 0
+    # pygame surfaces reused across renders, keyed by scale factor.
+    _surfaces: Dict[int, Any] = field(default_factory=dict, repr=False, compare=False)
+    # Video RAM cells changed since the last get_dirty_rects(); _dirty_all covers
+    # changes (fonts, whole-VRAM loads) that may affect any cell.
+    _dirty_cells: Set[int] = field(default_factory=set, repr=False, compare=False)
+    _dirty_all: bool = field(default=True, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self.rebuild_fonts()
@@ -31,7 +41,9 @@ class JR100Display:
     def set_current_font(self, plane: int) -> None:
         if plane not in (self.FONT_NORMAL, self.FONT_USER_DEFINED):
             raise ValueError("invalid font plane")
-        self._current_font = plane
+        if plane != self._current_font:
+            self._current_font = plane
+            self._invalidate_all()
 
     # ------------------------------------------------------------------
     # Memory loaders
@@ -55,32 +67,78 @@ class JR100Display:
         if len(values) != self.WIDTH_CHARS * self.HEIGHT_CHARS:
             raise ValueError("video RAM must be 768 bytes")
         self.video_ram = [value & 0xFF for value in values]
+        self._invalidate_all()
 
     def write_video_ram(self, index: int, value: int) -> None:
         if not (0 <= index < len(self.video_ram)):
             raise ValueError("video RAM index out of range")
-        self.video_ram[index] = value & 0xFF
+        value &= 0xFF
+        if self.video_ram[index] != value:
+            self.video_ram[index] = value
+            self._dirty_cells.add(index)
+            self.frame_version += 1
 
     # ------------------------------------------------------------------
     # Font generation
     # ------------------------------------------------------------------
     def rebuild_fonts(self) -> None:
-        for code in range(256):
-            self._rebuild_font_entry(self.FONT_NORMAL, code)
-            self._rebuild_font_entry(self.FONT_USER_DEFINED, code)
+        for plane in (self.FONT_NORMAL, self.FONT_USER_DEFINED):
+            self._fonts[plane] = [None] * 256
+        self._invalidate_all()
 
     def _rebuild_user_defined_fonts(self) -> None:
         for code in range(128, 256):
             self._rebuild_font_entry(self.FONT_USER_DEFINED, code)
 
     def _rebuild_font_entry(self, plane: int, code: int) -> None:
+        self._fonts[plane][code] = None
+        self._invalidate_all()
+
+    def _invalidate_all(self) -> None:
+        self._dirty_all = True
+        self.frame_version += 1
+
+    def get_dirty_rects(self, scaling: int = 1) -> List[Tuple[int, int, int, int]]:
+        """Return screen rectangles changed since the previous call and reset tracking.
+
+        Each character row with changes yields one ``(x, y, width, height)``
+        rectangle spanning its leftmost to rightmost changed cell, in pixels
+        at ``scaling``. Font or whole-VRAM changes return the full screen.
+        """
+
+        cell = self.PPC * scaling
+        if self._dirty_all:
+            self._dirty_all = False
+            self._dirty_cells.clear()
+            return [(0, 0, self.WIDTH_CHARS * cell, self.HEIGHT_CHARS * cell)]
+        spans: Dict[int, List[int]] = {}
+        for index in self._dirty_cells:
+            row, col = divmod(index, self.WIDTH_CHARS)
+            span = spans.get(row)
+            if span is None:
+                spans[row] = [col, col]
+            elif col < span[0]:
+                span[0] = col
+            elif col > span[1]:
+                span[1] = col
+        self._dirty_cells.clear()
+        return [
+            (first * cell, row * cell, (last - first + 1) * cell, cell)
+            for row, (first, last) in sorted(spans.items())
+        ]
+
+    def _font_glyph(self, plane: int, code: int) -> List[int]:
+        glyph = self._fonts[plane][code]
+        if glyph is not None:
+            return glyph
+        glyph = [0] * (self.PPC * self.PPC)
         for line in range(self.PPC):
             value = self._glyph_byte(plane, code, line)
             for bit in range(self.PPC):
                 pixel = (value >> (7 - bit)) & 0x01
-                color = self.color_map[pixel][code]
-                index = line * self.PPC + bit
-                self._fonts[plane][code][index] = color
+                glyph[line * self.PPC + bit] = self.color_map[pixel][code]
+        self._fonts[plane][code] = glyph
+        return glyph
 
     def _glyph_byte(self, plane: int, code: int, line: int) -> int:
         if plane == self.FONT_NORMAL:
@@ -110,7 +168,7 @@ class JR100Display:
         for y_char in range(self.HEIGHT_CHARS):
             for x_char in range(self.WIDTH_CHARS):
                 code = self.video_ram[y_char * self.WIDTH_CHARS + x_char] & 0xFF
-                glyph = self._fonts[self._current_font][code]
+                glyph = self._font_glyph(self._current_font, code)
                 for line in range(self.PPC):
                     row_index = y_char * self.PPC + line
                     start = x_char * self.PPC
@@ -120,6 +178,10 @@ class JR100Display:
     def render_pygame_surface(self, scaling: int = 1):
         """Render the display into a pygame Surface.
 
+        The picture is drawn once at native resolution and then scaled by SDL.
+        Surfaces are kept per scale factor and reused by later calls, so the
+        returned surface is overwritten by the next render at the same scale.
+
         Parameters
         ----------
         scaling:
@@ -144,24 +206,68 @@ class JR100Display:
         except Exception as exc:  # pragma: no cover - optional dependency
             raise RuntimeError("pygame is required for render_pygame_surface") from exc
 
-        base_width = self.WIDTH_CHARS * self.PPC
-        base_height = self.HEIGHT_CHARS * self.PPC
-        surface = pygame.Surface((base_width * scaling, base_height * scaling))
+        base = self._render_base_surface(pygame)
+        if scaling == 1:
+            return base
+        return self._scale_base_surface(pygame, base, scaling)
+
+    def render_pygame_surface_into(self, target, scaling: int = 1) -> None:
+        """Render the display straight into a caller-owned pygame Surface.
+
+        ``target`` must be exactly the scaled screen size. When its pixel
+        format matches the native 32-bit surface, SDL scales into it directly
+        and no intermediate scaled surface is touched.
+
+        Raises
+        ------
+        RuntimeError
+            If pygame is not available.
+        ValueError
+            If ``target`` does not have the scaled display size.
+        """
+
+        if scaling <= 0:
+            raise ValueError("scaling factor must be positive")
+
+        try:
+            import pygame  # type: ignore
+        except Exception as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError("pygame is required for render_pygame_surface_into") from exc
+
+        size = (self.WIDTH_CHARS * self.PPC * scaling, self.HEIGHT_CHARS * self.PPC * scaling)
+        if target.get_size() != size:
+            raise ValueError("target surface does not match the scaled display size")
+        base = self._render_base_surface(pygame)
+        if scaling == 1:
+            target.blit(base, (0, 0))
+            return
+        try:
+            pygame.transform.scale(base, size, target)
+        except ValueError:
+            # Differing pixel format: scale into the cached surface and convert on blit.
+            target.blit(self._scale_base_surface(pygame, base, scaling), (0, 0))
+
+    def _render_base_surface(self, pygame):
+        base = self._surfaces.get(1)
+        if base is None:
+            base = pygame.Surface((self.WIDTH_CHARS * self.PPC, self.HEIGHT_CHARS * self.PPC), 0, 32)
+            self._surfaces[1] = base
         pixels = self.render_pixels()
-        surface.lock()
+        pxarray = pygame.PixelArray(base)
         try:
-            if scaling == 1:
-                pxarray = pygame.PixelArray(surface)
-                for y, row in enumerate(pixels):
-                    pxarray[y][:] = row
-                del pxarray
-            else:
-                for y, row in enumerate(pixels):
-                    for x, color in enumerate(row):
-                        surface.fill(color, (x * scaling, y * scaling, scaling, scaling))
+            for y, row in enumerate(pixels):
+                pxarray[:, y] = row
         finally:
-            surface.unlock()
-        return surface
+            pxarray.close()
+        return base
+
+    def _scale_base_surface(self, pygame, base, scaling: int):
+        scaled = self._surfaces.get(scaling)
+        if scaled is None:
+            scaled = pygame.Surface((base.get_width() * scaling, base.get_height() * scaling), 0, 32)
+            self._surfaces[scaling] = scaled
+        pygame.transform.scale(base, scaled.get_size(), scaled)
+        return scaled
 
     # ------------------------------------------------------------------
     # Color map utilities
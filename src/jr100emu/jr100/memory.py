@@ -36,6 +36,15 @@ class UserDefinedCharacterRam(RAM):
         self.store8(address, hi)
         self.store8(address + 1, lo)
 
+    def store_block(self, address: int, data: bytes) -> None:
+        super().store_block(address, data)
+        if self.display is None:
+            return
+        update_font = getattr(self.display, "update_font")
+        for offset, value in enumerate(data):
+            index = (address + offset - self.start) % self.length
+            update_font(index // 8, index % 8, value & 0xFF)
+
 
 class VideoRam(RAM):
     """Video RAM exposes per-byte updates to the display."""
@@ -68,6 +77,11 @@ class VideoRam(RAM):
         self.store8(address, hi)
         self.store8(address + 1, lo)
 
+    def store_block(self, address: int, data: bytes) -> None:
+        super().store_block(address, data)
+        for offset, value in enumerate(data):
+            self._notify_display((address + offset - self.start) % self.length, value)
+
 
 class ExtendedIOPort(Addressable):
     """Handles the JR-100 expansion port mapped at 0xCC00-0xCFFF."""
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Protocol
+from typing import Dict, Iterable, List, Optional, Protocol, Tuple
 
 
 class Addressable(Protocol):
@@ -32,14 +32,20 @@ class Memory(Addressable):
 
     start: int
     length: int
-    data: List[int]
+    data: bytearray
 
     def __init__(self, start: int, length: int) -> None:
         self.start = start & 0xFFFF
         self.length = length
         if length <= 0 or self.start + length > 0x10000:
             raise ValueError("invalid memory range")
-        self.data = [0x00] * length
+        self.data = bytearray(length)
+
+    @property
+    def buffer(self) -> memoryview:
+        """Zero-copy view over the backing store."""
+
+        return memoryview(self.data)
 
     def get_start_address(self) -> int:
         return self.start
@@ -67,6 +73,24 @@ class Memory(Addressable):
         self.data[index] = (value >> 8) & 0xFF
         self.data[(index + 1) % self.length] = value & 0xFF
 
+    def store_block(self, address: int, data: bytes) -> None:
+        """Write ``data`` starting at ``address`` with a single slice assignment."""
+
+        index = self._index(address)
+        if index + len(data) > self.length:
+            for offset, value in enumerate(data):
+                self.store8(address + offset, value)
+            return
+        self.data[index : index + len(data)] = data
+
+    def load_block(self, address: int, length: int) -> bytes:
+        """Read ``length`` bytes starting at ``address`` with a single slice copy."""
+
+        index = self._index(address)
+        if index + length > self.length:
+            return bytes(self.load8(address + offset) for offset in range(length))
+        return bytes(memoryview(self.data)[index : index + length])
+
 
 class RAM(Memory):
     """Readable and writable memory block."""
@@ -81,6 +105,9 @@ class ROM(Memory):
     def store16(self, address: int, value: int) -> None:  # pragma: no cover - ROM ignores writes
         return
 
+    def store_block(self, address: int, data: bytes) -> None:  # pragma: no cover - ROM ignores writes
+        return
+
 
 class UnmappedMemory(Addressable):
     """Memory hole returning zeroed data (with JR-100 specific quirk at 0xD000)."""
@@ -111,14 +138,36 @@ class UnmappedMemory(Addressable):
     def store16(self, address: int, value: int) -> None:
         return
 
+    def load_block(self, address: int, length: int) -> bytes:
+        block = bytearray(length)
+        quirk = 0xD000 - (address & 0xFFFF)
+        if 0 <= quirk < length:
+            block[quirk] = 0xAA
+        return bytes(block)
+
+    def store_block(self, address: int, data: bytes) -> None:
+        return
+
 
 class MemorySystem:
-    """Memory mapper dispatching reads/writes to registered devices."""
+    """Memory mapper dispatching reads/writes to registered devices.
+
+    ``read_pages`` and ``write_pages`` hold one entry per 256-byte page: a
+    writable view into the backing ``bytearray`` when the whole page belongs to
+    a plain :class:`Memory` block whose ``load8``/``store8`` have no side
+    effects, otherwise ``None``. The lists are updated in place whenever the
+    map changes, so callers may keep references to them.
+    """
+
+    PAGE_SIZE = 0x100
 
     def __init__(self) -> None:
         self._space: List[Addressable] = []
         self._map: Dict[type, Addressable] = {}
         self._debug: bool = False
+        self._runs: Optional[List[Tuple[int, int, Addressable]]] = None
+        self.read_pages: List[Optional[memoryview]] = [None] * 256
+        self.write_pages: List[Optional[memoryview]] = [None] * 256
 
     def allocate_space(self, capacity: int) -> None:
         if capacity <= 0 or capacity > 0x10000:
@@ -126,6 +175,8 @@ class MemorySystem:
         filler = UnmappedMemory(0, capacity)
         self._space = [filler for _ in range(capacity)]
         self._map = {UnmappedMemory: filler}
+        self._runs = None
+        self._rebuild_pages()
 
     def register_memory(self, memory: Addressable) -> None:
         start = memory.get_start_address() & 0xFFFF
@@ -135,6 +186,8 @@ class MemorySystem:
         for address in range(start, end + 1):
             self._space[address] = memory
         self._map[type(memory)] = memory
+        self._runs = None
+        self._rebuild_pages()
 
     def regist_memory(self, memory: Addressable) -> None:
         """Compatibility alias mirroring Java naming."""
@@ -147,6 +200,30 @@ class MemorySystem:
     def get_memories(self) -> List[Addressable]:
         return list(self._map.values())
 
+    def _rebuild_pages(self) -> None:
+        read_pages: List[Optional[memoryview]] = [None] * 256
+        write_pages: List[Optional[memoryview]] = [None] * 256
+        if not self._debug:
+            size = self.PAGE_SIZE
+            for page in range(len(self._space) // size):
+                base = page * size
+                device = self._space[base]
+                if not isinstance(device, Memory):
+                    continue
+                if self._space[base : base + size].count(device) != size:
+                    continue
+                offset = base - device.start
+                if offset < 0 or offset + size > device.length:
+                    continue
+                view = memoryview(device.data)[offset : offset + size]
+                cls = type(device)
+                if cls.load8 is Memory.load8:
+                    read_pages[page] = view
+                if cls.store8 is Memory.store8:
+                    write_pages[page] = view
+        self.read_pages[:] = read_pages
+        self.write_pages[:] = write_pages
+
     def load8(self, address: int) -> int:
         addr = address & 0xFFFF
         value = self._space[addr].load8(addr) & 0xFF
@@ -178,8 +255,73 @@ class MemorySystem:
         lo_addr = (addr + 1) & 0xFFFF
         self._space[lo_addr].store8(lo_addr, value & 0xFF)
 
+    def _device_runs(self) -> List[Tuple[int, int, Addressable]]:
+        """Return ``(start, end_exclusive, device)`` for each contiguous mapping."""
+
+        if self._runs is None:
+            runs: List[Tuple[int, int, Addressable]] = []
+            start = 0
+            for address in range(1, len(self._space) + 1):
+                if address == len(self._space) or self._space[address] is not self._space[start]:
+                    runs.append((start, address, self._space[start]))
+                    start = address
+            self._runs = runs
+        return self._runs
+
+    def load_block(self, address: int, length: int) -> bytes:
+        """Read a block of bytes, asking each device for its whole slice at once.
+
+        Devices without a ``load_block`` method are read with ``load8`` per
+        address, so I/O read side effects are preserved. The result is a
+        snapshot copy; later stores are not reflected in it.
+        """
+
+        begin = address & 0xFFFF
+        end = begin + length
+        if end > len(self._space):
+            raise ValueError("block exceeds the memory space")
+        parts: list[bytes] = []
+        for run_start, run_end, device in self._device_runs():
+            lo = max(begin, run_start)
+            hi = min(end, run_end)
+            if lo >= hi:
+                continue
+            load_block = getattr(device, "load_block", None)
+            if load_block is not None:
+                parts.append(load_block(lo, hi - lo))
+            else:
+                parts.append(bytes(device.load8(addr) & 0xFF for addr in range(lo, hi)))
+        return b"".join(parts)
+
+    def store_block(self, address: int, data: Iterable[int]) -> None:
+        """Write a block of bytes, handing each device its whole slice at once.
+
+        Devices without a ``store_block`` method (I/O ports, unmapped holes)
+        still receive one ``store8`` per address.
+        """
+
+        payload = bytes(data)
+        begin = address & 0xFFFF
+        end = begin + len(payload)
+        if end > len(self._space):
+            raise ValueError("block exceeds the memory space")
+        for run_start, run_end, device in self._device_runs():
+            lo = max(begin, run_start)
+            hi = min(end, run_end)
+            if lo >= hi:
+                continue
+            chunk = payload[lo - begin : hi - begin]
+            store_block = getattr(device, "store_block", None)
+            if store_block is not None:
+                store_block(lo, chunk)
+            else:
+                for offset, value in enumerate(chunk):
+                    device.store8(lo + offset, value)
+
     def enable_debug(self, enabled: bool) -> None:
         self._debug = enabled
+        # Debug tracing needs every access to go through load8/store8.
+        self._rebuild_pages()
 
 
 __all__ = [
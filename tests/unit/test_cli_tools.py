@@ -23,3 +23,15 @@ def test_monitor_without_pygame(monkeypatch):
     monkeypatch.delitem(sys.modules, "pygame", raising=False)
     exit_code = joystick_monitor.monitor()
     assert exit_code == 1
+
+
+def test_main_without_arguments_matches_parsed_defaults(monkeypatch):
+    from jr100emu import app
+
+    calls = []
+    monkeypatch.setattr(app, "_pygame_loop", lambda *args, **kwargs: calls.append((args, kwargs)))
+    monkeypatch.setattr(sys, "argv", ["jr100emu"])
+    app.main()
+    app.main([])
+    assert len(calls) == 2
+    assert calls[0] == calls[1]
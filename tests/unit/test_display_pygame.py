@@ -19,3 +19,18 @@ def test_render_pygame_surface_scaling_two():
 
     top_left = surface.get_at((0, 0))
     assert tuple(top_left)[:3] == (0x12, 0x34, 0x56)
+
+
+def test_render_pygame_surface_into_matches_returned_surface():
+    display = JR100Display()
+    display.set_color_map_entry(display.FONT_NORMAL, 0, 0x123456)
+    display.set_video_ram([0x00] + [0x80] * (display.WIDTH_CHARS * display.HEIGHT_CHARS - 1))
+    size = (display.WIDTH_CHARS * display.PPC * 2, display.HEIGHT_CHARS * display.PPC * 2)
+    target = pygame.Surface(size, 0, 32)
+
+    display.render_pygame_surface_into(target, scaling=2)
+
+    expected = display.render_pygame_surface(scaling=2)
+    assert pygame.image.tobytes(target, "RGB") == pygame.image.tobytes(expected, "RGB")
+    with pytest.raises(ValueError):
+        display.render_pygame_surface_into(pygame.Surface((8, 8), 0, 32), scaling=2)
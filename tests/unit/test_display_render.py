@@ -31,3 +31,33 @@ def test_user_defined_font_updates_plane1() -> None:
     pixels = display.render_pixels()
     first_row = pixels[0][:display.PPC]
     assert all(color == display.color_map[1][128] for color in first_row)
+
+
+def test_frame_version_tracks_visible_changes() -> None:
+    display = JR100Display()
+    version = display.frame_version
+
+    display.write_video_ram(0, 0x00)
+    assert display.frame_version == version
+
+    display.write_video_ram(0, 0x41)
+    assert display.frame_version > version
+
+    version = display.frame_version
+    display.set_current_font(display.FONT_USER_DEFINED)
+    assert display.frame_version > version
+
+
+def test_dirty_rects_cover_changed_cells_per_row() -> None:
+    display = JR100Display()
+    full = display.get_dirty_rects(2)
+    assert full == [(0, 0, display.WIDTH_CHARS * 16, display.HEIGHT_CHARS * 16)]
+    assert display.get_dirty_rects(2) == []
+
+    display.write_video_ram(3, 0x41)
+    display.write_video_ram(5, 0x42)
+    display.write_video_ram(display.WIDTH_CHARS + 1, 0x43)
+    assert display.get_dirty_rects(2) == [(48, 0, 48, 16), (16, 16, 16, 16)]
+
+    display.set_current_font(display.FONT_USER_DEFINED)
+    assert display.get_dirty_rects(1) == [(0, 0, display.WIDTH_CHARS * 8, display.HEIGHT_CHARS * 8)]
@@ -188,3 +188,28 @@ def test_large_display_uses_available_height(tmp_path: Path) -> None:
         assert menu._visible_items > 12
     finally:
         pygame.quit()
+
+
+def test_render_reuses_overlay_until_selection_changes(tmp_path: Path) -> None:
+    pygame = _init_pygame()
+    try:
+        for idx in range(3):
+            (tmp_path / f"file{idx}.bas").write_text(f"10 REM {idx}\n")
+
+        menu = FileMenu(tmp_path)
+        menu.open()
+        font = _RecordingFont(pygame)
+        menu._font = font
+        menu._line_height = 20
+        screen = pygame.Surface((512, 384))
+
+        menu.render(screen)
+        rendered = len(font.texts)
+        menu.render(screen)
+        assert len(font.texts) == rendered
+
+        menu._move_selection(1)
+        menu.render(screen)
+        assert len(font.texts) > rendered
+    finally:
+        pygame.quit()
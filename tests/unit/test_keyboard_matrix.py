@@ -19,3 +19,35 @@ def test_keyboard_press_and_release_updates_matrix() -> None:
     keyboard.press(0, 4)
     keyboard.clear()
     assert all(value == 0x00 for value in keyboard.get_key_matrix())
+
+
+def test_host_key_events_follow_key_matrix_map() -> None:
+    from jr100emu.app import KEY_MATRIX_MAP, _handle_key_event
+
+    for key, (row, bit) in KEY_MATRIX_MAP.items():
+        keyboard = JR100Keyboard()
+        _handle_key_event(keyboard, key, True)
+        expected = [0x00] * 9
+        expected[row] = 1 << bit
+        assert keyboard.get_key_matrix() == expected
+        _handle_key_event(keyboard, key, False)
+        assert all(value == 0x00 for value in keyboard.get_key_matrix())
+
+    keyboard = JR100Keyboard()
+    for unmapped in (0x40000000 | 0x1FF, 0x3B1, -1):
+        _handle_key_event(keyboard, unmapped, True)
+    assert all(value == 0x00 for value in keyboard.get_key_matrix())
+
+
+def test_bound_key_handlers_press_and_release() -> None:
+    from jr100emu.app import _bind_key_handlers, _key_table_index
+
+    keyboard = JR100Keyboard()
+    press_handlers, release_handlers = _bind_key_handlers(keyboard)
+
+    index = _key_table_index(1073742049)  # pygame.K_LSHIFT
+    press_handlers[index]()
+    assert keyboard.get_key_matrix()[0] == 1 << 1
+    release_handlers[index]()
+    assert keyboard.get_key_matrix()[0] == 0x00
+    assert press_handlers[_key_table_index(ord("!"))] is None
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from jr100emu.cpu.cpu import MB8861
+import pytest
+
+from jr100emu.cpu.cpu import CPUFlags, CPUStatus, MB8861
 
 
 @dataclass
@@ -125,6 +127,23 @@ def test_nmi_sets_interrupt_mask_after_stacking_previous_ccr() -> None:
     assert cpu.memory.load8(0x01F9) & 0x10 == 0
 
 
+def test_status_event_pending_tracks_direct_field_writes() -> None:
+    status = CPUStatus()
+    assert status.event_pending is False
+
+    status.irq_requested = True
+    status.fetch_wai = True
+    assert status.event_pending is True
+    assert status.pending == CPUStatus.IRQ | CPUStatus.WAI
+
+    status.irq_requested = False
+    assert status.event_pending is True
+    status.fetch_wai = False
+    assert status.event_pending is False
+    assert status.pending == 0
+    assert CPUStatus(nmi_requested=True).event_pending is True
+
+
 def test_irq_sets_interrupt_mask_after_stacking_previous_ccr() -> None:
     cpu = make_cpu()
     cpu.registers.program_counter = 0x2345
@@ -469,6 +488,25 @@ def test_bne_skips_when_zero_set() -> None:
     assert cpu.registers.program_counter == 0x0002
 
 
+def test_blt_branches_backwards_when_n_differs_from_v() -> None:
+    cpu = make_cpu()
+    cpu.flags.carry_n = True
+    cpu.memory.store8(0x0010, MB8861.OP_BLT_REL)
+    cpu.memory.store8(0x0011, 0xFC)
+    cpu.registers.program_counter = 0x0010
+
+    cpu.execute(4)
+
+    assert cpu.registers.program_counter == 0x000E
+
+    cpu.flags.carry_v = True
+    cpu.registers.program_counter = 0x0010
+
+    cpu.execute(4)
+
+    assert cpu.registers.program_counter == 0x0012
+
+
 def test_bsr_pushes_return_address() -> None:
     cpu = make_cpu()
     cpu.registers.stack_pointer = 0x0200
@@ -666,3 +704,39 @@ def test_extension_opcode_cycle_table_matches_hardware_spec() -> None:
     assert table[MB8861.OP_OIM_IND][1] == 8
     assert table[MB8861.OP_XIM_IND][1] == 8
     assert table[MB8861.OP_TMM_IND][1] == 7
+
+
+def test_undefined_opcode_executes_as_one_clock_nop() -> None:
+    cpu = make_cpu()
+    cpu.registers.program_counter = 0x0100
+    cpu.memory.store8(0x0100, 0x00)
+    cpu.registers.acc_a = 0x12
+
+    overshoot = cpu.execute(1)
+
+    assert overshoot == 0
+    assert cpu.computer.clock_count == 1
+    assert cpu.registers.program_counter == 0x0101
+    assert cpu.registers.acc_a == 0x12
+
+
+def test_flag_properties_mirror_packed_ccr() -> None:
+    flags = CPUFlags(carry_h=True, carry_z=True)
+    assert flags.ccr == 0xC0 | 0x20 | 0x04
+    assert flags.carry_h is True
+    assert flags.carry_n is False
+
+    flags.carry_c = True
+    flags.carry_h = False
+    assert flags.ccr == 0xC0 | 0x04 | 0x01
+    assert flags == CPUFlags(carry_z=True, carry_c=True)
+
+
+def test_memory_interface_is_checked_at_construction() -> None:
+    class ReadOnlyMemory:
+        def load8(self, address: int) -> int:
+            return 0
+
+    computer = DummyComputer(DummyHardware(ReadOnlyMemory()))  # type: ignore[arg-type]
+    with pytest.raises(AttributeError, match="load16"):
+        MB8861(computer)
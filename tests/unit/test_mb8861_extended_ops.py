@@ -275,3 +275,19 @@ def test_save_load_state_round_trip() -> None:
     assert cpu.status.halt_requested is True
     assert cpu.status.halt_processed is True
     assert cpu.status.fetch_wai is True
+
+
+@pytest.mark.parametrize("clocks", [5, 12, 100, 2000])
+def test_dex_bne_delay_loop_matches_step_by_step_timing(clocks: int) -> None:
+    cpu, memory = _make_cpu()
+    _write_bytes(memory, PROGRAM_START, [MB8861.OP_DEX_IMP, MB8861.OP_BNE_REL, 0xFD, MB8861.OP_NOP_IMP])
+    cpu.registers.index = 0x0100
+
+    overshoot = cpu.execute(clocks)
+
+    # DEX and BNE take 4 clocks each; execution stops once the clock reaches the target.
+    instructions = (clocks + 3) // 4
+    assert cpu.registers.index == 0x0100 - (instructions + 1) // 2
+    assert overshoot == instructions * 4 - clocks
+    assert cpu.registers.program_counter == PROGRAM_START + (1 if instructions % 2 else 0)
+    assert cpu.flags.carry_z is False
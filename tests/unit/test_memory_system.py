@@ -48,3 +48,52 @@ def test_jr100_computer_installs_expected_blocks() -> None:
     assert memory.get_memory(MainRam) is not None
     assert memory.get_memory(UserDefinedCharacterRam) is not None
     assert memory.get_memory(VideoRam) is not None
+
+
+def test_store_block_spans_devices_and_notifies_display() -> None:
+    computer = JR100Computer()
+    memory = computer.memory
+    display = CaptureDisplay()
+    video_ram = memory.get_memory(VideoRam)
+    video_ram.set_display(display)
+
+    # Straddle the end of user defined RAM and the start of VRAM.
+    memory.store_block(0xC0FE, bytes([0x11, 0x22, 0x33, 0x44]))
+
+    assert [memory.load8(addr) for addr in range(0xC0FE, 0xC102)] == [0x11, 0x22, 0x33, 0x44]
+    assert (-1, 0, 0x33) in display.updated
+    assert (-1, 1, 0x44) in display.updated
+
+
+def test_full_load_block_matches_per_address_reads() -> None:
+    computer = JR100Computer()
+    memory = computer.memory
+    for address in (0x0010, 0x3FFF, 0xC000, 0xC100, 0xE000):
+        memory.store8(address, 0x5A)
+
+    dump = memory.load_block(0, 0x10000)
+
+    assert len(dump) == 0x10000
+    assert dump == bytes(memory.load8(address) for address in range(0x10000))
+
+
+def test_page_tables_expose_only_side_effect_free_pages() -> None:
+    computer = JR100Computer()
+    memory = computer.memory
+    read_pages = memory.read_pages
+    write_pages = memory.write_pages
+
+    assert write_pages[0x00] is not None
+    write_pages[0x00][0x12] = 0x77
+    assert memory.load8(0x0012) == 0x77
+    # VRAM is readable directly but stores must notify the display.
+    assert read_pages[0xC1] is not None
+    assert write_pages[0xC1] is None
+    # The BASIC ROM ignores writes and I/O pages have no backing buffer.
+    assert read_pages[0xE0] is not None
+    assert write_pages[0xE0] is None
+    assert read_pages[0xC8] is None
+
+    memory.enable_debug(True)
+    assert memory.read_pages is read_pages
+    assert all(page is None for page in read_pages)
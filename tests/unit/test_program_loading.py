@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import base64
 import io
+import pickle
 import struct
+import zlib
 from pathlib import Path
 
+import pytest
+
 from jr100emu.jr100.computer import JR100Computer
 from jr100emu.emulator.file import ProgramLoadError
 from jr100emu.app import (
@@ -18,7 +23,11 @@ from jr100emu.app import (
     _write_history_snapshot,
     _delete_snapshot_files,
     Snapshot,
+    _dirty_pages,
+    _dirty_ranges,
     _make_preview_lines,
+    _snapshot_diff_lines,
+    _snapshot_from_dict,
 )
 from jr100emu.basic_loader import BasicLoader
 from jr100emu.frontend import snapshot_db
@@ -293,6 +302,7 @@ def test_snapshot_file_roundtrip(tmp_path, monkeypatch) -> None:
     _delete_snapshot_files(slot)
     snapshot_db.SnapshotDatabase().clear_slot(slot)
     assert _read_snapshot_from_file(slot) is None
+    assert not history_path.exists()
     assert snapshot_db.SnapshotDatabase().get(slot) is None
 
 
@@ -374,3 +384,117 @@ def test_make_preview_lines_diff() -> None:
     lines = _make_preview_lines(entry, target_snapshot, current_snapshot)
     assert any("PC" in line and "->" in line for line in lines)
     assert any("Memory bytes differ" in line for line in lines)
+
+
+def test_snapshot_diff_lines_counts_memory_changes_across_pages() -> None:
+    def _snapshot(memory: bytes) -> Snapshot:
+        return Snapshot(
+            memory=memory,
+            cpu_registers={},
+            cpu_flags={},
+            cpu_status={},
+            via_state={},
+            clock_count=0,
+        )
+
+    current = bytes(0x10000)
+    target = bytearray(current)
+    for addr in (0x0005, 0x00FF, 0x0100, 0x8000, 0xC000, 0xFFFF):
+        target[addr] = 0x5A
+    lines = _snapshot_diff_lines(_snapshot(current), _snapshot(bytes(target)))
+    assert lines == [
+        "  Memory bytes differ: 6",
+        "    0005: 00->5A",
+        "    00FF: 00->5A",
+        "    0100: 00->5A",
+        "    8000: 00->5A",
+    ]
+    assert _snapshot_diff_lines(_snapshot(current), _snapshot(current)) == ["  (no differences)"]
+
+
+def test_snapshot_diff_lines_lists_changed_flags_in_order() -> None:
+    def _snapshot(flags: dict) -> Snapshot:
+        return Snapshot(
+            memory=bytes(16),
+            cpu_registers={},
+            cpu_flags=flags,
+            cpu_status={},
+            via_state={},
+            clock_count=0,
+        )
+
+    current = _snapshot({"carry_h": True, "carry_z": False, "carry_c": True})
+    target = _snapshot({"carry_h": False, "carry_z": True, "carry_c": True})
+    assert _snapshot_diff_lines(current, target) == [
+        "  Flag CARRY_H: 1 -> 0",
+        "  Flag CARRY_Z: 0 -> 1",
+    ]
+
+
+def test_dirty_pages_reports_changed_pages_only() -> None:
+    current = bytes(0x10000)
+    target = bytearray(current)
+    target[0x0246] = 0x42
+    target[0xC100] = 0x01
+    assert _dirty_pages(current, bytes(target)) == [0x0200, 0xC100]
+    assert _dirty_pages(current, current) == []
+
+
+def test_dirty_ranges_merge_adjacent_pages() -> None:
+    current = bytes(0x10000)
+    target = bytearray(current)
+    target[0x0200] = 0x01
+    target[0x03FF] = 0x02
+    target[0xC100] = 0x03
+    assert _dirty_ranges(current, bytes(target)) == [(0x0200, 0x0400), (0xC100, 0xC200)]
+
+
+def test_snapshot_payload_round_trip_keeps_memory_bytes() -> None:
+    memory = bytes(range(256)) * 256
+    raw = snapshot_db.encode_snapshot_payload({"slot": "slot0", "memory": memory})
+    data = snapshot_db.decode_snapshot_payload(raw)
+    assert data["memory"] == memory
+    assert data["version"] == snapshot_db.SNAPSHOT_FORMAT_VERSION
+
+    newer = zlib.compress(
+        pickle.dumps({"version": snapshot_db.SNAPSHOT_FORMAT_VERSION + 1}, protocol=5)
+    )
+    with pytest.raises(ValueError):
+        snapshot_db.decode_snapshot_payload(newer)
+
+
+def test_snapshot_from_dict_accepts_binary_and_legacy_memory() -> None:
+    memory = bytes(range(256)) * 256
+    assert _snapshot_from_dict({"memory": memory}).memory is memory
+    assert _snapshot_from_dict({"memory": list(memory)}).memory == memory
+    encoded = base64.b64encode(memory).decode("ascii")
+    assert _snapshot_from_dict({"memory": encoded}).memory == memory
+
+
+def test_snapshot_normalizes_memory_to_bytes() -> None:
+    for memory in ([1, 2, 3], bytearray(b"\x01\x02\x03"), memoryview(b"\x01\x02\x03")):
+        snapshot = Snapshot(
+            memory=memory,
+            cpu_registers={},
+            cpu_flags={},
+            cpu_status={},
+            via_state={},
+            clock_count=0,
+        )
+        assert type(snapshot.memory) is bytes
+        assert snapshot.memory == b"\x01\x02\x03"
+
+
+def test_snapshot_database_instances_share_metadata(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(snapshot_db, "SNAPSHOT_DIR", tmp_path)
+    monkeypatch.setattr(snapshot_db, "SNAPSHOT_HISTORY_DIR", tmp_path / "history")
+
+    first = snapshot_db.SnapshotDatabase()
+    first.set_slot(SNAPSHOT_SLOTS[2], comment="mirrored")
+    # Later instances read the in-memory mirror instead of the metadata files.
+    (tmp_path / f"{SNAPSHOT_SLOTS[2]}.meta.json").unlink()
+    meta = snapshot_db.SnapshotDatabase().get(SNAPSHOT_SLOTS[2])
+    assert meta is not None and meta.comment == "mirrored"
+
+    snapshot_db.SnapshotDatabase().clear_slot(SNAPSHOT_SLOTS[2])
+    assert first.get(SNAPSHOT_SLOTS[2]) is None
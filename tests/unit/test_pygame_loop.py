@@ -0,0 +1,68 @@
+"""Headless tests for the pygame frame loop in jr100emu.app."""
+
+from __future__ import annotations
+
+import os
+import struct
+from pathlib import Path
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from jr100emu import app
+from jr100emu.jr100.display import JR100Display
+
+
+def _write_vram_loop_rom(path: Path) -> None:
+    # INC $C100 ; BRA *-3 at E000, so every slice changes the screen.
+    rom = bytearray(0x2000)
+    rom[0:5] = bytes([0x7C, 0xC1, 0x00, 0x20, 0xFB])
+    rom[-2:] = b"\xE0\x00"
+    header = b"PROG" + struct.pack("<IIIII", 1, 0, 0, len(rom), 0)
+    path.write_bytes(header + bytes(rom))
+
+
+def test_frame_presented_after_skip_matches_current_display_state(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    monkeypatch.chdir(tmp_path)
+    rom_path = tmp_path / "rom.prg"
+    _write_vram_loop_rom(rom_path)
+
+    rendered: list[int] = []
+    displays: list[JR100Display] = []
+    presented: list[tuple[int, int]] = []
+    original_render = JR100Display.render_pygame_surface_into
+
+    def recording_render(self, target, scaling: int = 1) -> None:
+        displays.append(self)
+        rendered.append(self.frame_version)
+        original_render(self, target, scaling)
+
+    def recording_present(*args) -> None:
+        presented.append((rendered[-1], displays[-1].frame_version))
+
+    iterations = [0]
+    original_get = pygame.event.get
+
+    def scripted_events(*args, **kwargs):
+        events = list(original_get(*args, **kwargs))
+        iterations[0] += 1
+        if iterations[0] >= 40:
+            events.append(pygame.event.Event(pygame.QUIT))
+        return events
+
+    monkeypatch.setattr(JR100Display, "render_pygame_surface_into", recording_render)
+    monkeypatch.setattr(pygame.display, "flip", recording_present)
+    monkeypatch.setattr(pygame.display, "update", recording_present)
+    monkeypatch.setattr(pygame.event, "get", scripted_events)
+
+    # An unreachable frame rate keeps the loop behind real time, so it skips
+    # MAX_FRAME_SKIP frames between presents.
+    app._pygame_loop(1, 100_000, rom_path=os.fspath(rom_path), enable_audio=False)
+
+    assert presented
+    assert len(presented) < iterations[0]
+    for rendered_version, current_version in presented:
+        assert rendered_version == current_version
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import io
 import re
+import threading
 
-from jr100emu import debug_runner
+from jr100emu import app, debug_runner
 from jr100emu.cpu.cpu import CPUFlags
 from jr100emu.jr100.computer import JR100Computer
 
@@ -98,3 +99,27 @@ def test_argument_parser_accepts_trace_option(tmp_path) -> None:
         ]
     )
     assert args.trace == str(tmp_path / "trace.txt")
+
+
+class _BrokenPipeStdout(io.StringIO):
+    def write(self, text: str) -> int:
+        raise BrokenPipeError("trace reader went away")
+
+
+def test_trace_flush_returns_when_stdout_write_fails(monkeypatch) -> None:
+    monkeypatch.setattr(app, "_trace_queue", None)
+    monkeypatch.setattr(app, "_trace_thread", None)
+    monkeypatch.setattr(app.sys, "stdout", _BrokenPipeStdout())
+
+    app._emit_trace("first")
+    app._emit_trace("second")
+    flusher = threading.Thread(target=app._flush_trace_output, daemon=True)
+    flusher.start()
+    flusher.join(timeout=5)
+
+    assert not flusher.is_alive()
+    app._trace_thread.join(timeout=5)
+    assert not app._trace_thread.is_alive()
+    # Once the writer has stopped, further lines are dropped and flushing stays bounded.
+    app._emit_trace("third")
+    app._flush_trace_output()